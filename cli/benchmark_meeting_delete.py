@@ -0,0 +1,160 @@
+"""
+Compares the CascadeDeletePlanner with the MeetingDeletePlanner on a generated
+meeting held in an in-memory datastore. For each planner the time, the number
+of requests and the number of fetched field values are printed.
+
+Usage: PYTHONPATH=. python cli/benchmark_meeting_delete.py [topics] [speakers]
+"""
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Type
+
+import openslides_backend.models.models  # noqa: F401
+from openslides_backend.action.cascade_delete import (
+    CascadeDeletePlanner,
+    MeetingDeletePlanner,
+)
+from openslides_backend.models.base import model_registry
+from openslides_backend.services.datastore.interface import GetManyRequest
+from openslides_backend.shared.filters import Filter
+from openslides_backend.shared.patterns import Collection
+
+Instances = Dict[Collection, Dict[int, Dict[str, Any]]]
+
+
+class InMemoryDatastore:
+    """
+    Implements the datastore requests used by the planners.
+    """
+
+    def __init__(self, instances: Instances) -> None:
+        self.instances = instances
+        self.requests = 0
+        self.values = 0
+
+    def project(self, instance: Dict[str, Any], mapped_fields: Iterable[str]) -> Dict:
+        result = {field: instance.get(field) for field in mapped_fields}
+        self.values += len(result)
+        return result
+
+    def get_many(
+        self, get_many_requests: List[GetManyRequest], lock_result: bool = False
+    ) -> Instances:
+        self.requests += 1
+        result: Instances = {}
+        for request in get_many_requests:
+            collection = self.instances[request.collection]
+            result[request.collection] = {
+                id: self.project(collection[id], request.mapped_fields or [])
+                for id in request.ids
+                if id in collection
+            }
+        return result
+
+    def filter(
+        self,
+        collection: Collection,
+        filter: Filter,
+        mapped_fields: List[str],
+        lock_result: bool = False,
+    ) -> Dict[int, Dict[str, Any]]:
+        self.requests += 1
+        return {
+            id: self.project(instance, mapped_fields)
+            for id, instance in self.instances[collection].items()
+            if self.match(instance, filter.to_dict())
+        }
+
+    def match(self, instance: Dict[str, Any], filter: Dict[str, Any]) -> bool:
+        if "or_filter" in filter:
+            return any(self.match(instance, f) for f in filter["or_filter"])
+        return instance.get(filter["field"]) == filter["value"]
+
+
+def generate_meeting(topics: int, speakers: int) -> Instances:
+    """
+    Generates a meeting with the given number of topics, each with an agenda
+    item and a list of speakers with the given number of speakers.
+    """
+    instances: Instances = defaultdict(dict)
+    meeting: Dict[str, Any] = defaultdict(list)
+    meeting.update(id=1, committee_id=1)
+    instances[Collection("committee")][1] = {"id": 1, "meeting_ids": [1]}
+    users: Dict[int, Dict[str, Any]] = {
+        id: {"id": id, "speaker_$_ids": ["1"], "speaker_1_ids": []}
+        for id in range(1, 101)
+    }
+    instances[Collection("user")] = users
+    speaker_id = 0
+    for id in range(1, topics + 1):
+        instances[Collection("topic")][id] = {
+            "id": id,
+            "meeting_id": 1,
+            "agenda_item_id": id,
+            "list_of_speakers_id": id,
+        }
+        instances[Collection("agenda_item")][id] = {
+            "id": id,
+            "meeting_id": 1,
+            "content_object_id": f"topic/{id}",
+        }
+        speaker_ids = list(range(speaker_id + 1, speaker_id + speakers + 1))
+        speaker_id += speakers
+        instances[Collection("list_of_speakers")][id] = {
+            "id": id,
+            "meeting_id": 1,
+            "content_object_id": f"topic/{id}",
+            "speaker_ids": speaker_ids,
+        }
+        for sid in speaker_ids:
+            user = users[sid % 100 + 1]
+            user["speaker_1_ids"].append(sid)
+            instances[Collection("speaker")][sid] = {
+                "id": sid,
+                "meeting_id": 1,
+                "list_of_speakers_id": id,
+                "user_id": user["id"],
+            }
+        meeting["topic_ids"].append(id)
+        meeting["agenda_item_ids"].append(id)
+        meeting["list_of_speakers_ids"].append(id)
+        meeting["speaker_ids"].extend(speaker_ids)
+    instances[Collection("meeting")][1] = dict(meeting)
+    return instances
+
+
+def measure(
+    planner_class: Type[CascadeDeletePlanner], instances: Instances
+) -> Dict[str, Any]:
+    database = InMemoryDatastore(instances)
+    planner = planner_class(database)  # type: ignore
+    start = time.perf_counter()
+    plan = planner.plan(model_registry[Collection("meeting")](), [1])
+    return {
+        "time": time.perf_counter() - start,
+        "requests": database.requests,
+        "values": database.values,
+        "deleted": len(plan.deleted),
+    }
+
+
+def main() -> None:
+    topics = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    speakers = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    instances = generate_meeting(topics, speakers)
+    print(f"Meeting with {topics} topics and {topics * speakers} speakers")
+    for name, planner_class in (
+        ("cascade", CascadeDeletePlanner),
+        ("meeting", MeetingDeletePlanner),
+    ):
+        result = measure(planner_class, instances)
+        print(
+            f"{name:>8}: {result['time'] * 1000:10.2f} ms, "
+            f"{result['requests']:4} requests, {result['values']:8} values, "
+            f"{result['deleted']} deleted"
+        )
+
+
+if __name__ == "__main__":
+    main()
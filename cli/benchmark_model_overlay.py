@@ -0,0 +1,83 @@
+"""
+Compares the allocations of the former copying approach for
+additional_relation_models with the ModelOverlay on a deep cascade of nested
+actions.
+
+Usage: PYTHONPATH=. python cli/benchmark_model_overlay.py [depth] [breadth]
+"""
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+from openslides_backend.shared.typing import ModelMap, ModelOverlay
+
+COLLECTION = Collection("topic")
+
+
+def instance(id: int) -> Dict[str, Any]:
+    return {"id": id, "title": f"topic {id}", "text": "x" * 100, "meeting_id": 1}
+
+
+def copying(depth: int, breadth: int) -> int:
+    """
+    Every nested action gets a merged copy of the map of all outer models.
+    """
+    lookups = 0
+
+    def nest(models: ModelMap, level: int, offset: int) -> None:
+        nonlocal lookups
+        if level == depth:
+            return
+        for i in range(breadth):
+            id = offset * breadth + i
+            child_models = {**models, FullQualifiedId(COLLECTION, id): instance(id)}
+            lookups += FullQualifiedId(COLLECTION, offset) in child_models
+            nest(child_models, level + 1, id + 1)
+
+    nest({}, 0, 0)
+    return lookups
+
+
+def overlay(depth: int, breadth: int) -> int:
+    """
+    Every nested action gets a child layer only containing its own models.
+    """
+    lookups = 0
+
+    def nest(models: ModelOverlay, level: int, offset: int) -> None:
+        nonlocal lookups
+        if level == depth:
+            return
+        for i in range(breadth):
+            id = offset * breadth + i
+            child_models = models.child({FullQualifiedId(COLLECTION, id): instance(id)})
+            lookups += FullQualifiedId(COLLECTION, offset) in child_models
+            nest(child_models, level + 1, id + 1)
+
+    nest(ModelOverlay(), 0, 0)
+    return lookups
+
+
+def measure(func: Callable[[int, int], int], depth: int, breadth: int) -> Tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(depth, breadth)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    breadth = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"Nested cascade with depth {depth} and breadth {breadth}")
+    for name, func in (("copying", copying), ("overlay", overlay)):
+        duration, peak = measure(func, depth, breadth)
+        print(f"{name:>8}: {duration * 1000:10.2f} ms, peak {peak / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
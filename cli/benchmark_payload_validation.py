@@ -0,0 +1,71 @@
+"""
+Measures time and peak memory of the payload validation of large user.create
+and topic.create payloads, once with the former deep copy of the payload and
+once with the copy-free validation.
+
+Usage: PYTHONPATH=. python cli/benchmark_payload_validation.py [size]
+"""
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Tuple
+
+from openslides_backend.action.action import ActionHandler  # noqa
+from openslides_backend.action.actions_map import actions_map
+
+HTML = "<p>" + "Lorem <strong>ipsum</strong> dolor sit amet. " * 40 + "</p>"
+
+
+def user_payload(size: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "username": f"user_{i}",
+            "first_name": f"first_{i}",
+            "last_name": f"last_{i}",
+            "about_me": HTML,
+            "comment": HTML,
+            "email": f"user_{i}@example.com",
+            "is_present_in_meeting_ids": [1, 2, 3],
+        }
+        for i in range(size)
+    ]
+
+
+def topic_payload(size: int) -> List[Dict[str, Any]]:
+    return [
+        {"meeting_id": 1, "title": f"topic {i}", "text": HTML, "attachment_ids": [1]}
+        for i in range(size)
+    ]
+
+
+def measure(func: Callable[[], Any]) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for action_name, payload in (
+        ("user.create", user_payload(size)),
+        ("topic.create", topic_payload(size)),
+    ):
+        validator = actions_map[action_name].schema_validator
+        print(f"{action_name} with {size} elements")
+        for name, func in (
+            ("deepcopy", lambda: validator(deepcopy(payload))),
+            ("in place", lambda: validator(payload)),
+        ):
+            duration, peak = measure(func)
+            print(
+                f"{name:>10}: {duration * 1000:10.2f} ms, peak {peak / 1024:10.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the import time of the action and presenter components, the latency
+of the first request (action lookup and validation) and the maximum RSS in a
+fresh interpreter. This is done three times: with eager import of all actions
+and compilation of all schemas (the behaviour before lazy loading), with lazy
+loading and with lazy loading using a schema cache built by
+cli/build_schema_cache.py.
+
+Usage: PYTHONPATH=. python cli/benchmark_startup.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+SCRIPT = """
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+import openslides_backend.action.action
+import openslides_backend.presenter
+import openslides_backend.presenter.presenter
+from openslides_backend.action.actions_map import actions_map
+from openslides_backend.shared.schema_validator import schema_validators
+if sys.argv[1] == "eager":
+    import fastjsonschema
+    actions_map.load_all()
+    for validator in schema_validators:
+        validator.validator = fastjsonschema.compile(validator.get_definition())
+imported = time.perf_counter()
+openslides_backend.action.action.payload_schema(
+    [{"action": "topic.create", "data": [{"meeting_id": 1, "title": "test"}]}]
+)
+actions_map["topic.create"].schema_validator([{"meeting_id": 1, "title": "test"}])
+first_request = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(f"{(imported - start) * 1000:.1f} {(first_request - imported) * 1000:.1f} {rss:.1f}")
+"""
+
+
+def run(mode: str, env: dict) -> None:
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT, mode], env=env, universal_newlines=True
+    )
+    import_time, first_request_time, rss = output.split()
+    print(
+        f"{mode:>12}: import {import_time:>8} ms, "
+        f"first request {first_request_time:>8} ms, max RSS {rss:>8} MiB"
+    )
+
+
+def main() -> None:
+    env = dict(os.environ)
+    env.pop("OPENSLIDES_BACKEND_SCHEMA_CACHE", None)
+    run("eager", env)
+    run("lazy", env)
+    with tempfile.TemporaryDirectory() as directory:
+        subprocess.check_call(
+            [
+                sys.executable,
+                os.path.join(os.path.dirname(__file__), "build_schema_cache.py"),
+                directory,
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        env["OPENSLIDES_BACKEND_SCHEMA_CACHE"] = directory
+        run("lazy+cache", env)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Writes the generated validator code of all JSON schemas of actions and
+presenters into the given cache directory. Point the environment variable
+OPENSLIDES_BACKEND_SCHEMA_CACHE to this directory to let the workers load the
+precompiled validators instead of generating them.
+
+Usage: PYTHONPATH=. python cli/build_schema_cache.py <directory>
+"""
+import os
+import sys
+
+import openslides_backend.action.action  # noqa
+import openslides_backend.presenter  # noqa
+import openslides_backend.presenter.presenter  # noqa
+from openslides_backend.action.actions_map import actions_map
+from openslides_backend.shared.schema_validator import (
+    schema_validators,
+    write_cached_validator,
+)
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    directory = sys.argv[1]
+    os.makedirs(directory, exist_ok=True)
+    # The actions are imported lazily, so their schemas have to be created
+    # first.
+    actions_map.load_all()
+    paths = set()
+    for validator in schema_validators:
+        paths.add(write_cached_validator(directory, validator.get_definition()))
+    print(f"Wrote {len(paths)} validators to {directory}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import sys
+from typing import Dict
+
+DESTINATION = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "openslides_backend",
+        "action",
+        "actions_manifest.py",
+    )
+)
+
+FILE_TEMPLATE = """# Code generated. DO NOT EDIT.
+
+from typing import Dict
+
+ACTIONS_MANIFEST: Dict[str, str] = {
+"""
+
+
+def main() -> None:
+    """
+    Main entry point for this script to generate the actions_manifest.py. It
+    imports all action modules and writes the module of every registered action
+    into the manifest, so that the actions can be imported lazily.
+
+    Use the argument "check" to assert that the manifest is up-to-date.
+    """
+    from openslides_backend.action.actions_map import actions_map
+
+    actions_map.load_all()
+    manifest: Dict[str, str] = dict(sorted(actions_map.modules.items()))
+
+    if len(sys.argv) > 1 and sys.argv[1] == "check":
+        from openslides_backend.action.actions_manifest import ACTIONS_MANIFEST
+
+        assert manifest == ACTIONS_MANIFEST
+        sys.exit(0)
+
+    with open(DESTINATION, "w") as dest:
+        dest.write(FILE_TEMPLATE)
+        for name, module in manifest.items():
+            dest.write(f'    "{name}": "{module}",\n')
+        dest.write("}\n")
+
+    print(f"Actions manifest {DESTINATION} successfully created.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import hashlib
 import os
+import re
 import string
 import sys
 from textwrap import dedent, indent
@@ -9,7 +10,14 @@ import requests
 import simplejson as json
 import yaml
 
-from openslides_backend.models.fields import OnDelete
+from openslides_backend.models.fields import (
+    BaseGenericRelationField,
+    BaseTemplateField,
+    Field,
+    GenericRelationField,
+    GenericRelationListField,
+    OnDelete,
+)
 from openslides_backend.shared.patterns import KEYSEPARATOR
 
 SOURCE = "https://raw.githubusercontent.com/OpenSlides/OpenSlides/openslides4-dev/docs/models.yml"
@@ -24,6 +32,8 @@ DESTINATION = os.path.abspath(
     )
 )
 
+HELPERS_DESTINATION = os.path.join(os.path.dirname(DESTINATION), "helpers.py")
+
 COMMON_FIELD_CLASSES = {
     "string": "CharField",
     "number": "IntegerField",
@@ -55,6 +65,25 @@ FILE_TEMPLATE = dedent(
     """
 )
 
+HELPERS_FILE_TEMPLATE = dedent(
+    """\
+    # Code generated. DO NOT EDIT.
+
+    from typing import Any, Callable, Dict
+
+    from openslides_backend.models import fields
+    from openslides_backend.shared.patterns import string_to_fqid
+    from openslides_backend.shared.typing import Schema
+
+    InstanceFunction = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+    def keep_instance(instance: Dict[str, Any]) -> Dict[str, Any]:
+        return instance
+
+    """
+)
+
 MODELS: Dict[str, Dict[str, Any]] = {}
 
 
@@ -91,6 +120,11 @@ def main() -> None:
 
     global MODELS
 
+    if len(sys.argv) > 1 and sys.argv[1] == "helpers":
+        # Only regenerate the helpers from the current models.py.
+        write_helpers()
+        sys.exit(0)
+
     # Retrieve models.yml from local file or GitHub
     if os.path.isfile(SOURCE):
         with open(SOURCE, "rb") as x:
@@ -105,6 +139,7 @@ def main() -> None:
         from openslides_backend.models.models import MODELS_YML_CHECKSUM
 
         assert checksum == MODELS_YML_CHECKSUM
+        check_helpers()
         sys.exit(0)
 
     # Fix broken keys
@@ -122,6 +157,157 @@ def main() -> None:
 
     print(f"Models file {DESTINATION} successfully created.")
 
+    write_helpers()
+
+
+def write_helpers() -> None:
+    """
+    Writes the helpers.py generated from the (freshly generated) models.py.
+    """
+    with open(HELPERS_DESTINATION, "w") as dest:
+        dest.write(get_helpers_code())
+
+    print(f"Helpers file {HELPERS_DESTINATION} successfully created.")
+
+
+def check_helpers() -> None:
+    """
+    Asserts that the helpers.py is equal to the helpers generated from the
+    current models.py. The generated code is formatted with black first, like
+    in the Makefile.
+    """
+    import black
+
+    with open(HELPERS_DESTINATION) as helpers_file:
+        helpers_code = helpers_file.read()
+    assert black.format_str(get_helpers_code(), mode=black.FileMode()) == helpers_code
+
+
+def get_helpers_code() -> str:
+    """
+    Generates the code of the helpers.py from the current models.py. It contains
+    per model specialized functions to set defaults and to validate the fields
+    which need validation and static JSON schema fragments for all fields.
+    """
+    from openslides_backend.models import models
+    from openslides_backend.models.base import model_registry
+
+    code = HELPERS_FILE_TEMPLATE
+    code += "\nMODELS_YML_CHECKSUM = " + json.dumps(models.MODELS_YML_CHECKSUM) + "\n"
+    helpers = [ModelHelpers(model_class()) for model_class in model_registry.values()]
+    for field_class in sorted(
+        set(
+            field_class
+            for model_helpers in helpers
+            for field_class in model_helpers.get_validating_field_classes()
+        )
+    ):
+        code += f"\n{to_snake_case(field_class)} = fields.{field_class}()\n"
+    for model_helpers in helpers:
+        code += model_helpers.get_code()
+    for name, attribute in (
+        ("SET_DEFAULTS", "set_defaults_name"),
+        ("VALIDATE_FIELDS", "validate_fields_name"),
+        ("PROPERTIES", "properties_name"),
+    ):
+        annotation = "Dict[str, Schema]" if name == "PROPERTIES" else "InstanceFunction"
+        code += f"\n\n{name}: Dict[str, {annotation}] = {{\n"
+        for model_helpers in helpers:
+            code += f'    "{model_helpers.collection}": {getattr(model_helpers, attribute)},\n'
+        code += "}\n"
+    return code
+
+
+def to_snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z][a-z])", "_", name).lower()
+
+
+class ModelHelpers:
+    """
+    Generates the helper code for one model class of the models.py.
+    """
+
+    def __init__(self, model: Any) -> None:
+        self.model = model
+        self.collection = str(model.collection)
+        self.fields = list(model.get_fields())
+        self.defaults = [
+            (field_name, field)
+            for field_name, field in self.fields
+            if field.default is not None
+        ]
+        self.validating_fields = [
+            (field_name, field)
+            for field_name, field in self.fields
+            if type(field).validate is not Field.validate
+        ]
+        self.set_defaults_name = (
+            f"set_defaults_{self.collection}" if self.defaults else "keep_instance"
+        )
+        self.validate_fields_name = (
+            f"validate_fields_{self.collection}"
+            if self.validating_fields
+            else "keep_instance"
+        )
+        self.properties_name = f"{self.collection.upper()}_PROPERTIES"
+
+    def get_validating_field_classes(self) -> List[str]:
+        return [
+            self.get_validating_field_class(field)
+            for _, field in self.validating_fields
+            if not isinstance(field, BaseGenericRelationField)
+        ]
+
+    def get_validating_field_class(self, field: Any) -> str:
+        """
+        Returns the name of the field class used for validation. Template fields
+        are replaced by their non-template field class.
+        """
+        for field_class in type(field).__mro__:
+            if not issubclass(field_class, BaseTemplateField):
+                return field_class.__name__
+        raise RuntimeError  # pragma: no cover
+
+    def get_code(self) -> str:
+        code = ""
+        if self.defaults:
+            code += (
+                f"\n\ndef {self.set_defaults_name}(instance: Dict[str, Any]) "
+                "-> Dict[str, Any]:\n"
+            )
+            for field_name, field in self.defaults:
+                code += f'    if "{field_name}" not in instance:\n'
+                code += f'        instance["{field_name}"] = {field.default!r}\n'
+            code += "    return instance\n"
+        if self.validating_fields:
+            code += (
+                f"\n\ndef {self.validate_fields_name}(instance: Dict[str, Any]) "
+                "-> Dict[str, Any]:\n"
+            )
+            for field_name, field in self.validating_fields:
+                value = f'instance["{field_name}"]'
+                if isinstance(field, GenericRelationListField):
+                    validated = f"[string_to_fqid(fqid) for fqid in {value}]"
+                elif isinstance(field, GenericRelationField):
+                    validated = f"string_to_fqid({value})"
+                else:
+                    field_instance = to_snake_case(
+                        self.get_validating_field_class(field)
+                    )
+                    validated = f"{field_instance}.validate({value})"
+                code += f'    if "{field_name}" in instance:\n'
+                code += f"        {value} = {validated}\n"
+            code += "    return instance\n"
+        code += f"\n\n{self.properties_name}: Dict[str, Schema] = {{\n"
+        for field_name, field in self.fields:
+            try:
+                schema = field.get_schema()
+            except NotImplementedError:
+                continue
+            code += f'    "{field_name}": {schema!r},\n'
+        code += "}\n"
+        return code
+
 
 def get_model_field(collection: str, field_name: str) -> Union[str, Dict]:
     """
@@ -5,12 +5,14 @@ import fastjsonschema
 from ..shared.exceptions import ActionException, EventStoreException
 from ..shared.handlers import Base as HandlerBase
 from ..shared.interfaces import WriteRequestElement
+from ..shared.logging import PayloadSummary
 from ..shared.schema import schema_version
+from ..shared.schema_validator import LazySchemaValidator
 from .action_interface import ActionResult, Payload
 from .actions_map import actions_map
-from .base import merge_write_request_elements
+from .base import WriteRequestBuilder
 
-payload_schema = fastjsonschema.compile(
+payload_schema = LazySchemaValidator(
     {
         "$schema": schema_version,
         "title": "Schema for action API",
@@ -61,26 +63,35 @@ class ActionHandler(HandlerBase):
         """
         Takes payload and user id and handles this request by validating and
         parsing all actions. In the end it sends everything to the event store.
+
+        The payload may also be an iterator which parses the request body
+        incrementally. Its structure is validated while it is parsed, so only
+        lists are validated here.
         """
         self.user_id = user_id
 
         # Validate payload of request
-        try:
-            self.validate(payload)
-        except fastjsonschema.JsonSchemaException as exception:
-            raise ActionException(exception.message)
+        if isinstance(payload, list):
+            try:
+                self.validate(payload)
+            except fastjsonschema.JsonSchemaException as exception:
+                raise ActionException(exception.message)
 
         # TODO: Start a loop here and retry parsing actions and writing to event
         # store for some time if event store sends ModelLocked Exception
 
         # Parse actions and creates events
-        write_request_element = self.parse_actions(payload)
+        self.deferred_write_request_elements: List[Iterable[WriteRequestElement]] = []
+        write_request_element, action_count = self.parse_actions(payload)
 
-        # Send events to datastore
-        try:
-            self.database.write(write_request_element)
-        except EventStoreException as exception:
-            raise ActionException(exception.message)
+        # Send events to datastore. Actions which change nothing (e.g. sorting
+        # without any changes) do not produce events.
+        if write_request_element["events"]:
+            try:
+                self.database.write(write_request_element)
+            except EventStoreException as exception:
+                raise ActionException(exception.message)
+        self.write_deferred()
 
         # Return action result
         # TODO: This is a fake result because in this place all actions were
@@ -88,7 +99,31 @@ class ActionHandler(HandlerBase):
         self.logger.debug("Request was successful. Send response now.")
         return [
             ActionResult(success=True, message="Action handled successfully")
-        ] * len(payload)
+        ] * action_count
+
+    def write_deferred(self) -> None:
+        """
+        Writes the deferred write request elements of all actions one by one.
+        The fields read before were changed by the first write, so they are
+        not locked any more.
+        """
+        self.database.locked_fields.clear()
+        count = 0
+        for write_request_elements in self.deferred_write_request_elements:
+            for write_request_element in write_request_elements:
+                try:
+                    self.database.write(write_request_element)
+                except EventStoreException as exception:
+                    raise ActionException(
+                        "The request was written, but deferred write "
+                        f"{count + 1} failed: {exception.message}"
+                    )
+                count += 1
+                self.logger.debug(
+                    "Wrote deferred write %d with %d events.",
+                    count,
+                    len(write_request_element["events"]),
+                )
 
     def validate(self, payload: Payload) -> None:
         """
@@ -98,27 +133,36 @@ class ActionHandler(HandlerBase):
         self.logger.debug("Validate actions request.")
         payload_schema(payload)
 
-    def parse_actions(self, payload: Payload) -> WriteRequestElement:
+    def parse_actions(self, payload: Payload) -> Tuple[WriteRequestElement, int]:
         """
-        Parses actions request send by client. Raises ActionException or
+        Parses actions request send by client and returns the write request
+        element together with the number of actions. Raises ActionException or
         PermissionDenied if something went wrong.
         """
-        all_write_request_elements: List[WriteRequestElement] = []
+        builder = WriteRequestBuilder(self.user_id)
+        self.logger.debug(
+            "Actions map contains the following actions: %s.",
+            PayloadSummary(actions_map),
+        )
+        action_count = 0
         for element in payload:
-            self.logger.debug(
-                f"Actions map contains the following actions: {actions_map}."
-            )
+            action_count += 1
             action_name = element["action"]
             action = actions_map.get(action_name)
             if action is None or action.internal:
                 raise ActionException(f"Action {action_name} does not exist.")
-            self.logger.debug(f"Perform action {action_name}.")
-            write_request_elements = action(self.permission, self.database).perform(
+            self.logger.debug("Perform action %s.", action_name)
+            action_instance = action(self.permission, self.database)
+            write_request_elements = action_instance.perform(
                 element["data"], self.user_id
             )
             self.logger.debug(
-                f"Prepared write request element {write_request_elements}."
+                "Prepared write request element %s.",
+                PayloadSummary(write_request_elements),
+            )
+            builder.extend(write_request_elements)
+            self.deferred_write_request_elements.append(
+                action_instance.get_deferred_write_request_elements()
             )
-            all_write_request_elements.extend(write_request_elements)
         self.logger.debug("Write request is ready.")
-        return merge_write_request_elements(all_write_request_elements)
+        return builder.build(), action_count
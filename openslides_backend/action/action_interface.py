@@ -1,13 +1,13 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from mypy_extensions import TypedDict
 from typing_extensions import Protocol
 
 ActionPayload = List[Dict[str, Any]]
 ActionPayloadWithLabel = TypedDict(
-    "ActionPayloadWithLabel", {"action": str, "data": ActionPayload}
+    "ActionPayloadWithLabel", {"action": str, "data": Iterable[Dict[str, Any]]}
 )
-Payload = List[ActionPayloadWithLabel]
+Payload = Iterable[ActionPayloadWithLabel]
 
 ActionResult = TypedDict("ActionResult", {"success": bool, "message": str})
 
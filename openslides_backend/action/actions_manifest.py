@@ -0,0 +1,108 @@
+# Code generated. DO NOT EDIT.
+
+from typing import Dict
+
+ACTIONS_MANIFEST: Dict[str, str] = {
+    "agenda_item.assign": "agenda_item.assign",
+    "agenda_item.create": "agenda_item.create",
+    "agenda_item.delete": "agenda_item.delete",
+    "agenda_item.numbering": "agenda_item.numbering",
+    "agenda_item.sort": "agenda_item.sort",
+    "agenda_item.update": "agenda_item.update",
+    "assignment.add_self": "assignment",
+    "assignment.change_candidate": "assignment",
+    "assignment.create": "assignment.create_update_delete",
+    "assignment.delete": "assignment.create_update_delete",
+    "assignment.delete_self": "assignment",
+    "assignment.sort": "assignment",
+    "assignment.update": "assignment.create_update_delete",
+    "assignment_candidate.create": "assignment_candidate.create",
+    "assignment_candidate.delete": "assignment_candidate.delete",
+    "assignment_candidate.sort": "assignment_candidate.sort",
+    "committee.create": "committee.create",
+    "committee.delete": "committee",
+    "committee.update": "committee",
+    "list_of_speakers.delete": "list_of_speakers.delete",
+    "list_of_speakers.delete_all_speakers": "list_of_speakers.delete_all_speakers",
+    "list_of_speakers.re_add_last": "list_of_speakers.re_add_last",
+    "list_of_speakers.update": "list_of_speakers.update",
+    "mediafile.create": "mediafile",
+    "mediafile.delete": "mediafile.delete",
+    "mediafile.move": "mediafile",
+    "mediafile.set_as_font": "mediafile.set_as_font",
+    "mediafile.set_as_logo": "mediafile.set_as_logo",
+    "mediafile.update": "mediafile.update",
+    "meeting.create": "meeting.create_update_delete",
+    "meeting.delete": "meeting.create_update_delete",
+    "meeting.update": "meeting.create_update_delete",
+    "motion.create": "motion.create",
+    "motion.create_poll": "motion.update",
+    "motion.delete": "motion.delete",
+    "motion.follow_recommendation": "motion.follow_recommendation",
+    "motion.manage_comments": "motion.update",
+    "motion.numbering_in_category": "motion.update",
+    "motion.reset_recommendation": "motion.reset_recommendation",
+    "motion.reset_state": "motion.reset_state",
+    "motion.set_recommendation": "motion.set_recommendation",
+    "motion.set_state": "motion.set_state",
+    "motion.sort": "motion.sort",
+    "motion.sort_in_category": "motion.sort",
+    "motion.support": "motion.update",
+    "motion.update": "motion.update",
+    "motion.update_metadata": "motion.update_metadata",
+    "motion_block.create": "motion_block.create_update_delete",
+    "motion_block.delete": "motion_block.create_update_delete",
+    "motion_block.follow_recommendations": "motion_block",
+    "motion_block.update": "motion_block.create_update_delete",
+    "motion_category.create": "motion_category.create_update_delete",
+    "motion_category.delete": "motion_category.create_update_delete",
+    "motion_category.sort": "motion_category.sort",
+    "motion_category.sort_motions_in_categories": "motion_category.sort_motions_in_categories",
+    "motion_category.update": "motion_category.create_update_delete",
+    "motion_change_recommendation.create": "motion_change_recommendation.create_update_delete",
+    "motion_change_recommendation.delete": "motion_change_recommendation.create_update_delete",
+    "motion_change_recommendation.update": "motion_change_recommendation.create_update_delete",
+    "motion_comment.create": "motion_comment.create_delete_update",
+    "motion_comment.delete": "motion_comment.create_delete_update",
+    "motion_comment.update": "motion_comment.create_delete_update",
+    "motion_comment_section.create": "motion_comment_section.create",
+    "motion_comment_section.delete": "motion_comment_section.delete",
+    "motion_comment_section.sort": "motion_comment_section.sort",
+    "motion_comment_section.update": "motion_comment_section.update",
+    "motion_state.create": "motion_state.create_update_delete",
+    "motion_state.delete": "motion_state.create_update_delete",
+    "motion_state.update": "motion_state.create_update_delete",
+    "motion_statute_paragraph.create": "motion_statute_paragraph.create_update_delete",
+    "motion_statute_paragraph.delete": "motion_statute_paragraph.create_update_delete",
+    "motion_statute_paragraph.sort": "motion_statute_paragraph.sort",
+    "motion_statute_paragraph.update": "motion_statute_paragraph.create_update_delete",
+    "motion_submitter.create": "motion_submitter.create",
+    "motion_submitter.delete": "motion_submitter.delete",
+    "motion_submitter.sort": "motion_submitter.sort",
+    "motion_workflow.create": "motion_workflow.create",
+    "motion_workflow.delete": "motion_workflow.delete",
+    "motion_workflow.update": "motion_workflow.update",
+    "speaker.create": "speaker.create_update_delete",
+    "speaker.delete": "speaker.create_update_delete",
+    "speaker.end_speech": "speaker.end_speech",
+    "speaker.sort": "speaker.sort",
+    "speaker.speak": "speaker.speak",
+    "speaker.update": "speaker.create_update_delete",
+    "tag.create": "tag.create_update_delete",
+    "tag.delete": "tag.create_update_delete",
+    "tag.update": "tag.create_update_delete",
+    "topic.create": "topic.create",
+    "topic.delete": "topic.delete",
+    "topic.update": "topic.update",
+    "user.create": "user.create",
+    "user.create_temporary": "user.create_temporary",
+    "user.delete": "user.delete",
+    "user.delete_temporary": "user.delete_temporary",
+    "user.reset_passsword_to_default_temporary": "user",
+    "user.reset_password": "user",
+    "user.set_password": "user",
+    "user.set_password_temporary": "user",
+    "user.update": "user.update",
+    "user.update_self": "user.update_self",
+    "user.update_temporary": "user.update_temporary",
+}
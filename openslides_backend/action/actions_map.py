@@ -1,41 +1,103 @@
-from typing import Dict, Type
+import pkgutil
+from importlib import import_module
+from typing import Dict, ItemsView, Iterator, KeysView, Optional, Type, ValuesView
 
+from .actions_manifest import ACTIONS_MANIFEST
 from .base import Action
 
+ACTIONS_PACKAGE = __name__.rpartition(".")[0]
+
 
 def prepare_actions_map() -> None:
     """
     This function just imports all action modules so that the actions are
     recognized by the system and the register decorator can do its work.
+    """
+    package = import_module(ACTIONS_PACKAGE)
+    for module_info in pkgutil.walk_packages(
+        package.__path__, ACTIONS_PACKAGE + "."  # type: ignore
+    ):
+        import_module(module_info.name)
+
 
-    New modules have to be added here.
+class ActionsMap(Dict[str, Type[Action]]):
     """
-    from . import (  # noqa
-        agenda_item,
-        assignment,
-        assignment_candidate,
-        committee,
-        list_of_speakers,
-        mediafile,
-        meeting,
-        motion,
-        motion_block,
-        motion_category,
-        motion_change_recommendation,
-        motion_comment,
-        motion_comment_section,
-        motion_state,
-        motion_statute_paragraph,
-        motion_submitter,
-        motion_workflow,
-        speaker,
-        tag,
-        topic,
-        user,
-    )
-
-
-actions_map: Dict[str, Type[Action]] = {}
-
-
-prepare_actions_map()
+    Registry of all actions. The modules of the actions are imported lazily on
+    first lookup of one of their actions using the generated actions manifest
+    (see cli/generate_actions_manifest.py). Enumerating the registry imports
+    all action modules.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.all_loaded = False
+        # Module (relative to this package) of every registered action.
+        self.modules: Dict[str, str] = {}
+
+    def is_registered(self, name: str) -> bool:
+        """
+        Checks whether the action is registered without importing anything.
+        """
+        return super().__contains__(name)
+
+    def register(self, name: str, ActionClass: Type[Action], module: str) -> None:
+        self[name] = ActionClass
+        if module.startswith(ACTIONS_PACKAGE + "."):
+            module = module[len(ACTIONS_PACKAGE) + 1 :]
+        self.modules[name] = module
+
+    def load(self, name: str) -> None:
+        """
+        Imports the module of the given action if it is not registered yet.
+        Unknown actions lead to an import of all action modules.
+        """
+        if self.is_registered(name):
+            return
+        module = ACTIONS_MANIFEST.get(name)
+        if module is not None:
+            import_module("." + module, ACTIONS_PACKAGE)
+        else:
+            self.load_all()
+
+    def load_all(self) -> None:
+        if not self.all_loaded:
+            prepare_actions_map()
+            self.all_loaded = True
+
+    def get(  # type: ignore
+        self, name: str, default: Optional[Type[Action]] = None
+    ) -> Optional[Type[Action]]:
+        self.load(name)
+        return super().get(name, default)
+
+    def __getitem__(self, name: str) -> Type[Action]:
+        self.load(name)
+        return super().__getitem__(name)
+
+    def __contains__(self, name: object) -> bool:
+        if isinstance(name, str):
+            self.load(name)
+        return super().__contains__(name)
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.load_all()
+        return super().__len__()
+
+    def keys(self) -> KeysView[str]:  # type: ignore
+        self.load_all()
+        return super().keys()
+
+    def values(self) -> ValuesView[Type[Action]]:  # type: ignore
+        self.load_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Type[Action]]:  # type: ignore
+        self.load_all()
+        return super().items()
+
+
+actions_map = ActionsMap()
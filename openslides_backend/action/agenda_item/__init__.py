@@ -1 +0,0 @@
-from . import assign, create, delete, numbering, sort, update  # noqa
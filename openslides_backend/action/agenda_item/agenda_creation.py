@@ -1,8 +1,11 @@
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
 from ...models.models import AgendaItem
+from ...services.datastore.interface import Datastore
+from ...shared.interfaces import Permission
 from ...shared.patterns import KEYSEPARATOR, Collection, FullQualifiedId
 from ...shared.schema import optional_id_schema
+from ...shared.typing import ModelMap
 from ..base import Action
 
 AGENDA_PREFIX = "agenda_"
@@ -47,15 +50,22 @@ class CreateActionWithAgendaItemMixin(Action):
     Just call the functions in the corresponding base functions.
     """
 
+    def __init__(
+        self,
+        permission: Permission,
+        database: Datastore,
+        additional_relation_models: ModelMap = {},
+    ) -> None:
+        super().__init__(permission, database, additional_relation_models)
+        # The agenda_item_creation setting per meeting id.
+        self.agenda_item_creation: Dict[int, Optional[str]] = {}
+
     def check_dependant_action_execution_agenda_item(
         self, element: Dict[str, Any], CreateActionClass: Type[Action]
     ) -> bool:
-        meeting = self.database.get(
-            FullQualifiedId(Collection("meeting"), element["instance"]["meeting_id"]),
-            ["agenda_item_creation"],
-            lock_result=True,
+        agenda_item_creation = self.get_agenda_item_creation(
+            element["instance"]["meeting_id"]
         )
-        agenda_item_creation = meeting.get("agenda_item_creation")
         agenda_create = element["instance"].get("agenda_create")
         if agenda_item_creation == "always":
             return True
@@ -70,6 +80,20 @@ class CreateActionWithAgendaItemMixin(Action):
             return result_default
         return agenda_create
 
+    def get_agenda_item_creation(self, meeting_id: int) -> Optional[str]:
+        """
+        Returns the agenda_item_creation setting of the meeting. The meeting is
+        only read once per action.
+        """
+        if meeting_id not in self.agenda_item_creation:
+            meeting = self.database.get(
+                FullQualifiedId(Collection("meeting"), meeting_id),
+                ["agenda_item_creation"],
+                lock_result=True,
+            )
+            self.agenda_item_creation[meeting_id] = meeting.get("agenda_item_creation")
+        return self.agenda_item_creation[meeting_id]
+
     def get_dependent_action_payload_agenda_item(
         self, element: Dict[str, Any], CreateActionClass: Type[Action]
     ) -> Dict[str, Any]:
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import roman
 
@@ -19,7 +19,7 @@ def to_roman(number: int) -> str:
 
 
 class TreeElement:
-    def __init__(self, item_id: int, children: Iterable["TreeElement"]) -> None:
+    def __init__(self, item_id: int, children: List["TreeElement"]) -> None:
         self.id = item_id
         self.children = children
 
@@ -41,7 +41,7 @@ class AgendaTree:
 
     def get_root_and_children(
         self, only_item_type: int = None
-    ) -> Tuple[Iterable[SerializedAgendaItem], Dict[int, List[SerializedAgendaItem]]]:
+    ) -> Tuple[List[SerializedAgendaItem], Dict[int, List[SerializedAgendaItem]]]:
         """
         Returns an iterable with all root items and a dictonary where the key is an
         item id and the value is a list with all children of the item.
@@ -61,11 +61,10 @@ class AgendaTree:
                 root_items.append(item)
         return root_items, item_children
 
-    def get_tree(self, only_item_type: int = None) -> Iterable[TreeElement]:
+    def get_tree(self, only_item_type: int = None) -> List[TreeElement]:
         """
-        Generator that yields dictonaries. Each dictonary has two keys, id
-        and children, where id is the id of one agenda item and children is a
-        generator that yields dictonaries like the one discribed.
+        Returns the root elements of the tree. Each element has an id of one
+        agenda item and a list of its children elements.
 
         If only_item_type is given, the tree hides items with other types and
         all of their children.
@@ -73,20 +72,18 @@ class AgendaTree:
         root_items, item_children = self.get_root_and_children(
             only_item_type=only_item_type
         )
-
-        def get_children(
-            items: Iterable[SerializedAgendaItem],
-        ) -> Iterable[TreeElement]:
-            """
-            Generator that yields the descibed diconaries.
-            """
-            for item in items:
-                yield TreeElement(
-                    item_id=item["id"],
-                    children=get_children(item_children[item["id"]]),
+        elements = {
+            item["id"]: TreeElement(item_id=item["id"], children=[])
+            for item in self.ordered_agenda_items
+        }
+        # Link the children to their parents. Children of hidden parents are not
+        # reachable from the root elements.
+        for parent_id, children in item_children.items():
+            if parent_id in elements:
+                elements[parent_id].children.extend(
+                    elements[item["id"]] for item in children
                 )
-
-        yield from get_children(root_items)
+        return [elements[item["id"]] for item in root_items]
 
     def get_only_non_public_items(self) -> Iterable[SerializedAgendaItem]:
         """
@@ -95,28 +92,22 @@ class AgendaTree:
         """
         root_items, item_children = self.get_root_and_children(only_item_type=None)
 
-        def yield_items(
-            items: Iterable[SerializedAgendaItem], parent_is_not_public: bool = False
-        ) -> Iterable[SerializedAgendaItem]:
-            """
-            Generator that yields a list of items and their children.
-            """
-            for item in items:
-                item_type = item.get("type", self.DEFAULT_AGENDA_ITEM_TYPE)
-                if parent_is_not_public or item_type in (
-                    AgendaItem.INTERNAL_ITEM,
-                    AgendaItem.HIDDEN_ITEM,
-                ):
-                    item_is_not_public = True
-                    yield item
-                else:
-                    item_is_not_public = False
-                yield from yield_items(
-                    item_children.get(item["id"], []),
-                    parent_is_not_public=item_is_not_public,
-                )
-
-        yield from yield_items(root_items)
+        # Walk the tree in preorder. Each stack entry is an item and whether its
+        # parent is not public.
+        stack = [(item, False) for item in reversed(root_items)]
+        while stack:
+            item, parent_is_not_public = stack.pop()
+            item_type = item.get("type", self.DEFAULT_AGENDA_ITEM_TYPE)
+            item_is_not_public = parent_is_not_public or item_type in (
+                AgendaItem.INTERNAL_ITEM,
+                AgendaItem.HIDDEN_ITEM,
+            )
+            if item_is_not_public:
+                yield item
+            stack.extend(
+                (child, item_is_not_public)
+                for child in reversed(item_children.get(item["id"], []))
+            )
 
     def number_all(
         self, numeral_system: str = "arabic", agenda_number_prefix: str = None,
@@ -127,26 +118,35 @@ class AgendaTree:
         """
         new_numbers: Dict[int, str] = {}
 
-        # Start numbering visable agenda items.
-        def walk_tree(tree: Iterable[TreeElement], number: str = None) -> None:
-            for index, tree_element in enumerate(tree):
-                # Calculate number of visable agenda items.
-                if numeral_system == "roman" and number is None:
-                    item_number = to_roman(index + 1)
-                else:
-                    item_number = str(index + 1)
-                    if number is not None:
-                        item_number = ".".join((number, item_number))
-                # Add prefix.
-                if agenda_number_prefix:
-                    item_number_tmp = f"{agenda_number_prefix} {item_number}"
-                else:
-                    item_number_tmp = item_number
-                # Save the new value and go down the tree.
-                new_numbers[tree_element.id] = item_number_tmp
-                walk_tree(tree_element.children, item_number)
-
-        walk_tree(self.get_tree(only_item_type=AgendaItem.AGENDA_ITEM))
+        def get_number(index: int, parent_number: Optional[str]) -> str:
+            # Calculate number of visable agenda items.
+            if numeral_system == "roman" and parent_number is None:
+                return to_roman(index + 1)
+            number = str(index + 1)
+            if parent_number is not None:
+                number = ".".join((parent_number, number))
+            return number
+
+        # Start numbering visable agenda items. Walk the tree in preorder without
+        # recursion, so the depth of the agenda does not matter.
+        stack = [
+            (tree_element, get_number(index, None))
+            for index, tree_element in reversed(
+                list(enumerate(self.get_tree(only_item_type=AgendaItem.AGENDA_ITEM)))
+            )
+        ]
+        while stack:
+            tree_element, item_number = stack.pop()
+            # Add prefix and save the new value.
+            if agenda_number_prefix:
+                new_numbers[tree_element.id] = f"{agenda_number_prefix} {item_number}"
+            else:
+                new_numbers[tree_element.id] = item_number
+            # Go down the tree.
+            stack.extend(
+                (child, get_number(index, item_number))
+                for index, child in reversed(list(enumerate(tree_element.children)))
+            )
 
         # Reset number of hidden items.
         for item in self.get_only_non_public_items():
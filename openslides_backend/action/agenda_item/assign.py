@@ -2,12 +2,11 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from ...models.models import AgendaItem
 from ...shared.exceptions import ActionException
-from ...shared.filters import FilterOperator
-from ...shared.patterns import FullQualifiedId
 from ...shared.schema import id_list_schema
 from ..base import ActionPayload
 from ..default_schema import DefaultSchema
 from ..generics import UpdateAction
+from ..hierarchy import Hierarchy
 from ..register import register_action
 
 
@@ -41,36 +40,23 @@ class AgendaItemAssign(UpdateAction):
     def prepare_assign_data(
         self, parent_id: Optional[int], ids: List[int], meeting_id: int
     ) -> Iterable[Dict[str, Any]]:
-        filter = FilterOperator("meeting_id", "=", meeting_id)
-        db_instances = self.database.filter(
-            collection=self.model.collection,
-            filter=filter,
-            mapped_fields=["id"],
-            lock_result=True,
-        )
+        hierarchy = Hierarchy.load(self.database, self.model.collection, meeting_id)
 
         if parent_id is None:
             for id_ in ids:
-                if id_ not in db_instances:
+                if id_ not in hierarchy:
                     raise ActionException(f"Id {id_} not in db_instances.")
                 yield {"id": id_, "parent_id": None}
         else:
+            if parent_id not in hierarchy:
+                raise ActionException(f"Id {parent_id} not in db_instances.")
             # Calculate the ancesters of parent
-            ancesters = [parent_id]
-            grandparent = self.database.get(
-                FullQualifiedId(self.model.collection, parent_id), ["parent_id"]
-            )
-            while grandparent.get("parent_id") is not None:
-                gp_parent_id = grandparent["parent_id"]
-                ancesters.append(gp_parent_id)
-                grandparent = self.database.get(
-                    FullQualifiedId(self.model.collection, gp_parent_id), ["parent_id"]
-                )
+            ancesters = [parent_id] + hierarchy.get_ancestors(parent_id)
             for id_ in ids:
                 if id_ in ancesters:
                     raise ActionException(
                         f"Assigning item {id_} to one of its children is not possible."
                     )
-                if id_ not in db_instances:
+                if id_ not in hierarchy:
                     raise ActionException(f"Id {id_} not in db_instances.")
                 yield {"id": id_, "parent_id": parent_id}
@@ -14,6 +14,7 @@ class AgendaItemCreate(CreateActionWithInferredMeeting):
     """
 
     model = AgendaItem()
+    batch_size = 100
     schema = DefaultSchema(AgendaItem()).get_create_schema(
         required_properties=["content_object_id"],
         optional_properties=[
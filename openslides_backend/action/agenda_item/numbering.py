@@ -3,8 +3,8 @@ from typing import Iterable
 from ...models.models import AgendaItem
 from ...shared.filters import FilterOperator
 from ...shared.interfaces import Event, WriteRequestElement
-from ...shared.patterns import FullQualifiedId
-from ..base import Action, ActionPayload, DataSet
+from ...shared.patterns import Collection, FullQualifiedId
+from ..base import Action, ActionPayload, DataSet, WriteRequestBuilder
 from ..default_schema import DefaultSchema
 from ..register import register_action
 from .agenda_tree import AgendaTree
@@ -21,7 +21,8 @@ class AgendaItemNumbering(Action):
 
     def prepare_dataset(self, payload: ActionPayload) -> DataSet:
         # Overwrite parent prepare_dataset
-        # Fetch all agenda items for this meeting from database.
+        # Fetch all agenda items and the numbering settings for this meeting
+        # from database.
         meeting_id = payload[0]["meeting_id"]
         agenda_items = self.database.filter(
             collection=self.model.collection,
@@ -29,28 +30,35 @@ class AgendaItemNumbering(Action):
             mapped_fields=["item_number", "parent_id", "weight", "type"],
             lock_result=True,
         )
+        meeting = self.database.get(
+            FullQualifiedId(Collection("meeting"), meeting_id),
+            ["agenda_numeral_system", "agenda_number_prefix"],
+            lock_result=True,
+        )
 
-        # Build agenda tree and get new numbers
-        # TODO: Use roman numbers and prefix from config.
-        numeral_system = "arabic"
-        agenda_number_prefix = None
+        # Build agenda tree and get new numbers. Only changed numbers are written,
+        # a missing number equals the empty number of non public items.
+        new_numbers = AgendaTree(agenda_items.values()).number_all(
+            numeral_system=meeting.get("agenda_numeral_system") or "arabic",
+            agenda_number_prefix=meeting.get("agenda_number_prefix") or "",
+        )
         return DataSet(
-            data=AgendaTree(agenda_items.values()).number_all(
-                numeral_system=numeral_system, agenda_number_prefix=agenda_number_prefix
-            )
+            data={
+                instance_id: item_number
+                for instance_id, item_number in new_numbers.items()
+                if (agenda_items[instance_id].get("item_number") or "") != item_number
+            }
         )
 
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
-        information = {}
-        events = []
+        builder = WriteRequestBuilder(self.user_id)
         for instance_id, item_number in dataset["data"].items():
             fqid = FullQualifiedId(self.model.collection, instance_id)
-            information[fqid] = ["Object updated"]
-            events.append(
-                Event(type="update", fqid=fqid, fields={"item_number": item_number})
+            builder.add_event(
+                Event(type="update", fqid=fqid, fields={"item_number": item_number}),
+                ["Object updated"],
             )
-        yield WriteRequestElement(
-            events=events, information=information, user_id=self.user_id
-        )
+        if not builder.is_empty():
+            yield builder.build()
@@ -1,6 +1,7 @@
 import re
-from copy import deepcopy
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import fastjsonschema
 from mypy_extensions import TypedDict
@@ -12,14 +13,21 @@ from ..models.fields import (
     BaseTemplateField,
     BaseTemplateRelationField,
 )
+from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import Datastore
 from ..shared.exceptions import ActionException, PermissionDenied
 from ..shared.interfaces import Event, Permission, WriteRequestElement
-from ..shared.patterns import FullQualifiedField, FullQualifiedId
+from ..shared.patterns import Collection, FullQualifiedField, FullQualifiedId
+from ..shared.schema_validator import LazySchemaValidator, get_unique_items_digest
 from ..shared.typing import ModelMap
 from .action_interface import ActionPayload
 from .relations import Relations, RelationsHandler
 
+ITEM_PATH_PATTERN = re.compile(r"^data\[(\d+)\]")
+"""
+Matches the index of the invalid instance in messages of the schema validators.
+"""
+
 DataSetElement = TypedDict(
     "DataSetElement",
     {"instance": Dict[str, Any], "new_id": int, "relations": Relations},
@@ -31,13 +39,17 @@ DataSet = TypedDict(
 
 class SchemaProvider(type):
     """
-    Metaclass to provide pre-compiled JSON schemas for faster validation.
+    Metaclass to provide JSON schema validators for faster validation. The
+    schemas are compiled lazily on first use.
+
+    The validators are compiled without defaults so that validation does not
+    change the payload.
     """
 
     def __new__(cls, name, bases, attrs):  # type: ignore
         schema = attrs.get("schema")
         if schema is not None:
-            attrs["schema_validator"] = fastjsonschema.compile(schema)
+            attrs["schema_validator"] = LazySchemaValidator(schema, use_default=False)
         return super().__new__(cls, name, bases, attrs)
 
 
@@ -61,6 +73,15 @@ class Action(BaseAction, metaclass=SchemaProvider):
     schema: Dict
     schema_validator: Callable[[ActionPayload], None]
     internal: bool = False
+    batch_size: Optional[int] = None
+    """
+    If set, a payload which is not a list (e. g. the incrementally parsed data
+    of a request) is handled in batches of this size, so that it is never held
+    in memory completely. Only use this if the instances of the payload are
+    handled independently of each other. The events of all batches are still
+    kept until the request is written at once, but the relation updates of a
+    batch are merged per model.
+    """
 
     def __init__(
         self,
@@ -71,27 +92,96 @@ class Action(BaseAction, metaclass=SchemaProvider):
         self.permission = permission
         self.database = database
         self.additional_relation_models = additional_relation_models
+        self.modified_relation_fields: Dict[FullQualifiedField, Any] = {}
 
     def perform(
-        self, payload: ActionPayload, user_id: int
+        self, payload: Iterable[Dict[str, Any]], user_id: int
     ) -> Iterable[WriteRequestElement]:
         """
         Entrypoint to perform the action.
         """
         self.user_id = user_id
-        self.validate(deepcopy(payload))
+        if isinstance(payload, list):
+            return self.perform_batch(payload)
+        if self.batch_size is None:
+            return self.perform_batch(list(payload))
+        return self.perform_batches(payload, self.batch_size)
+
+    def perform_batches(
+        self, payload: Iterable[Dict[str, Any]], batch_size: int
+    ) -> Iterator[WriteRequestElement]:
+        """
+        Performs the action for each batch of the payload. The next batch is
+        taken from the payload after the write request elements of the previous
+        one are consumed. Validation messages refer to the index in the whole
+        payload and uniqueItems is checked across all batches.
+        """
+        unique_items = self.schema.get("uniqueItems", False)
+        digests: Set[bytes] = set()
+        iterator = iter(payload)
+        offset = 0
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            if unique_items:
+                for element in batch:
+                    digest = get_unique_items_digest(element)
+                    if digest in digests:
+                        raise ActionException("data must contain unique items")
+                    digests.add(digest)
+            yield from self.perform_batch(batch, offset)
+            offset += len(batch)
+
+    def perform_batch(
+        self, payload: ActionPayload, offset: int = 0
+    ) -> Iterable[WriteRequestElement]:
+        """
+        Validates the payload, checks permissions and prepares the write request
+        elements. The offset is the index of the first instance of the payload
+        in the whole payload of the action.
+        """
+        self.validate(payload, offset)
         self.check_permissions(payload)
         dataset = self.prepare_dataset(payload)
         return self.create_write_request_elements(dataset)
 
-    def validate(self, payload: ActionPayload) -> None:
+    def perform_internal(
+        self, payload: ActionPayload, user_id: int
+    ) -> Iterable[WriteRequestElement]:
+        """
+        Entrypoint for actions dispatched by other actions. The payload is
+        trusted, so validation and permission check are skipped. Use one call
+        with all instances instead of one call per instance.
         """
-        Validates action payload according to schema class attribute.
+        self.user_id = user_id
+        dataset = self.prepare_dataset(payload)
+        return self.create_write_request_elements(dataset)
+
+    def get_deferred_write_request_elements(self) -> Iterable[WriteRequestElement]:
+        """
+        Returns write request elements which are written one by one after the
+        write request of the whole request. Use this for work which is too
+        large for one write request and which leaves the datastore consistent
+        if it is not finished. By default there are none.
+        """
+        return []
+
+    def validate(self, payload: ActionPayload, offset: int = 0) -> None:
+        """
+        Validates action payload according to schema class attribute. If the
+        payload is a batch of a larger payload, the indices in the message are
+        shifted by the given offset.
         """
         try:
             type(self).schema_validator(payload)
         except fastjsonschema.JsonSchemaException as exception:
-            raise ActionException(exception.message)
+            message = exception.message
+            if offset:
+                message = ITEM_PATH_PATTERN.sub(
+                    lambda match: f"data[{int(match.group(1)) + offset}]", message
+                )
+            raise ActionException(message)
 
     def check_permissions(self, payload: ActionPayload) -> None:
         """
@@ -125,15 +215,14 @@ class Action(BaseAction, metaclass=SchemaProvider):
         """
         Validates all model fields according to the model definition.
         """
-        for field_name, field in self.model.get_fields():
-            if field_name in instance:
-                instance[field_name] = field.validate(instance[field_name])
-        return instance
+        return self.model.validate_fields(instance)
 
     def validate_relation_fields(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validates all relation fields according to the model definition.
+        Validates all relation fields according to the model definition. All
+        referenced models are fetched at once.
         """
+        checks: List[Tuple[BaseRelationField, str, List[str]]] = []
         for field_name, field in self.model.get_relation_fields():
             if field.equal_fields:
                 if field_name in instance:
@@ -148,7 +237,8 @@ class Action(BaseAction, metaclass=SchemaProvider):
                 else:
                     continue
                 for instance_field in fields:
-                    self.check_equal_fields(field, instance, instance_field)
+                    checks.append((field, instance_field, field.equal_fields))
+        self.check_all_equal_fields(instance, checks)
         return instance
 
     def check_equal_fields(
@@ -163,10 +253,36 @@ class Action(BaseAction, metaclass=SchemaProvider):
         are the same in instance and the model referenced by the name instance_field
         of the given field.
         """
-        fqids = self.get_field_value_as_fqid_list(field, instance[instance_field])
-        equal_fields = field.equal_fields + additional_equal_fields
-        for fqid in fqids:
-            related_model = self.fetch_model(fqid, equal_fields)
+        self.check_all_equal_fields(
+            instance,
+            [(field, instance_field, field.equal_fields + additional_equal_fields)],
+        )
+
+    def check_all_equal_fields(
+        self,
+        instance: Dict[str, Any],
+        checks: List[Tuple[BaseRelationField, str, List[str]]],
+    ) -> None:
+        """
+        Performs check_equal_fields for all given tuples of field, instance_field
+        and equal fields. The referenced models are fetched with one get_many
+        request.
+        """
+        fqid_checks: List[Tuple[FullQualifiedId, List[str]]] = []
+        mapped_fields: Set[str] = set()
+        for field, instance_field, equal_fields in checks:
+            for fqid in self.get_field_value_as_fqid_list(
+                field, instance[instance_field]
+            ):
+                fqid_checks.append((fqid, equal_fields))
+                mapped_fields.update(equal_fields)
+        if not fqid_checks:
+            return
+        related_models = self.fetch_models(
+            [fqid for fqid, _ in fqid_checks], sorted(mapped_fields)
+        )
+        for fqid, equal_fields in fqid_checks:
+            related_model = related_models[fqid]
             for equal_field_name in equal_fields:
                 if instance.get(equal_field_name) != related_model.get(
                     equal_field_name
@@ -230,6 +346,38 @@ class Action(BaseAction, metaclass=SchemaProvider):
         else:
             return self.database.get(fqid, mapped_fields, lock_result=True)
 
+    def fetch_models(
+        self, fqids: Iterable[FullQualifiedId], mapped_fields: List[str]
+    ) -> Dict[FullQualifiedId, Dict[str, Any]]:
+        """
+        Like fetch_model, but for many instances. All instances which are not in
+        additional_relation_models are retrieved with one get_many request.
+        """
+        result: Dict[FullQualifiedId, Dict[str, Any]] = {}
+        db_ids: Dict[Collection, List[int]] = defaultdict(list)
+        for fqid in dict.fromkeys(fqids):
+            if fqid in self.additional_relation_models:
+                result[fqid] = self.fetch_model(fqid, mapped_fields)
+            else:
+                db_ids[fqid.collection].append(fqid.id)
+        if db_ids:
+            response = self.database.get_many(
+                [
+                    GetManyRequest(collection, ids, mapped_fields)
+                    for collection, ids in db_ids.items()
+                ],
+                lock_result=True,
+            )
+            for collection, ids in db_ids.items():
+                for id in ids:
+                    fqid = FullQualifiedId(collection, id)
+                    instance = response.get(collection, {}).get(id)
+                    if instance is None:
+                        # Raises the usual error for missing models.
+                        instance = self.fetch_model(fqid, mapped_fields)
+                    result[fqid] = instance
+        return result
+
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
@@ -238,20 +386,33 @@ class Action(BaseAction, metaclass=SchemaProvider):
         store.
 
         By default it calls self.create_instance_write_request_element and uses
-        get_relations_updates() for relations.
+        get_relations_updates() for relations. Everything is collected into one
+        write request element. The modified relation fields are kept on the
+        instance, so later batches of the same payload build on them. Updates
+        of the same model are merged into one event per call, which carries the
+        final values.
         """
-        modified_relation_fields: Dict[FullQualifiedField, Any] = {}
+        builder = WriteRequestBuilder(self.user_id)
+        relation_fields: Dict[FullQualifiedId, Dict[str, Any]] = defaultdict(dict)
+        relation_information: Dict[FullQualifiedId, List[str]] = defaultdict(list)
         for element in dataset["data"]:
-            instance_write_request_element = self.create_instance_write_request_element(
-                element
-            )
-            for relation in self.get_relations_updates(
-                element, modified_relation_fields
+            builder.add(self.create_instance_write_request_element(element))
+            for write_request_element in self.get_relations_updates(
+                element, self.modified_relation_fields
             ):
-                instance_write_request_element = merge_write_request_elements(
-                    (instance_write_request_element, relation)
-                )
-            yield instance_write_request_element
+                for event in write_request_element["events"]:
+                    relation_fields[event["fqid"]].update(event["fields"])
+                for fqid, information in write_request_element["information"].items():
+                    for text in information:
+                        if text not in relation_information[fqid]:
+                            relation_information[fqid].append(text)
+        for fqid, fields in relation_fields.items():
+            builder.add_event(
+                Event(type="update", fqid=fqid, fields=fields),
+                relation_information[fqid],
+            )
+        if not builder.is_empty():
+            yield builder.build()
 
     def create_instance_write_request_element(
         self, element: Any
@@ -350,12 +511,68 @@ class DummyAction(Action):
     is_dummy = True
 
     def perform(
-        self, payload: ActionPayload, user_id: int
+        self, payload: Iterable[Dict[str, Any]], user_id: int
     ) -> Iterable[WriteRequestElement]:
         raise NotImplementedError(
             "This action has to be implemented but is still missing."
         )
 
+    def perform_internal(
+        self, payload: ActionPayload, user_id: int
+    ) -> Iterable[WriteRequestElement]:
+        return self.perform(payload, user_id)
+
+
+class WriteRequestBuilder:
+    """
+    Mutable builder for one write request element. Events and information are
+    appended in place, so collecting the events of many actions does not copy
+    the events collected so far. The user id is given once.
+    """
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self.events: List[Event] = []
+        self.information: Dict[FullQualifiedId, List[str]] = {}
+
+    def add_event(self, event: Event, information: Optional[List[str]] = None) -> None:
+        """
+        Appends one event and optional information texts for its fqid.
+        """
+        self.events.append(event)
+        if information:
+            self.add_information(event["fqid"], information)
+
+    def add_information(self, fqid: FullQualifiedId, information: List[str]) -> None:
+        if fqid in self.information:
+            self.information[fqid].extend(information)
+        else:
+            self.information[fqid] = list(information)
+
+    def add(self, write_request_element: WriteRequestElement) -> None:
+        """
+        Appends the events and information of the given write request element.
+        """
+        if write_request_element["user_id"] != self.user_id:
+            raise ValueError(
+                "You can not merge two write request elements of different users."
+            )
+        self.events.extend(write_request_element["events"])
+        for fqid, information in write_request_element["information"].items():
+            self.add_information(fqid, information)
+
+    def extend(self, write_request_elements: Iterable[WriteRequestElement]) -> None:
+        for write_request_element in write_request_elements:
+            self.add(write_request_element)
+
+    def is_empty(self) -> bool:
+        return not self.events and not self.information
+
+    def build(self) -> WriteRequestElement:
+        return WriteRequestElement(
+            events=self.events, information=self.information, user_id=self.user_id
+        )
+
 
 def merge_write_request_elements(
     write_request_elements: Iterable[WriteRequestElement],
@@ -363,23 +580,11 @@ def merge_write_request_elements(
     """
     Merges the given write request elements to one big write request element.
     """
-    events: List[Event] = []
-    information: Dict[FullQualifiedId, List[str]] = {}
-    user_id: Optional[int] = None
+    builder: Optional[WriteRequestBuilder] = None
     for element in write_request_elements:
-        events.extend(element["events"])
-        for fqid, info_text in element["information"].items():
-            if information.get(fqid) is None:
-                information[fqid] = info_text
-            else:
-                information[fqid].extend(info_text)
-        if user_id is None:
-            user_id = element["user_id"]
-        else:
-            if user_id != element["user_id"]:
-                raise ValueError(
-                    "You can not merge two write request elements of different users."
-                )
-    if user_id is None:
+        if builder is None:
+            builder = WriteRequestBuilder(element["user_id"])
+        builder.add(element)
+    if builder is None or builder.user_id is None:
         raise ValueError("At least one of the given user ids must not be None.")
-    return WriteRequestElement(events=events, information=information, user_id=user_id)
+    return builder.build()
@@ -0,0 +1,576 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..models.base import Model, model_registry
+from ..models.fields import (
+    BaseGenericRelationField,
+    BaseRelationField,
+    BaseTemplateRelationField,
+    OnDelete,
+)
+from ..services.datastore.interface import Datastore, GetManyRequest, PartialModel
+from ..shared.exceptions import ActionException
+from ..shared.filters import FilterOperator, Or
+from ..shared.patterns import (
+    Collection,
+    FullQualifiedField,
+    FullQualifiedId,
+    string_to_fqid,
+)
+from ..shared.typing import DeletedModel, ModelMap
+
+RelationValue = Union[int, FullQualifiedId]
+
+
+class DeletePlan:
+    """
+    Result of the CascadeDeletePlanner: All models that are deleted and the
+    final values of all relation fields of surviving models that have to be
+    reset.
+    """
+
+    def __init__(self) -> None:
+        # Insertion order is the order of the breadth first walk.
+        self.deleted: Dict[FullQualifiedId, Model] = {}
+        self.updates: Dict[FullQualifiedId, Dict[str, Any]] = {}
+        self.information: Dict[FullQualifiedId, List[str]] = {}
+
+    def get_deleted_ids(self) -> Dict[Collection, List[int]]:
+        """
+        Returns the ids of all deleted models grouped by collection.
+        """
+        result: Dict[Collection, List[int]] = defaultdict(list)
+        for fqid in self.deleted.keys():
+            result[fqid.collection].append(fqid.id)
+        return result
+
+
+class CascadeDeletePlanner:
+    """
+    Computes all consequences of deleting a set of models of one collection.
+
+    The CASCADE graph is walked level by level. For each level all relation
+    fields of all models of one collection are fetched with one get_many
+    request. PROTECT fields are checked once the whole deletion set is known.
+    In the end the reverse fields (SET_NULL) of all surviving models are
+    fetched per collection and their final values are computed. So the number
+    of requests is bounded by the depth of the cascade and the number of
+    involved collections, not by the number of deleted models.
+
+    Collections without CASCADE and PROTECT fields are leaves: Their models
+    are fetched once and only their reverse fields are reset.
+
+    Relation fields with structured_relation are supported if they are no
+    template fields. The replacement of their related name is fetched together
+    with the other relation fields. All other structured fields are skipped
+    because they are not fully supported yet.
+
+    additional_relation_models can mark models as already deleted (using
+    DeletedModel) or provide models which are not yet present in the
+    datastore.
+    """
+
+    def __init__(
+        self, database: Datastore, additional_relation_models: ModelMap = {}
+    ) -> None:
+        self.database = database
+        self.additional_relation_models = additional_relation_models
+        self.relation_fields: Dict[Collection, List[Tuple[str, BaseRelationField]]] = {}
+        self.reverse_fields: Dict[Tuple[Collection, str], BaseRelationField] = {}
+        self.models: Dict[Collection, Model] = {}
+
+    def plan(self, model: Model, ids: Iterable[int]) -> DeletePlan:
+        """
+        Plans the deletion of the given ids of the given model.
+        """
+        plan = DeletePlan()
+        db_instances: Dict[FullQualifiedId, PartialModel] = {}
+        frontier: Dict[Collection, Set[int]] = defaultdict(set)
+        for id in ids:
+            fqid = FullQualifiedId(model.collection, id)
+            if fqid not in plan.deleted:
+                plan.deleted[fqid] = model
+                frontier[model.collection].add(id)
+
+        if self.is_leaf(model.collection):
+            for id, db_instance in self.fetch_instances(
+                model.collection, frontier[model.collection]
+            ).items():
+                db_instances[FullQualifiedId(model.collection, id)] = db_instance
+            self.reset_reverse_fields(plan, db_instances)
+            return plan
+
+        self.walk(plan, db_instances, frontier)
+        self.check_protected_fields(plan, db_instances)
+        self.reset_reverse_fields(plan, db_instances)
+        return plan
+
+    def walk(
+        self,
+        plan: DeletePlan,
+        db_instances: Dict[FullQualifiedId, PartialModel],
+        frontier: Dict[Collection, Set[int]],
+    ) -> None:
+        """
+        Walks down the CASCADE graph level by level, beginning with the given
+        frontier whose models are already part of the plan.
+        """
+        while frontier:
+            next_frontier: Dict[Collection, Set[int]] = defaultdict(set)
+            for collection, collection_ids in frontier.items():
+                for id, db_instance in self.fetch_instances(
+                    collection, collection_ids
+                ).items():
+                    fqid = FullQualifiedId(collection, id)
+                    db_instances[fqid] = db_instance
+                    self.add_cascaded_models(plan, fqid, db_instance, next_frontier)
+            frontier = next_frontier
+
+    def add_cascaded_models(
+        self,
+        plan: DeletePlan,
+        fqid: FullQualifiedId,
+        db_instance: PartialModel,
+        frontier: Dict[Collection, Set[int]],
+    ) -> None:
+        """
+        Adds all models the CASCADE fields of the instance point to to the plan
+        and to the frontier, if they are not already deleted.
+        """
+        for field_name, field in self.get_relation_fields(fqid.collection):
+            if field.on_delete != OnDelete.CASCADE:
+                continue
+            for foreign_fqid in self.get_foreign_fqids(field, field_name, db_instance):
+                if foreign_fqid in plan.deleted or isinstance(
+                    self.additional_relation_models.get(foreign_fqid), DeletedModel,
+                ):
+                    continue
+                plan.deleted[foreign_fqid] = self.get_model(foreign_fqid.collection)
+                frontier[foreign_fqid.collection].add(foreign_fqid.id)
+
+    def get_model(self, collection: Collection) -> Model:
+        if collection not in self.models:
+            self.models[collection] = model_registry[collection]()
+        return self.models[collection]
+
+    def get_relation_fields(
+        self, collection: Collection
+    ) -> List[Tuple[str, BaseRelationField]]:
+        """
+        Returns all relation fields of the given collection that have to be
+        handled on deletion.
+        """
+        if collection not in self.relation_fields:
+            self.relation_fields[collection] = [
+                (field_name, field)
+                for field_name, field in self.get_model(
+                    collection
+                ).get_relation_fields()
+                if not field.structured_tag
+                and not (
+                    field.structured_relation
+                    and isinstance(field, BaseTemplateRelationField)
+                )
+            ]
+        return self.relation_fields[collection]
+
+    def is_leaf(self, collection: Collection) -> bool:
+        """
+        Returns True if deleting models of the given collection can neither
+        cascade nor be protected.
+        """
+        return all(
+            field.on_delete == OnDelete.SET_NULL
+            for _, field in self.get_relation_fields(collection)
+        )
+
+    def get_reverse_field(
+        self, collection: Collection, related_name: str
+    ) -> BaseRelationField:
+        """
+        Returns the field of the given collection with the given related name.
+        Structured related names are looked up without their $.
+        """
+        key = (collection, related_name)
+        if key not in self.reverse_fields:
+            field = self.get_model(collection).get_field(
+                related_name.replace("$", "", 1)
+            )
+            assert isinstance(field, BaseRelationField)
+            self.reverse_fields[key] = field
+        return self.reverse_fields[key]
+
+    def get_related_name(
+        self, field: BaseRelationField, db_instance: PartialModel
+    ) -> Optional[str]:
+        """
+        Returns the related name of the field with the replacement of its
+        structured relation taken from the instance.
+        """
+        if not field.structured_relation:
+            return field.related_name
+        replacement = db_instance.get(field.structured_relation[0])
+        if replacement is None:
+            return None
+        return field.related_name.replace("$", str(replacement), 1)
+
+    def fetch_instances(
+        self, collection: Collection, ids: Set[int]
+    ) -> Dict[int, PartialModel]:
+        """
+        Fetches all relation fields of the given instances.
+        """
+        mapped_fields, template_fields = self.get_mapped_fields(collection)
+        result = self.get_many(collection, ids, mapped_fields)
+        for id in ids:
+            if id not in result:
+                raise ActionException(
+                    f"Model {FullQualifiedId(collection, id)} does not exist."
+                )
+        self.fetch_structured_fields(collection, result, template_fields)
+        return result
+
+    def get_mapped_fields(self, collection: Collection) -> Tuple[List[str], List[str]]:
+        """
+        Returns the fields to fetch for the relation fields of the given
+        collection and the names of all template fields among them.
+        """
+        mapped_fields = []
+        template_fields = []
+        for field_name, field in self.get_relation_fields(collection):
+            if isinstance(field, BaseTemplateRelationField):
+                if field.on_delete != OnDelete.SET_NULL:
+                    # We currently do not support such template fields.
+                    raise NotImplementedError
+                template_field_name = self.get_template_field_name(field_name, field)
+                mapped_fields.append(template_field_name)
+                template_fields.append(template_field_name)
+            else:
+                mapped_fields.append(field_name)
+                if field.structured_relation:
+                    mapped_fields.append(field.structured_relation[0])
+        return list(dict.fromkeys(mapped_fields)), template_fields
+
+    def fetch_structured_fields(
+        self,
+        collection: Collection,
+        instances: Dict[int, PartialModel],
+        template_fields: List[str],
+    ) -> None:
+        """
+        Template fields need a second request for their structured fields.
+        """
+        structured_fields: Set[str] = set()
+        for instance in instances.values():
+            for template_field_name in template_fields:
+                for replacement in instance.get(template_field_name) or []:
+                    structured_fields.add(
+                        template_field_name.replace("$", replacement, 1)
+                    )
+        if structured_fields:
+            structured_result = self.get_many(
+                collection, list(instances), list(structured_fields)
+            )
+            for id, instance in structured_result.items():
+                instances[id].update(instance)
+
+    def get_many(
+        self, collection: Collection, ids: Iterable[int], mapped_fields: List[str]
+    ) -> Dict[int, PartialModel]:
+        """
+        Fetches the given instances from additional_relation_models or from
+        the datastore using a single get_many request.
+        """
+        result: Dict[int, PartialModel] = {}
+        db_ids = []
+        for id in ids:
+            additional_model = self.additional_relation_models.get(
+                FullQualifiedId(collection, id)
+            )
+            if additional_model is not None and not isinstance(
+                additional_model, DeletedModel
+            ):
+                result[id] = {
+                    field: additional_model.get(field) for field in mapped_fields
+                }
+            else:
+                db_ids.append(id)
+        if db_ids:
+            response = self.database.get_many(
+                get_many_requests=[
+                    GetManyRequest(collection, db_ids, mapped_fields=mapped_fields)
+                ],
+                lock_result=True,
+            )
+            result.update(response.get(collection, {}))
+        return result
+
+    def get_template_field_name(
+        self, field_name: str, field: BaseTemplateRelationField
+    ) -> str:
+        return field_name[: field.index] + "$" + field_name[field.index :]
+
+    def get_foreign_fqids(
+        self, field: BaseRelationField, field_name: str, db_instance: PartialModel
+    ) -> List[FullQualifiedId]:
+        """
+        Returns all fqids the given field of the instance points to.
+        """
+        if isinstance(field, BaseTemplateRelationField):
+            template_field_name = self.get_template_field_name(field_name, field)
+            values: List[Any] = []
+            for replacement in db_instance.get(template_field_name) or []:
+                value = db_instance.get(
+                    template_field_name.replace("$", replacement, 1)
+                )
+                values.extend(value if isinstance(value, list) else [value])
+        else:
+            value = db_instance.get(field_name)
+            values = value if isinstance(value, list) else [value]
+        fqids = []
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(field, BaseGenericRelationField):
+                fqids.append(
+                    value
+                    if isinstance(value, FullQualifiedId)
+                    else string_to_fqid(value)
+                )
+            else:
+                assert isinstance(field.to, Collection)
+                fqids.append(FullQualifiedId(field.to, value))
+        return fqids
+
+    def check_protected_fields(
+        self, plan: DeletePlan, db_instances: Dict[FullQualifiedId, PartialModel]
+    ) -> None:
+        """
+        Asserts that all models referenced by a PROTECT field are deleted, too.
+        """
+        for fqid, db_instance in db_instances.items():
+            for field_name, field in self.get_relation_fields(fqid.collection):
+                if field.on_delete != OnDelete.PROTECT:
+                    continue
+                for foreign_fqid in self.get_foreign_fqids(
+                    field, field_name, db_instance
+                ):
+                    if foreign_fqid not in plan.deleted and not isinstance(
+                        self.additional_relation_models.get(foreign_fqid), DeletedModel,
+                    ):
+                        raise ActionException(
+                            f"You can not delete {plan.deleted[fqid]} with id {fqid.id}, "
+                            f"because you have to delete the related {str(field.to)} first."
+                        )
+
+    def reset_reverse_fields(
+        self, plan: DeletePlan, db_instances: Dict[FullQualifiedId, PartialModel]
+    ) -> None:
+        """
+        Computes the new values of all reverse fields of surviving models which
+        point to deleted models.
+        """
+        # Collect all values to be removed per fqfield.
+        removals: Dict[FullQualifiedField, Set[RelationValue]] = defaultdict(set)
+        reverse_fields: Dict[FullQualifiedField, BaseRelationField] = {}
+        generic_fqfields: Set[FullQualifiedField] = set()
+        information: Dict[FullQualifiedId, List[str]] = defaultdict(list)
+        for fqid, db_instance in db_instances.items():
+            for field_name, field in self.get_relation_fields(fqid.collection):
+                if field.on_delete != OnDelete.SET_NULL:
+                    continue
+                for foreign_fqid in self.get_foreign_fqids(
+                    field, field_name, db_instance
+                ):
+                    if foreign_fqid in plan.deleted or isinstance(
+                        self.additional_relation_models.get(foreign_fqid), DeletedModel,
+                    ):
+                        continue
+                    related_name = self.get_related_name(field, db_instance)
+                    if related_name is None:
+                        continue
+                    reverse_field = self.get_reverse_field(
+                        foreign_fqid.collection, field.related_name
+                    )
+                    if (
+                        not reverse_field.is_list_field
+                        and reverse_field.on_delete == OnDelete.PROTECT
+                    ):
+                        raise ActionException(
+                            f"You are not allowed to delete {plan.deleted[fqid]} {fqid.id} as "
+                            "long as there are some required related objects."
+                        )
+                    fqfield = FullQualifiedField(
+                        foreign_fqid.collection, foreign_fqid.id, related_name
+                    )
+                    reverse_fields[fqfield] = reverse_field
+                    if field.generic_relation:
+                        generic_fqfields.add(fqfield)
+                        removals[fqfield].add(fqid)
+                    else:
+                        removals[fqfield].add(fqid.id)
+                    info_text = f"Object attachment to {plan.deleted[fqid]} reset"
+                    if info_text not in information[foreign_fqid]:
+                        information[foreign_fqid].append(info_text)
+
+        # Fetch the current values with one request per collection.
+        fields_per_collection: Dict[Collection, Set[str]] = defaultdict(set)
+        ids_per_collection: Dict[Collection, Set[int]] = defaultdict(set)
+        for fqfield in removals.keys():
+            fields_per_collection[fqfield.collection].add(fqfield.field)
+            ids_per_collection[fqfield.collection].add(fqfield.id)
+        current_instances: Dict[FullQualifiedId, PartialModel] = {}
+        for collection, collection_ids in ids_per_collection.items():
+            response = self.get_many(
+                collection, collection_ids, list(fields_per_collection[collection])
+            )
+            for id in collection_ids:
+                if id not in response:
+                    raise ActionException(
+                        f"You try to reference an instance of {collection} that does not exist."
+                    )
+                current_instances[FullQualifiedId(collection, id)] = response[id]
+
+        # Compute the final values.
+        for fqfield, removed_values in removals.items():
+            current_value = current_instances[fqfield.fqid].get(fqfield.field)
+            new_value: Any
+            if reverse_fields[fqfield].is_list_field:
+                current_list = current_value or []
+                if fqfield in generic_fqfields:
+                    current_list = [
+                        value
+                        if isinstance(value, FullQualifiedId)
+                        else string_to_fqid(value)
+                        for value in current_list
+                    ]
+                new_value = [
+                    value for value in current_list if value not in removed_values
+                ]
+            else:
+                new_value = None
+            plan.updates.setdefault(fqfield.fqid, {})[fqfield.field] = new_value
+        plan.information.update(information)
+
+
+class MeetingDeletePlanner(CascadeDeletePlanner):
+    """
+    Planner for the deletion of whole meetings.
+
+    The meeting cascades to all meeting-scoped collections. Instead of walking
+    the CASCADE graph level by level, all models of each of these collections
+    are fetched with one filter on meeting_id. Relation fields between models
+    of the deleted meetings are not fetched at all, because both sides are
+    deleted anyway. These are all fields to the meeting itself and all fields
+    to meeting-scoped collections with meeting_id as equal field. All other
+    relation fields, e.g. to users, committees or motions of other meetings,
+    are handled like in the CascadeDeletePlanner.
+
+    The plan itself is linear in the size of the meeting: one entry per
+    deleted model plus the fetched relation fields. The MeetingDelete action
+    writes it in chunks, see there.
+    """
+
+    def __init__(
+        self, database: Datastore, additional_relation_models: ModelMap = {}
+    ) -> None:
+        super().__init__(database, additional_relation_models)
+        self.root: Optional[Collection] = None
+        self.scoped_collections: Set[Collection] = set()
+        self.scoped_relation_fields: Dict[
+            Collection, List[Tuple[str, BaseRelationField]]
+        ] = {}
+
+    def plan(self, model: Model, ids: Iterable[int]) -> DeletePlan:
+        ids = list(dict.fromkeys(ids))
+        self.root = model.collection
+        self.scoped_collections = {
+            field.to
+            for _, field in self.get_relation_fields(model.collection)
+            if field.on_delete == OnDelete.CASCADE
+            and isinstance(field.to, Collection)
+            and any(
+                field_name == self.get_scope_field()
+                for field_name, _ in self.get_relation_fields(field.to)
+            )
+        }
+
+        plan = DeletePlan()
+        db_instances: Dict[FullQualifiedId, PartialModel] = {}
+        frontier: Dict[Collection, Set[int]] = defaultdict(set)
+        meetings = self.fetch_instances(model.collection, set(ids))
+        for id in ids:
+            fqid = FullQualifiedId(model.collection, id)
+            plan.deleted[fqid] = model
+            db_instances[fqid] = meetings[id]
+        for fqid, db_instance in self.fetch_scoped_instances(ids).items():
+            plan.deleted[fqid] = self.get_model(fqid.collection)
+            db_instances[fqid] = db_instance
+
+        # Models which are referenced by the meetings or the scoped models but
+        # were not found by the filters are walked like in the usual cascade.
+        for fqid, db_instance in list(db_instances.items()):
+            self.add_cascaded_models(plan, fqid, db_instance, frontier)
+        self.walk(plan, db_instances, frontier)
+
+        self.check_protected_fields(plan, db_instances)
+        self.reset_reverse_fields(plan, db_instances)
+        return plan
+
+    def get_scope_field(self) -> str:
+        return f"{self.root}_id"
+
+    def get_relation_fields(
+        self, collection: Collection
+    ) -> List[Tuple[str, BaseRelationField]]:
+        if collection in self.scoped_relation_fields:
+            return self.scoped_relation_fields[collection]
+        relation_fields = super().get_relation_fields(collection)
+        if collection not in self.scoped_collections:
+            return relation_fields
+        self.scoped_relation_fields[collection] = [
+            (field_name, field)
+            for field_name, field in relation_fields
+            if not self.is_internal(field)
+        ]
+        return self.scoped_relation_fields[collection]
+
+    def is_internal(self, field: BaseRelationField) -> bool:
+        """
+        Returns True if the field of a scoped model can only point to models
+        of the same meetings.
+        """
+        targets = field.to if isinstance(field.to, list) else [field.to]
+        if not all(
+            target == self.root or target in self.scoped_collections
+            for target in targets
+        ):
+            return False
+        return self.root in targets or self.get_scope_field() in field.equal_fields
+
+    def fetch_scoped_instances(
+        self, ids: List[int]
+    ) -> Dict[FullQualifiedId, PartialModel]:
+        """
+        Fetches the remaining relation fields of all models of the scoped
+        collections with one filter request per collection.
+        """
+        filters = [FilterOperator(self.get_scope_field(), "=", id) for id in ids]
+        filter = filters[0] if len(filters) == 1 else Or(*filters)
+        result: Dict[FullQualifiedId, PartialModel] = {}
+        for collection in sorted(self.scoped_collections, key=str):
+            mapped_fields, template_fields = self.get_mapped_fields(collection)
+            instances = self.database.filter(
+                collection=collection,
+                filter=filter,
+                mapped_fields=["id", *mapped_fields],
+                lock_result=True,
+            )
+            self.fetch_structured_fields(collection, instances, template_fields)
+            for id, instance in instances.items():
+                fqid = FullQualifiedId(collection, id)
+                if not isinstance(
+                    self.additional_relation_models.get(fqid), DeletedModel
+                ):
+                    result[fqid] = instance
+        return result
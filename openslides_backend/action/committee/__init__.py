@@ -1,6 +1,5 @@
 from ..base import DummyAction
 from ..register import register_action
-from . import create  # noqa
 
 
 @register_action("committee.update")
@@ -1,7 +1,9 @@
 from typing import Any, Dict, Iterable, List, Type
 
-from ..shared.interfaces import WriteRequestElement
+from ..services.datastore.interface import Datastore
+from ..shared.interfaces import Permission, WriteRequestElement
 from ..shared.patterns import FullQualifiedId
+from ..shared.typing import ModelMap, ModelOverlay
 from .base import Action, DataSet
 from .generics import CreateAction
 
@@ -9,6 +11,9 @@ from .generics import CreateAction
 class CreateActionWithDependencies(CreateAction):
     """
     A CreateAction which has dependant actions which should be executed for each item.
+    Each dependant action is executed once with the payload for all items. If
+    the payload is handled in batches, the dependant actions are kept, so that
+    their modified relation fields build on the previous batches.
     """
 
     dependencies: List[Type[Action]]
@@ -16,42 +21,57 @@ class CreateActionWithDependencies(CreateAction):
     A list of actions which should be executed together with this create action.
     """
 
+    def __init__(
+        self,
+        permission: Permission,
+        database: Datastore,
+        additional_relation_models: ModelMap = {},
+    ) -> None:
+        super().__init__(permission, database, additional_relation_models)
+        self.dependent_actions: Dict[Type[Action], Action] = {}
+
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
         # Yield write request elements of this create action.
         yield from super().create_write_request_elements(dataset)
 
+        # Stack the new instances on top of the additional_relation_models for
+        # possible nesting. This does not copy the models of outer actions.
+        new_models = {}
         for element in dataset["data"]:
-            # Merge additional_relation_models for possible nesting.
-            additional_relation_models = {
-                **self.additional_relation_models,
-                FullQualifiedId(self.model.collection, element["new_id"]): element[
-                    "instance"
-                ],
-            }
-            for ActionClass in self.dependencies:
-                special_check_method_name = "check_dependant_action_execution_" + str(
-                    ActionClass.model.collection
-                )
-                check_method = getattr(
-                    self,
-                    special_check_method_name,
-                    self.check_dependant_action_execution,
-                )
-                if not check_method(element, ActionClass):
-                    continue
-                special_payload_method_name = "get_dependent_action_payload_" + str(
-                    ActionClass.model.collection
-                )
-                payload_method = getattr(
-                    self, special_payload_method_name, self.get_dependent_action_payload
-                )
-                payload = [payload_method(element, ActionClass)]
-                action = ActionClass(
+            fqid = FullQualifiedId(self.model.collection, element["new_id"])
+            new_models[fqid] = element["instance"]
+        overlay = ModelOverlay.from_model_map(self.additional_relation_models)
+        additional_relation_models = overlay.child(new_models)
+        for ActionClass in self.dependencies:
+            special_check_method_name = "check_dependant_action_execution_" + str(
+                ActionClass.model.collection
+            )
+            check_method = getattr(
+                self, special_check_method_name, self.check_dependant_action_execution,
+            )
+            special_payload_method_name = "get_dependent_action_payload_" + str(
+                ActionClass.model.collection
+            )
+            payload_method = getattr(
+                self, special_payload_method_name, self.get_dependent_action_payload
+            )
+            payload = [
+                payload_method(element, ActionClass)
+                for element in dataset["data"]
+                if check_method(element, ActionClass)
+            ]
+            if not payload:
+                continue
+            action = self.dependent_actions.get(ActionClass)
+            if action is None:
+                action = self.dependent_actions[ActionClass] = ActionClass(
                     self.permission, self.database, additional_relation_models,
                 )
-                yield from action.perform(payload, self.user_id)
+            else:
+                action.additional_relation_models = additional_relation_models
+            yield from action.perform_internal(payload, self.user_id)
 
     def check_dependant_action_execution(
         self, element: Dict[str, Any], CreateActionClass: Type[Action]
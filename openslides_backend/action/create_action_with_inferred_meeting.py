@@ -1,8 +1,13 @@
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
 from ..models.fields import BaseGenericRelationField, BaseRelationField
+from ..services.datastore.interface import Datastore
 from ..shared.exceptions import ActionException
-from ..shared.patterns import FullQualifiedId
+from ..shared.interfaces import Permission
+from ..shared.patterns import FullQualifiedId, string_to_fqid
+from ..shared.typing import ModelMap
+from .action_interface import ActionPayload
+from .base import DataSet
 from .generics import CreateAction
 
 
@@ -10,30 +15,63 @@ class CreateActionWithInferredMeetingMixin(CreateAction):
     """
     Mixin to autmatically set the meeting_id on create if it's not given in the payload.
     The given relation_field_for_meeting must be a relation field.
+
+    The meeting ids of all models referenced in the payload are fetched at once
+    before the instances are prepared.
     """
 
     relation_field_for_meeting: str
 
+    def __init__(
+        self,
+        permission: Permission,
+        database: Datastore,
+        additional_relation_models: ModelMap = {},
+    ) -> None:
+        super().__init__(permission, database, additional_relation_models)
+        self.inferred_meeting_ids: Dict[FullQualifiedId, Optional[int]] = {}
+
+    def prepare_dataset(self, payload: ActionPayload) -> DataSet:
+        fqids = [
+            self.get_fqid_for_meeting(instance[self.relation_field_for_meeting])
+            for instance in payload
+            if instance.get(self.relation_field_for_meeting) is not None
+        ]
+        self.inferred_meeting_ids = {
+            fqid: related_model.get("meeting_id")
+            for fqid, related_model in self.fetch_models(fqids, ["meeting_id"]).items()
+        }
+        return super().prepare_dataset(payload)
+
     def update_instance_with_meeting_id(
         self, instance: Dict[str, Any]
     ) -> Dict[str, Any]:
-        field = self.model.get_field(self.relation_field_for_meeting)
-        assert isinstance(field, BaseRelationField)
-        id = instance[self.relation_field_for_meeting]
-        if isinstance(field, BaseGenericRelationField):
-            fqid = id
+        fqid = self.get_fqid_for_meeting(instance[self.relation_field_for_meeting])
+        if fqid in self.inferred_meeting_ids:
+            meeting_id = self.inferred_meeting_ids[fqid]
         else:
-            assert not isinstance(field.to, list)  # for mypy
-            fqid = FullQualifiedId(field.to, id)
-        # Fetch meeting_id
-        related_model = self.fetch_model(fqid, ["meeting_id"])
-        if not related_model.get("meeting_id"):
+            meeting_id = self.fetch_model(fqid, ["meeting_id"]).get("meeting_id")
+        if not meeting_id:
             raise ActionException(
-                f"Referenced model in field {self.relation_field_for_meeting} has no meeting id."
+                f"Referenced model {fqid} in field {self.relation_field_for_meeting} has no meeting id."
             )
-        instance["meeting_id"] = related_model["meeting_id"]
+        instance["meeting_id"] = meeting_id
         return instance
 
+    def get_fqid_for_meeting(self, value: Any) -> FullQualifiedId:
+        """
+        Returns the fqid referenced by the given value of the
+        relation_field_for_meeting. Generic values may still be strings.
+        """
+        field = self.model.get_field(self.relation_field_for_meeting)
+        assert isinstance(field, BaseRelationField)
+        if isinstance(field, BaseGenericRelationField):
+            if isinstance(value, str):
+                return string_to_fqid(value)
+            return value
+        assert not isinstance(field.to, list)  # for mypy
+        return FullQualifiedId(field.to, value)
+
 
 class CreateActionWithInferredMeeting(
     CreateActionWithInferredMeetingMixin, CreateAction
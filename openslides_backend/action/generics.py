@@ -1,19 +1,13 @@
 from collections import defaultdict
-from copy import deepcopy
 from typing import Any, Dict, Iterable, List, Set, Tuple, Type
 
-from ..models.fields import (
-    BaseGenericRelationField,
-    BaseRelationField,
-    BaseTemplateRelationField,
-    OnDelete,
-)
+from ..models.fields import BaseTemplateRelationField
 from ..shared.exceptions import ActionException
 from ..shared.interfaces import Event, WriteRequestElement
 from ..shared.patterns import ID_PATTERN, FullQualifiedId
-from ..shared.typing import DeletedModel, ModelMap
 from .actions_map import actions_map
-from .base import Action, ActionPayload, DataSet, merge_write_request_elements
+from .base import Action, ActionPayload, DataSet, WriteRequestBuilder
+from .cascade_delete import CascadeDeletePlanner, DeletePlan
 
 
 class GenericBaseAction(Action):
@@ -98,10 +92,7 @@ class CreateAction(GenericBaseAction):
         return {"data": data}
 
     def set_defaults(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        for field_name, field in self.model.get_fields():
-            if field_name not in instance.keys() and field.default is not None:
-                instance[field_name] = field.default
-        return instance
+        return self.model.set_defaults(instance)
 
     def create_write_request_elements(
         self, dataset: DataSet
@@ -286,16 +277,26 @@ class UpdateAction(GenericBaseAction):
         )
 
 
+CASCADE_HOOKS = ("get_updated_instances", "update_instance")
+"""
+Hooks of the DeleteAction which are only called for the directly deleted
+models.
+"""
+
+
 class DeleteAction(GenericBaseAction):
     """
     Generic delete action.
     """
 
-    additional_write_requests: List[WriteRequestElement]
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self.additional_write_requests = []
+    planner_class: Type[CascadeDeletePlanner] = CascadeDeletePlanner
+    cascade_skipped_hooks: Tuple[str, ...] = ()
+    """
+    Overridden hooks of this action which may be skipped if the deletion is
+    cascaded from another model. Cascaded deletions are planned as a whole, so
+    CASCADE_HOOKS of the cascaded collections are never called. Any other
+    override of them is rejected.
+    """
 
     def prepare_dataset(self, payload: ActionPayload) -> DataSet:
         return self.delete_action_prepare_dataset(payload)
@@ -304,129 +305,52 @@ class DeleteAction(GenericBaseAction):
         """
         Prepares dataset from payload.
 
-        If protected reverse relations are not empty, raises ActionException inside the
-        get_relations method. Else uses the input and calculates (reverse) relations.
+        Uses the CascadeDeletePlanner to calculate all models to be deleted
+        (including CASCADE relations) and all relation fields of remaining models
+        to be reset. If protected reverse relations are not empty, the planner
+        raises an ActionException.
         """
-
-        data = []
+        ids = []
         for instance in self.get_updated_instances(payload):
             # TODO: Check if instance exists in DB and is not deleted. Ensure that meta_deleted field is added to locked_fields.
 
             # Update instance (by default this does nothing)
             instance = self.update_instance(instance)
+            ids.append(instance["id"])
 
-            # fetch db instance with all relevant fields
-            relevant_fields = [
-                field_name
-                for field_name, field in self.model.get_relation_fields()
-                if field.on_delete != OnDelete.SET_NULL
-            ]
-            db_instance = self.database.get(
-                fqid=FullQualifiedId(self.model.collection, instance["id"]),
-                mapped_fields=relevant_fields,
-                lock_result=True,
-            )
+        planner = self.planner_class(self.database, self.additional_relation_models)
+        plan = planner.plan(self.model, ids)
 
-            # Collect relation fields and also update instance and set
-            # all relation fields to None.
-            relation_fields: List[Tuple[str, BaseRelationField]] = []
-            # Gather all delete actions with payload and also all models to be deleted
-            delete_actions: List[Tuple[Type[Action], ActionPayload]] = []
-            additional_relation_models: ModelMap = deepcopy(
-                self.additional_relation_models
-            )
-            for field_name, field in self.model.get_relation_fields():
-                if field.structured_relation or field.structured_tag:
-                    # TODO: We do not fully support these fields. So silently skip them.
-                    continue
-                # Check on_delete.
-                if field.on_delete != OnDelete.SET_NULL:
-                    if isinstance(field, BaseTemplateRelationField):
-                        # We currently do not support such template fields.
-                        raise NotImplementedError
-
-                    # Extract all foreign keys as fqids from the model
-                    foreign_fqids = db_instance.get(field_name, [])
-                    if not isinstance(foreign_fqids, list):
-                        foreign_fqids = [foreign_fqids]
-                    if not isinstance(field, BaseGenericRelationField):
-                        assert not isinstance(field.to, list)
-                        foreign_fqids = [
-                            FullQualifiedId(field.to, id) for id in foreign_fqids
-                        ]
-
-                    if field.on_delete == OnDelete.PROTECT:
-                        for fqid in foreign_fqids:
-                            if not isinstance(
-                                self.additional_relation_models.get(fqid), DeletedModel
-                            ):
-                                raise ActionException(
-                                    f"You can not delete {self.model} with id {instance['id']}, "
-                                    f"because you have to delete the related {str(field.to)} first."
-                                )
-                    else:
-                        # field.on_delete == OnDelete.CASCADE
-                        # Extract all foreign keys as fqids from the model
-                        value = db_instance.get(field_name, [])
-                        foreign_fqids = self.get_field_value_as_fqid_list(field, value)
-
-                        # Execute the delete action for all fqids
-                        for fqid in foreign_fqids:
-                            delete_action_class = actions_map.get(
-                                f"{str(fqid.collection)}.delete"
-                            )
-                            if not delete_action_class:
-                                raise ActionException(
-                                    f"Can't cascade the delete action to {str(fqid.collection)} "
-                                    "since no delete action was found."
-                                )
-                            # Assume that the delete action uses the standard payload
-                            payload = [{"id": fqid.id}]
-                            delete_actions.append((delete_action_class, payload))
-                            additional_relation_models[fqid] = DeletedModel()
-                else:
-                    # field.on_delete == OnDelete.SET_NULL
-                    if isinstance(field, BaseTemplateRelationField):
-                        raw_field_name = (
-                            field_name[: field.index] + "$" + field_name[field.index :]
-                        )
-                        db_instance = self.database.get(
-                            fqid=FullQualifiedId(self.model.collection, instance["id"]),
-                            mapped_fields=[raw_field_name],
-                            lock_result=True,
-                        )
-                        for replacement in db_instance.get(raw_field_name, []):
-                            structured_field_name = (
-                                field_name[: field.index]
-                                + replacement
-                                + field_name[field.index :]
-                            )
-                            instance[structured_field_name] = None
-                            relation_fields.append((structured_field_name, field))
-                    else:
-                        instance[field_name] = None
-                        relation_fields.append((field_name, field))
-
-            # Add additional relation models and execute all previously gathered delete actions
-            for delete_action_class, payload in delete_actions:
-                delete_action = delete_action_class(
-                    self.permission, self.database, additional_relation_models
-                )
-                self.additional_write_requests.extend(
-                    delete_action.perform(payload, self.user_id)
+        # Check that all cascaded models can be deleted. The cascaded deletions
+        # are dispatched internally, so their permissions are not checked again.
+        for collection in plan.get_deleted_ids().keys():
+            if collection == self.model.collection:
+                continue
+            action_class = actions_map.get(f"{str(collection)}.delete")
+            if not action_class:
+                raise ActionException(
+                    f"Can't cascade the delete action to {str(collection)} "
+                    "since no delete action was found."
                 )
+            self.check_cascade_hooks(action_class)
 
-            # Get relations.
-            relations = self.get_relations(
-                model=self.model,
-                id=instance["id"],
-                obj=instance,
-                relation_fields=relation_fields,
-            )
-
-            data.append({"instance": instance, "relations": relations})
+        return {"data": plan}
 
-        return {"data": data}
+    def check_cascade_hooks(self, action_class: Type[Action]) -> None:
+        """
+        Raises an ActionException if the given delete action overrides one of
+        the CASCADE_HOOKS without listing it in cascade_skipped_hooks.
+        """
+        skipped_hooks = getattr(action_class, "cascade_skipped_hooks", ())
+        for hook in CASCADE_HOOKS:
+            if (
+                getattr(action_class, hook, None) is not getattr(DeleteAction, hook)
+                and hook not in skipped_hooks
+            ):
+                raise ActionException(
+                    f"Can't cascade the delete action to {str(action_class.model.collection)} "
+                    f"since {action_class.__name__}.{hook} would be skipped."
+                )
 
     def create_write_request_elements(
         self, dataset: DataSet
@@ -436,39 +360,17 @@ class DeleteAction(GenericBaseAction):
     def delete_action_create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
-        write_request_element = merge_write_request_elements(
-            self.additional_write_requests
-            + [element for element in super().create_write_request_elements(dataset)]
-        )
-        # remove double entries and updates for deleted models
-        events: List[Event] = []
-        deleted: List[FullQualifiedId] = []
-        for event in write_request_element["events"]:
-            if event["fqid"] in deleted:
-                continue
-            if event["type"] == "delete":
-                deleted.append(event["fqid"])
-            events.append(event)
-        write_request_element["events"] = events
-        return [write_request_element]
-
-    def create_instance_write_request_element(
-        self, element: Any
-    ) -> WriteRequestElement:
-        return self.delete_action_create_instance_write_request_element(element)
-
-    def delete_action_create_instance_write_request_element(
-        self, element: Any
-    ) -> WriteRequestElement:
         """
-        Creates a write request element for one instance of the current model.
-
-        Just prepares a write request element with delete event for the given
-        instance.
+        Creates one write request element with delete events for all deleted models
+        and update events for all remaining models with reset relation fields.
         """
-        fqid = FullQualifiedId(self.model.collection, element["instance"]["id"])
-        information = {fqid: ["Object deleted"]}
-        event = Event(type="delete", fqid=fqid)
-        return WriteRequestElement(
-            events=[event], information=information, user_id=self.user_id
-        )
+        plan: DeletePlan = dataset["data"]
+        builder = WriteRequestBuilder(self.user_id)
+        for fqid in plan.deleted.keys():
+            builder.add_event(Event(type="delete", fqid=fqid), ["Object deleted"])
+        for fqid, fields in plan.updates.items():
+            builder.add_event(
+                Event(type="update", fqid=fqid, fields=fields), plan.information[fqid]
+            )
+        if not builder.is_empty():
+            yield builder.build()
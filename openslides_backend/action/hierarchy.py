@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..services.datastore.interface import Datastore, PartialModel
+from ..shared.filters import FilterOperator
+from ..shared.patterns import Collection
+
+HIERARCHY_FIELDS: Dict[str, Tuple[str, str]] = {
+    "agenda_item": ("parent_id", "child_ids"),
+    "motion": ("sort_parent_id", "sort_child_ids"),
+    "motion_category": ("parent_id", "child_ids"),
+    "mediafile": ("parent_id", "child_ids"),
+}
+"""
+Parent and children fields of all hierarchical collections.
+"""
+
+
+class Hierarchy:
+    """
+    In-memory index of the parent/children structure of all instances of a
+    hierarchical collection in one meeting. It is loaded with one filter
+    request, so ancestors, cycles and subtrees can be checked without further
+    datastore calls.
+    """
+
+    def __init__(
+        self,
+        instances: Dict[int, PartialModel],
+        parent_id_key: str,
+        children_ids_key: str,
+    ) -> None:
+        self.instances = instances
+        self.parent_ids: Dict[int, Optional[int]] = {}
+        self.child_ids: Dict[int, List[int]] = {}
+        for id, instance in instances.items():
+            self.parent_ids[id] = instance.get(parent_id_key)
+            self.child_ids[id] = list(instance.get(children_ids_key) or [])
+
+    @classmethod
+    def load(
+        cls,
+        database: Datastore,
+        collection: Collection,
+        meeting_id: Optional[int],
+        mapped_fields: List[str] = [],
+    ) -> "Hierarchy":
+        """
+        Loads the hierarchy of the collection in the given meeting. Additional
+        fields can be fetched in the same request via mapped_fields.
+        """
+        parent_id_key, children_ids_key = HIERARCHY_FIELDS[str(collection)]
+        instances = database.filter(
+            collection=collection,
+            filter=FilterOperator("meeting_id", "=", meeting_id),
+            mapped_fields=["id", parent_id_key, children_ids_key, *mapped_fields],
+            lock_result=True,
+        )
+        return cls(instances, parent_id_key, children_ids_key)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self.instances
+
+    def get_ancestors(self, id: int) -> List[int]:
+        """
+        Returns the ids of all ancestors of the given instance, beginning with its
+        parent. Stops at parents outside of the hierarchy and at cycles.
+        """
+        ancestors: List[int] = []
+        seen = {id}
+        parent_id = self.parent_ids.get(id)
+        while parent_id is not None and parent_id not in seen:
+            ancestors.append(parent_id)
+            seen.add(parent_id)
+            parent_id = self.parent_ids.get(parent_id)
+        return ancestors
+
+    def is_ancestor(self, ancestor_id: int, id: int) -> bool:
+        return ancestor_id in self.get_ancestors(id)
+
+    def get_descendants(self, ids: Iterable[int]) -> List[int]:
+        """
+        Returns the ids of all descendants of the given instances in preorder.
+        Each id is returned only once and the given ids are not included.
+        """
+        ids = list(ids)
+        descendants: List[int] = []
+        seen = set(ids)
+        stack = [child_id for id in ids for child_id in self.get_child_ids(id)]
+        stack.reverse()
+        while stack:
+            id = stack.pop()
+            if id in seen:
+                continue
+            seen.add(id)
+            descendants.append(id)
+            stack.extend(reversed(self.get_child_ids(id)))
+        return descendants
+
+    def get_child_ids(self, id: int) -> List[int]:
+        return self.child_ids.get(id, [])
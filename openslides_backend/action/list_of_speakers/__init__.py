@@ -1 +0,0 @@
-from . import delete, delete_all_speakers, re_add_last, update  # noqa
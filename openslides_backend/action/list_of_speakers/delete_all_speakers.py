@@ -24,11 +24,17 @@ class ListOfSpeakersDeleteAllSpeakersAction(Action):
 
     def prepare_dataset(self, payload: ActionPayload) -> DataSet:
         data = []
+        lists_of_speakers = self.fetch_models(
+            [
+                FullQualifiedId(self.model.collection, instance["id"])
+                for instance in payload
+            ],
+            mapped_fields=["speaker_ids"],
+        )
         for instance in payload:
-            list_of_speakers = self.fetch_model(
-                FullQualifiedId(self.model.collection, instance["id"]),
-                mapped_fields=["speaker_ids"],
-            )
+            list_of_speakers = lists_of_speakers[
+                FullQualifiedId(self.model.collection, instance["id"])
+            ]
             if not list_of_speakers.get("speaker_ids"):
                 raise ActionException(
                     f"List of speakers {instance['id']} has no speakers."
@@ -39,9 +45,12 @@ class ListOfSpeakersDeleteAllSpeakersAction(Action):
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
-        for element in dataset["data"]:
-            action = SpeakerDeleteAction(self.permission, self.database)
-            yield from action.perform(
-                [{"id": speaker_id} for speaker_id in element["speaker_ids"]],
-                self.user_id,
-            )
+        action = SpeakerDeleteAction(self.permission, self.database)
+        yield from action.perform_internal(
+            [
+                {"id": speaker_id}
+                for element in dataset["data"]
+                for speaker_id in element["speaker_ids"]
+            ],
+            self.user_id,
+        )
@@ -2,16 +2,15 @@ from typing import Iterable
 
 from ...models.models import ListOfSpeakers
 from ...shared.exceptions import ActionException
-from ...shared.filters import FilterOperator
-from ...shared.patterns import Collection, FullQualifiedId
-from ..base import Action, ActionPayload, DataSet, WriteRequestElement
+from ..base import ActionPayload, DataSet, WriteRequestElement
 from ..default_schema import DefaultSchema
 from ..register import register_action
 from ..speaker.create_update_delete import SpeakerCreateAction
+from ..speaker.speaker_queue import SpeakerQueueMixin
 
 
 @register_action("list_of_speakers.re_add_last")
-class ListOfSpeakersReAddLastAction(Action):
+class ListOfSpeakersReAddLastAction(SpeakerQueueMixin):
     """
     Action to re-add the last speaker to the list.
     """
@@ -25,44 +24,35 @@ class ListOfSpeakersReAddLastAction(Action):
 
     def prepare_dataset(self, payload: ActionPayload) -> DataSet:
         data = []
+        queues = self.load_speaker_queues(
+            (instance["id"] for instance in payload),
+            mapped_fields=["end_time", "user_id"],
+        )
         for instance in payload:
-            list_of_speakers = self.fetch_model(
-                FullQualifiedId(self.model.collection, instance["id"]),
-                mapped_fields=["id", "speaker_ids"],
-            )
-            if not list_of_speakers.get("speaker_ids"):
+            queue = queues[instance["id"]]
+            if not queue.speakers:
                 raise ActionException(
                     f"List of speakers {instance['id']} has no speakers."
                 )
-            filter_obj = FilterOperator("end_time", ">", 0)
-            speakers = sorted(
-                self.database.filter(
-                    Collection("speaker"),
-                    filter_obj,
-                    mapped_fields=["end_time", "user_id"],
-                    lock_result=True,
-                ).values(),
-                key=lambda speaker: speaker["end_time"],
-                reverse=True,
-            )
-            if not speakers:
+            last_speaker = queue.last_finished
+            if last_speaker is None:
                 raise ActionException("There is no last speaker that can be re-added.")
             data.append(
-                {"list_of_speakers": list_of_speakers, "last_speaker": speakers[0]}
+                {"list_of_speakers_id": instance["id"], "last_speaker": last_speaker}
             )
         return {"data": data}
 
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
-        for element in dataset["data"]:
-            action = SpeakerCreateAction(self.permission, self.database)
-            yield from action.perform(
-                [
-                    {
-                        "list_of_speakers_id": element["list_of_speakers"]["id"],
-                        "user_id": element["last_speaker"]["user_id"],
-                    }
-                ],
-                self.user_id,
-            )
+        action = SpeakerCreateAction(self.permission, self.database)
+        yield from action.perform_internal(
+            [
+                {
+                    "list_of_speakers_id": element["list_of_speakers_id"],
+                    "user_id": element["last_speaker"]["user_id"],
+                }
+                for element in dataset["data"]
+            ],
+            self.user_id,
+        )
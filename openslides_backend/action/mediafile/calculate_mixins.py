@@ -1,11 +1,19 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..base import BaseAction
+from ..hierarchy import Hierarchy
+
+ACCESS_GROUP_FIELDS = [
+    "access_group_ids",
+    "has_inherited_access_groups",
+    "inherited_access_group_ids",
+]
 
 
 class MediafileCalculatedFieldsMixin(BaseAction):
     """
-    provides calculate_inherited_groups(id)
+    provides calculate_inherited_groups(id) and
+    calculate_inherited_groups_in_subtrees(hierarchy, access_group_ids)
     """
 
     def calculate_inherited_groups(
@@ -34,3 +42,64 @@ class MediafileCalculatedFieldsMixin(BaseAction):
             parent["has_inherited_access_groups"]
         )
         return has_inherited_access_groups, inherited_access_group_ids
+
+    def calculate_inherited_groups_in_subtrees(
+        self, hierarchy: Hierarchy, access_group_ids: Dict[int, List[int]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Recalculates the inherited access groups of the given mediafiles, which
+        get the given access_group_ids, and of all their descendants in memory.
+        The hierarchy has to be loaded with the ACCESS_GROUP_FIELDS. Parents are
+        taken from the hierarchy, so moved mediafiles have to be updated there
+        before.
+
+        Returns the calculated fields of the given mediafiles and of all
+        descendants whose fields changed. Subtrees below unchanged mediafiles
+        are skipped.
+        """
+        result: Dict[int, Dict[str, Any]] = {}
+
+        def get_values(
+            id_: Optional[int],
+        ) -> Tuple[Optional[bool], Optional[List[int]]]:
+            if id_ is None:
+                return None, None
+            if id_ in result:
+                instance = result[id_]
+            else:
+                instance = hierarchy.instances.get(id_, {})
+            return (
+                instance.get("has_inherited_access_groups"),
+                instance.get("inherited_access_group_ids"),
+            )
+
+        # Handle parents before their children.
+        start_ids = sorted(
+            access_group_ids, key=lambda id_: len(hierarchy.get_ancestors(id_))
+        )
+        for start_id in start_ids:
+            if start_id in result:
+                continue
+            stack = [start_id]
+            while stack:
+                id_ = stack.pop()
+                instance = hierarchy.instances.get(id_, {})
+                (
+                    has_inherited_access_groups,
+                    inherited_access_group_ids,
+                ) = self.calculate_inherited_groups(
+                    id_,
+                    access_group_ids.get(id_, instance.get("access_group_ids") or []),
+                    *get_values(hierarchy.parent_ids.get(id_)),
+                )
+                if id_ not in access_group_ids and (
+                    instance.get("has_inherited_access_groups"),
+                    instance.get("inherited_access_group_ids"),
+                ) == (has_inherited_access_groups, inherited_access_group_ids):
+                    continue
+                result[id_] = {
+                    "has_inherited_access_groups": has_inherited_access_groups,
+                    "inherited_access_group_ids": inherited_access_group_ids,
+                }
+                stack.extend(reversed(hierarchy.get_child_ids(id_)))
+        return result
@@ -1,10 +1,11 @@
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable
 
 from ...models.models import Mediafile
-from ...shared.patterns import Collection, FullQualifiedId
+from ...shared.patterns import FullQualifiedId
 from ..base import ActionPayload
 from ..default_schema import DefaultSchema
 from ..generics import DeleteAction
+from ..hierarchy import Hierarchy
 from ..register import register_action
 
 
@@ -16,21 +17,29 @@ class MediafileDelete(DeleteAction):
 
     model = Mediafile()
     schema = DefaultSchema(Mediafile()).get_delete_schema()
+    # Mediafiles are only cascaded if their meeting is deleted. Then all
+    # descendants are deleted, too.
+    cascade_skipped_hooks = ("get_updated_instances",)
 
     def get_updated_instances(self, payload: ActionPayload) -> Iterable[Dict[str, Any]]:
-        new_payload = []
-        for instance in payload:
-            new_payload.extend(
-                [{"id": id_} for id_ in self.get_tree_ids(instance["id"])]
+        """
+        Adds all descendants of the given mediafiles. The mediafiles of the
+        affected meetings are loaded at once and the subtrees are collected in
+        memory. All mediafiles are deleted together, so relations between them
+        are not reset.
+        """
+        ids = list(dict.fromkeys(instance["id"] for instance in payload))
+        meeting_ids = {
+            mediafile.get("meeting_id")
+            for mediafile in self.fetch_models(
+                [FullQualifiedId(self.model.collection, id_) for id_ in ids],
+                ["meeting_id"],
+            ).values()
+        }
+        tree_ids = list(ids)
+        for meeting_id in meeting_ids:
+            hierarchy = Hierarchy.load(self.database, self.model.collection, meeting_id)
+            tree_ids.extend(
+                hierarchy.get_descendants(id_ for id_ in ids if id_ in hierarchy)
             )
-        return new_payload
-
-    def get_tree_ids(self, id_: int) -> List[int]:
-        tree_ids = [id_]
-        node = self.database.get(
-            FullQualifiedId(Collection("mediafile"), id_), ["child_ids"]
-        )
-        if node.get("child_ids"):
-            for child_id in node["child_ids"]:
-                tree_ids.extend(self.get_tree_ids(child_id))
-        return tree_ids
+        return [{"id": id_} for id_ in tree_ids]
@@ -1,12 +1,13 @@
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable
 
 from ...models.models import Mediafile
 from ...shared.patterns import FullQualifiedId
 from ..action_interface import ActionPayload
 from ..default_schema import DefaultSchema
 from ..generics import UpdateAction
+from ..hierarchy import Hierarchy
 from ..register import register_action
-from .calculate_mixins import MediafileCalculatedFieldsMixin
+from .calculate_mixins import ACCESS_GROUP_FIELDS, MediafileCalculatedFieldsMixin
 
 
 @register_action("mediafile.update")
@@ -25,94 +26,51 @@ class MediafileUpdate(UpdateAction, MediafileCalculatedFieldsMixin):
     ) -> Iterable[Dict[str, Any]]:
         """
         Calculate inherited_access_group_ids and inherited_access_group_ids, if
-        access_group_ids are given.
+        access_group_ids are given. The mediafiles of the affected meetings are
+        loaded at once and the fields of all descendants are recalculated in
+        memory.
         """
-        new_instances: ActionPayload = []
-        for instance in instances:
-            if instance.get("access_group_ids") is None:
-                new_instances.append(instance)
-                continue
-            mediafile = self.database.get(
-                FullQualifiedId(self.model.collection, instance["id"]), ["parent_id"]
-            )
-            if mediafile.get("parent_id"):
-                parent = self.database.get(
-                    FullQualifiedId(self.model.collection, mediafile["parent_id"]),
-                    ["has_inherited_access_groups", "inherited_access_group_ids"],
-                )
+        access_group_ids = {
+            instance["id"]: instance["access_group_ids"]
+            for instance in instances
+            if instance.get("access_group_ids") is not None
+        }
+        if not access_group_ids:
+            return instances
 
-                (
-                    instance["has_inherited_access_groups"],
-                    instance["inherited_access_group_ids"],
-                ) = self.calculate_inherited_groups(
-                    instance["id"],
-                    instance["access_group_ids"],
-                    parent.get("has_inherited_access_groups"),
-                    parent.get("inherited_access_group_ids"),
-                )
-                new_instances.append(instance)
-
-                # handle children
-                new_instances.extend(
-                    self.handle_children(
-                        instance,
-                        instance["has_inherited_access_groups"],
-                        instance["inherited_access_group_ids"],
-                    )
-                )
-            else:
-                instance["inherited_access_group_ids"] = instance["access_group_ids"]
-                instance["has_inherited_access_groups"] = bool(
-                    instance["inherited_access_group_ids"]
+        meeting_ids = {
+            mediafile.get("meeting_id")
+            for mediafile in self.fetch_models(
+                [
+                    FullQualifiedId(self.model.collection, id_)
+                    for id_ in access_group_ids
+                ],
+                ["meeting_id"],
+            ).values()
+        }
+        calculated: Dict[int, Dict[str, Any]] = {}
+        for meeting_id in meeting_ids:
+            hierarchy = Hierarchy.load(
+                self.database,
+                self.model.collection,
+                meeting_id,
+                mapped_fields=ACCESS_GROUP_FIELDS,
+            )
+            calculated.update(
+                self.calculate_inherited_groups_in_subtrees(
+                    hierarchy,
+                    {
+                        id_: group_ids
+                        for id_, group_ids in access_group_ids.items()
+                        if id_ in hierarchy
+                    },
                 )
-                new_instances.append(instance)
+            )
 
+        new_instances: ActionPayload = []
+        for instance in instances:
+            instance.update(calculated.pop(instance["id"], {}))
+            new_instances.append(instance)
+        for id_, fields in calculated.items():
+            new_instances.append({"id": id_, **fields})
         return new_instances
-
-    def handle_children(
-        self,
-        instance: Dict[str, Any],
-        parent_has_inherited_access_groups: Optional[bool],
-        parent_inherited_access_group_ids: Optional[List[int]],
-    ) -> ActionPayload:
-        result = []
-        mediafile = self.database.get(
-            FullQualifiedId(self.model.collection, instance["id"]), ["child_ids"]
-        )
-        if mediafile.get("child_ids"):
-            for child_id in mediafile["child_ids"]:
-                child = self.database.get(
-                    FullQualifiedId(self.model.collection, child_id),
-                    [
-                        "access_group_ids",
-                        "child_ids",
-                        "has_inherited_access_groups",
-                        "inherited_access_group_ids",
-                    ],
-                )
-                new_instance = {"id": child_id}
-                (
-                    new_instance["has_inherited_access_groups"],
-                    new_instance["inherited_access_group_ids"],
-                ) = self.calculate_inherited_groups(
-                    child_id,
-                    child.get("access_group_ids", []),
-                    parent_has_inherited_access_groups,
-                    parent_inherited_access_group_ids,
-                )
-
-                if (
-                    child.get("has_inherited_access_groups")
-                    != new_instance["has_inherited_access_groups"]
-                    or child.get("inherited_access_group_ids")
-                    != new_instance["inherited_access_group_ids"]
-                ):
-                    result.append(new_instance)
-                    result.extend(
-                        self.handle_children(
-                            new_instance,
-                            new_instance["has_inherited_access_groups"],
-                            new_instance["inherited_access_group_ids"],
-                        )
-                    )
-        return result
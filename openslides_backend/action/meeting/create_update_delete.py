@@ -1,6 +1,16 @@
+from typing import Iterable, List
+
 from ...models.models import Meeting
+from ...services.datastore.interface import Datastore
+from ...shared.interfaces import Event, Permission, WriteRequestElement
+from ...shared.patterns import FullQualifiedId
+from ...shared.typing import ModelMap
+from ..action_interface import ActionPayload
 from ..action_set import ActionSet
+from ..base import DataSet, WriteRequestBuilder
+from ..cascade_delete import DeletePlan, MeetingDeletePlanner
 from ..default_schema import DefaultSchema
+from ..generics import DeleteAction
 from ..register import register_action_set
 
 meeting_settings_keys = [
@@ -104,6 +114,44 @@ meeting_settings_keys = [
 ]
 
 
+class MeetingDelete(DeleteAction):
+    """
+    Deletes meetings in chunks. The write request of the request deletes the
+    meetings and resets all relation fields of remaining models which point
+    to the deleted models. After that no remaining model refers to the other
+    deleted models any more, so they are deleted afterwards with deferred
+    writes of chunk_size models each.
+    """
+
+    planner_class = MeetingDeletePlanner
+    chunk_size = 1000
+
+    def __init__(
+        self,
+        permission: Permission,
+        database: Datastore,
+        additional_relation_models: ModelMap = {},
+    ) -> None:
+        super().__init__(permission, database, additional_relation_models)
+        self.deferred_fqids: List[FullQualifiedId] = []
+
+    def prepare_dataset(self, payload: ActionPayload) -> DataSet:
+        dataset = super().prepare_dataset(payload)
+        plan: DeletePlan = dataset["data"]
+        for fqid in list(plan.deleted.keys()):
+            if fqid.collection != self.model.collection:
+                self.deferred_fqids.append(fqid)
+                del plan.deleted[fqid]
+        return dataset
+
+    def get_deferred_write_request_elements(self) -> Iterable[WriteRequestElement]:
+        for start in range(0, len(self.deferred_fqids), self.chunk_size):
+            builder = WriteRequestBuilder(self.user_id)
+            for fqid in self.deferred_fqids[start : start + self.chunk_size]:
+                builder.add_event(Event(type="delete", fqid=fqid), ["Object deleted"])
+            yield builder.build()
+
+
 @register_action_set("meeting")
 class MeetingActionSet(ActionSet):
     """
@@ -119,3 +167,5 @@ class MeetingActionSet(ActionSet):
         optional_properties=meeting_settings_keys
     )
     delete_schema = DefaultSchema(Meeting()).get_delete_schema()
+
+    DeleteActionClass = MeetingDelete
@@ -1,12 +0,0 @@
-from . import (  # noqa
-    create,
-    delete,
-    follow_recommendation,
-    reset_recommendation,
-    reset_state,
-    set_recommendation,
-    set_state,
-    sort,
-    update,
-    update_metadata,
-)
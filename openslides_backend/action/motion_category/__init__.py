@@ -1 +0,0 @@
-from . import create_update_delete, sort, sort_motions_in_categories  # noqa
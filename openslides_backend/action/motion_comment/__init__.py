@@ -1 +0,0 @@
-from . import create_delete_update  # noqa
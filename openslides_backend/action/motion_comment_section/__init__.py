@@ -1 +0,0 @@
-from . import create, delete, sort, update  # noqa
@@ -1,2 +0,0 @@
-from . import create_update_delete  # noqa
-from . import sort  # noqa
@@ -1 +0,0 @@
-from . import create, delete, sort  # noqa
@@ -16,6 +16,9 @@ class MotionWorkflowDeleteAction(DeleteAction):
 
     model = MotionWorkflow()
     schema = DefaultSchema(MotionWorkflow()).get_delete_schema()
+    # Workflows are only cascaded if their meeting is deleted. Then the default
+    # and last workflow may be deleted, too.
+    cascade_skipped_hooks = ("update_instance",)
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         """
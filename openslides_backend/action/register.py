@@ -1,4 +1,4 @@
-from typing import Callable, Type
+from typing import Callable, Optional, Type
 
 from .action_set import ActionSet
 from .actions_map import actions_map
@@ -14,7 +14,7 @@ def register_action(
     """
 
     def wrapper(clazz: Type[Action]) -> Type[Action]:
-        _register_action(name, clazz)
+        _register_action(name, clazz, clazz.__module__)
         clazz.internal = internal
         return clazz
 
@@ -32,15 +32,17 @@ def register_action_set(
     def wrapper(clazz: Type[ActionSet]) -> Type[ActionSet]:
         for route, action in clazz.get_actions().items():
             name = ".".join((name_prefix, route))
-            _register_action(name, action)
+            _register_action(name, action, clazz.__module__)
         return clazz
 
     return wrapper
 
 
-def _register_action(name: str, ActionClass: Type[Action]) -> Type[Action]:
-    if actions_map.get(name):
+def _register_action(
+    name: str, ActionClass: Type[Action], module: Optional[str] = None
+) -> Type[Action]:
+    if actions_map.is_registered(name):
         raise RuntimeError(f"Action {name} is registered twice.")
-    actions_map[name] = ActionClass
+    actions_map.register(name, ActionClass, module or ActionClass.__module__)
     ActionClass.name = name
     return ActionClass
@@ -1,6 +1,4 @@
-from typing import Any, Dict, Iterable, List, Set
-
-import fastjsonschema
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..models.base import Model
 from ..shared.exceptions import ActionException
@@ -8,7 +6,7 @@ from ..shared.filters import FilterOperator
 from ..shared.interfaces import Event, WriteRequestElement
 from ..shared.patterns import FullQualifiedId
 from ..shared.schema import schema_version
-from .base import Action, BaseAction, DataSet
+from .base import Action, BaseAction, DataSet, WriteRequestBuilder
 
 sort_node_schema = {
     "$schema": schema_version,
@@ -33,8 +31,6 @@ sort_node_schema = {
     "additionalProperties": False,
 }
 
-validate_sort_node = fastjsonschema.compile(sort_node_schema)
-
 
 class TreeSortMixin(BaseAction):
     """
@@ -57,27 +53,28 @@ class TreeSortMixin(BaseAction):
         with an id and optional children. Every id has to be given.
 
         This function traverses this tree in preorder to assign the weight.
+        Only the fields which differ from the current values in the datastore
+        are written. The tree itself is validated by the schema of the action.
         """
         # TODO: Check if instances exist in DB and is not deleted. Ensure that meta_deleted field is added to locked_fields.
 
-        # Get all item ids to verify, that the user send all ids.
+        # Get all items to verify, that the user send all ids, together with the
+        # current values to write only the changes.
         filter = FilterOperator("meeting_id", "=", meeting_id)
         db_instances = self.database.filter(
             collection=self.model.collection,
             filter=filter,
-            mapped_fields=["id"],
+            mapped_fields=["id", weight_key, parent_id_key, children_ids_key],
             lock_result=True,
         )
         all_model_ids = set(db_instances.keys())
 
-        # Setup initial node using a fake root node.
-        fake_root: Dict[str, Any] = {"id": None, "children": []}
-        fake_root["children"].extend(nodes)  # This will prevent mutating the nodes.
-
-        # The stack where all nodes to check are saved. Invariant: Each node
-        # must be a dict with an id, a parent id (may be None for the root
-        # layer) and a weight.
-        nodes_to_check = [fake_root]
+        # The stack where all nodes to check are saved together with their parent
+        # id (None for the root layer). Use reversed() because we use pop(), so
+        # this is LIFO and not FIFO.
+        nodes_to_check: List[Tuple[Dict[str, Any], Optional[int]]] = [
+            (node, None) for node in reversed(nodes)
+        ]
 
         # Traverse and check if every id is given, valid and there are no duplicate ids.
         ids_found: Set[int] = set()  # Set to save all found ids.
@@ -92,36 +89,28 @@ class TreeSortMixin(BaseAction):
 
         # Now walk through the tree.
         while len(nodes_to_check) > 0:
-            node = nodes_to_check.pop()
+            node, parent_id = nodes_to_check.pop()
             id = node["id"]
 
-            if id is not None:  # Exclude the fake_root
-                # Parse current node.
-                weight += 2
-                nodes_to_update[id] = {}
-                nodes_to_update[id][children_ids_key] = []
-                nodes_to_update[id][weight_key] = weight
-                parent_id = node.get(parent_id_key)
-                nodes_to_update[id][parent_id_key] = parent_id
-                if parent_id is not None:
-                    nodes_to_update[parent_id][children_ids_key].append(id)
-
-                # Check id.
-                if id in ids_found:
-                    raise ActionException(f"Duplicate id in sort tree: {id}")
-                if id not in all_model_ids:
-                    raise ActionException(f"Id in sort tree does not exist: {id}")
-                ids_found.add(id)
+            # Parse current node.
+            weight += 2
+            nodes_to_update[id] = {}
+            nodes_to_update[id][children_ids_key] = []
+            nodes_to_update[id][weight_key] = weight
+            nodes_to_update[id][parent_id_key] = parent_id
+            if parent_id is not None:
+                nodes_to_update[parent_id][children_ids_key].append(id)
+
+            # Check id.
+            if id in ids_found:
+                raise ActionException(f"Duplicate id in sort tree: {id}")
+            if id not in all_model_ids:
+                raise ActionException(f"Id in sort tree does not exist: {id}")
+            ids_found.add(id)
 
             # Add children if exist.
-            if node.get("children"):
-                node[
-                    "children"
-                ].reverse()  # Use reverse() because we use pop() some lines, so this is LIFO and not FIFO.
-                for child in node["children"]:
-                    validate_sort_node(child)
-                    child[parent_id_key] = id
-                    nodes_to_check.append(child)
+            for child in reversed(node.get("children", [])):
+                nodes_to_check.append((child, id))
 
         # Check if all ids are used.
         if len(all_model_ids) != len(ids_found):
@@ -129,19 +118,30 @@ class TreeSortMixin(BaseAction):
                 f"Did not recieve {len(all_model_ids)} ids, got {len(ids_found)}."
             )
 
-        return {"data": nodes_to_update}
+        # Keep only the changed fields.
+        changed_nodes: Dict[int, Dict[str, Any]] = {}
+        for id, instance in nodes_to_update.items():
+            db_instance = db_instances[id]
+            changed_fields = {
+                key: value
+                for key, value in instance.items()
+                if value != db_instance.get(key)
+            }
+            if changed_fields:
+                changed_nodes[id] = changed_fields
+        return {"data": changed_nodes}
 
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
+        builder = WriteRequestBuilder(self.user_id)
         for id, instance in dataset["data"].items():
             fqid = FullQualifiedId(self.model.collection, id)
-            information = {fqid: ["Object sorted"]}
             event = Event(type="update", fqid=fqid, fields=instance)
             # TODO: Lock some fields to protect against intermediate creation of new instances but care where exactly to lock them.
-            yield WriteRequestElement(
-                events=[event], information=information, user_id=self.user_id
-            )
+            builder.add_event(event, ["Object sorted"])
+        if not builder.is_empty():
+            yield builder.build()
 
 
 class LinearSortMixin(Action):
@@ -152,11 +152,15 @@ class LinearSortMixin(Action):
     def sort_linear(
         self, nodes: List, filter_id: int, filter_str: str, weight_key: str = "weight"
     ) -> DataSet:
+        """
+        Assigns the weights 1, 2, 3, ... to the instances in the given order.
+        Only instances whose weight changes are written.
+        """
         filter = FilterOperator(filter_str, "=", filter_id)
         db_instances = self.database.filter(
             collection=self.model.collection,
             filter=filter,
-            mapped_fields=["id"],
+            mapped_fields=["id", weight_key],
             lock_result=True,
         )
         valid_instance_ids = []
@@ -170,18 +174,19 @@ class LinearSortMixin(Action):
         data = dict()
         weight = 1
         for id_ in valid_instance_ids:
-            data[id_] = {weight_key: weight}
+            if db_instances[id_].get(weight_key) != weight:
+                data[id_] = {weight_key: weight}
             weight += 1
         return {"data": data}
 
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
+        builder = WriteRequestBuilder(self.user_id)
         for id, instance in dataset["data"].items():
             fqid = FullQualifiedId(self.model.collection, id)
-            information = {fqid: ["Object sorted"]}
             event = Event(type="update", fqid=fqid, fields=instance)
             # TODO: Lock some fields to protect against intermediate creation of new instances but care where exactly to lock them.
-            yield WriteRequestElement(
-                events=[event], information=information, user_id=self.user_id
-            )
+            builder.add_event(event, ["Object sorted"])
+        if not builder.is_empty():
+            yield builder.build()
@@ -1 +0,0 @@
-from . import create_update_delete, end_speech, sort, speak  # noqa
@@ -8,6 +8,7 @@ from ..base import ActionPayload
 from ..default_schema import DefaultSchema
 from ..generics import UpdateAction
 from ..register import register_action
+from .speaker_queue import is_speaking
 
 
 @register_action("speaker.end_speech")
@@ -24,12 +25,16 @@ class SpeakerEndSpeach(UpdateAction):
     )
 
     def get_updated_instances(self, payload: ActionPayload) -> Iterable[Dict[str, Any]]:
+        speakers = self.fetch_models(
+            [
+                FullQualifiedId(self.model.collection, instance["id"])
+                for instance in payload
+            ],
+            mapped_fields=["begin_time", "end_time"],
+        )
         for instance in payload:
-            speaker = self.fetch_model(
-                FullQualifiedId(self.model.collection, instance["id"]),
-                mapped_fields=["begin_time", "end_time"],
-            )
-            if speaker.get("begin_time") is None or speaker.get("end_time") is not None:
+            speaker = speakers[FullQualifiedId(self.model.collection, instance["id"])]
+            if not is_speaking(speaker):
                 raise ActionException(
                     f"Speaker {instance['id']} is not speaking at the moment."
                 )
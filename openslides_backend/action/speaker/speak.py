@@ -1,18 +1,18 @@
 import time
-from typing import Iterable
+from typing import Any, Dict, Iterable
 
 from ...models.models import Speaker
-from ...services.datastore.interface import GetManyRequest
 from ...shared.exceptions import ActionException
 from ...shared.interfaces import Event
-from ...shared.patterns import Collection, FullQualifiedId
-from ..base import Action, ActionPayload, DataSet, WriteRequestElement
+from ...shared.patterns import FullQualifiedId
+from ..base import ActionPayload, DataSet, WriteRequestBuilder, WriteRequestElement
 from ..default_schema import DefaultSchema
 from ..register import register_action
+from .speaker_queue import SpeakerQueueMixin
 
 
 @register_action("speaker.speak")
-class SpeakerSpeak(Action):
+class SpeakerSpeak(SpeakerQueueMixin):
     """
     Action to let speakers speak.
     """
@@ -25,57 +25,35 @@ class SpeakerSpeak(Action):
     )
 
     def prepare_dataset(self, payload: ActionPayload) -> DataSet:
-        data = []
+        speakers = self.fetch_models(
+            [
+                FullQualifiedId(self.model.collection, instance["id"])
+                for instance in payload
+            ],
+            mapped_fields=["list_of_speakers_id"],
+        )
+        queues = self.load_speaker_queues(
+            (speaker["list_of_speakers_id"] for speaker in speakers.values()),
+            mapped_fields=["begin_time", "end_time"],
+        )
+        now = round(time.time())
+        data: Dict[int, Dict[str, Any]] = {}
         for instance in payload:
-            this_speaker = self.fetch_model(
-                FullQualifiedId(self.model.collection, instance["id"]),
-                mapped_fields=["list_of_speakers_id"],
-            )
-            list_of_speakers = self.fetch_model(
-                FullQualifiedId(
-                    Collection("list_of_speakers"), this_speaker["list_of_speakers_id"]
-                ),
-                mapped_fields=["speaker_ids", "closed"],
-            )
-            if list_of_speakers.get("closed"):
+            fqid = FullQualifiedId(self.model.collection, instance["id"])
+            queue = queues[speakers[fqid]["list_of_speakers_id"]]
+            if queue.closed:
                 raise ActionException("The list of speakers is closed.")
-            gmr = GetManyRequest(
-                self.model.collection,
-                list_of_speakers["speaker_ids"],
-                ["begin_time", "end_time"],
-            )
-            speakers = self.database.get_many([gmr])
-            now = round(time.time())
-            current_speaker = None
-            for speaker_id, speaker in speakers[self.model.collection].items():
-                if speaker_id == instance["id"]:
-                    if speaker.get("begin_time") is not None:
-                        raise ActionException("Speaker has already started to speak.")
-                    assert speaker.get("end_time") is None
-                    instance["begin_time"] = now
-                    continue
-                if (
-                    speaker.get("begin_time") is not None
-                    and speaker.get("end_time") is None
-                ):
-                    assert current_speaker is None
-                    current_speaker = {
-                        "id": speaker_id,
-                        "end_time": now,
-                    }
-            data.append({"instance": instance, "current_speaker": current_speaker})
+            for id, fields in queue.start(instance["id"], now).items():
+                data.setdefault(id, {}).update(fields)
         return {"data": data}
 
     def create_write_request_elements(
         self, dataset: DataSet
     ) -> Iterable[WriteRequestElement]:
-        for element in dataset["data"]:
-            for item in ("instance", "current_speaker"):
-                if element.get(item):
-                    fqid = FullQualifiedId(self.model.collection, element[item]["id"])
-                    information = {fqid: ["Object updated"]}
-                    fields = {k: v for k, v in element[item].items() if k != "id"}
-                    event = Event(type="update", fqid=fqid, fields=fields)
-                    yield WriteRequestElement(
-                        events=[event], information=information, user_id=self.user_id
-                    )
+        builder = WriteRequestBuilder(self.user_id)
+        for id, fields in dataset["data"].items():
+            fqid = FullQualifiedId(self.model.collection, id)
+            event = Event(type="update", fqid=fqid, fields=fields)
+            builder.add_event(event, ["Object updated"])
+        if not builder.is_empty():
+            yield builder.build()
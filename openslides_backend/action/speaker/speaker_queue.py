@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from ...services.datastore.interface import PartialModel
+from ...shared.exceptions import ActionException
+from ...shared.patterns import Collection, FullQualifiedId
+from ..base import Action
+
+
+def is_speaking(speaker: PartialModel) -> bool:
+    return speaker.get("begin_time") is not None and speaker.get("end_time") is None
+
+
+class SpeakerQueue:
+    """
+    In-memory view of the speakers of one list of speakers. The current, the
+    next and the last finished speaker are determined once on load, so they can
+    be looked up without scanning the list again. Starting and ending speeches
+    updates the queue, so that several changes to the same list in one request
+    see each other.
+
+    Only the fields needed by the caller have to be loaded: begin_time and
+    end_time for the current speaker, additionally weight for the next one
+    and end_time for the last finished one.
+    """
+
+    def __init__(
+        self, list_of_speakers: PartialModel, speakers: Dict[int, PartialModel]
+    ) -> None:
+        self.list_of_speakers = list_of_speakers
+        self.speakers = {id: dict(speaker) for id, speaker in speakers.items()}
+        self.current_id: Optional[int] = None
+        self.last_finished_id: Optional[int] = None
+        waiting: List[int] = []
+        for id, speaker in self.speakers.items():
+            if speaker.get("end_time") is not None:
+                if self.last_finished_id is None or self.get_end_key(
+                    id
+                ) > self.get_end_key(self.last_finished_id):
+                    self.last_finished_id = id
+            elif speaker.get("begin_time") is not None:
+                self.current_id = id
+            else:
+                waiting.append(id)
+        waiting.sort(key=lambda id: (self.speakers[id].get("weight") or 0, id))
+        # Ordered by weight and indexed by id, so that speakers can be removed
+        # from any position in constant time.
+        self.waiting: "OrderedDict[int, None]" = OrderedDict.fromkeys(waiting)
+
+    def get_end_key(self, id: int) -> tuple:
+        return (self.speakers[id]["end_time"], id)
+
+    @property
+    def closed(self) -> bool:
+        return bool(self.list_of_speakers.get("closed"))
+
+    @property
+    def current(self) -> Optional[PartialModel]:
+        return self.get(self.current_id)
+
+    @property
+    def next(self) -> Optional[PartialModel]:
+        return self.get(next(iter(self.waiting), None))
+
+    @property
+    def last_finished(self) -> Optional[PartialModel]:
+        return self.get(self.last_finished_id)
+
+    def get(self, id: Optional[int]) -> Optional[PartialModel]:
+        if id is None:
+            return None
+        return self.speakers[id]
+
+    def start(self, id: int, now: int) -> Dict[int, Dict[str, int]]:
+        """
+        Lets the given speaker begin to speak and ends the speech of the
+        current speaker. Returns the changed fields per speaker id.
+        """
+        speaker = self.speakers.get(id)
+        if speaker is None:
+            raise ActionException(f"Speaker {id} is not in the list of speakers.")
+        if speaker.get("begin_time") is not None:
+            raise ActionException("Speaker has already started to speak.")
+        if id not in self.waiting:
+            raise ActionException("Speaker has already finished to speak.")
+        changes = self.end(now) if self.current_id is not None else {}
+        del self.waiting[id]
+        speaker["begin_time"] = now
+        self.current_id = id
+        changes[id] = {"begin_time": now}
+        return changes
+
+    def end(self, now: int) -> Dict[int, Dict[str, int]]:
+        """
+        Ends the speech of the current speaker. Returns the changed fields per
+        speaker id.
+        """
+        id = self.current_id
+        if id is None:
+            raise ActionException("There is no current speaker.")
+        self.speakers[id]["end_time"] = now
+        self.current_id = None
+        self.last_finished_id = id
+        return {id: {"end_time": now}}
+
+
+class SpeakerQueueMixin(Action):
+    """
+    Mixin to load the speaker queues of lists of speakers.
+    """
+
+    def load_speaker_queues(
+        self, list_of_speakers_ids: Iterable[int], mapped_fields: List[str]
+    ) -> Dict[int, SpeakerQueue]:
+        """
+        Loads the given lists of speakers with one request and all their
+        speakers with a second one. Only the given fields of the speakers are
+        fetched and locked, so that concurrent changes of other fields (e. g.
+        sorting) do not conflict.
+        """
+        lists_of_speakers = self.fetch_models(
+            [
+                FullQualifiedId(Collection("list_of_speakers"), id)
+                for id in list_of_speakers_ids
+            ],
+            mapped_fields=["speaker_ids", "closed"],
+        )
+        speakers = self.fetch_models(
+            [
+                FullQualifiedId(Collection("speaker"), speaker_id)
+                for list_of_speakers in lists_of_speakers.values()
+                for speaker_id in list_of_speakers.get("speaker_ids") or []
+            ],
+            mapped_fields=mapped_fields,
+        )
+        return {
+            fqid.id: SpeakerQueue(
+                list_of_speakers,
+                {
+                    speaker_id: speakers[
+                        FullQualifiedId(Collection("speaker"), speaker_id)
+                    ]
+                    for speaker_id in list_of_speakers.get("speaker_ids") or []
+                },
+            )
+            for fqid, list_of_speakers in lists_of_speakers.items()
+        }
@@ -27,6 +27,7 @@ class TopicCreate(
     """
 
     model = Topic()
+    batch_size = 100
     schema = DefaultSchema(Topic()).get_create_schema(
         required_properties=["meeting_id", "title"],
         optional_properties=["text", "attachment_ids"],
@@ -1,14 +1,5 @@
 from ..base import DummyAction
 from ..register import register_action
-from . import (  # noqa
-    create,
-    create_temporary,
-    delete,
-    delete_temporary,
-    update,
-    update_self,
-    update_temporary,
-)
 
 
 @register_action("user.reset_password")
@@ -11,6 +11,7 @@ class UserCreate(CreateAction):
     """
 
     model = User()
+    batch_size = 100
     schema = DefaultSchema(User()).get_create_schema(
         required_properties=["username"],
         optional_properties=[
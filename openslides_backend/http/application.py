@@ -1,7 +1,6 @@
 import re
-from typing import Any, Iterable, Union
+from typing import Any, Iterable, Optional, Union
 
-import simplejson as json
 from werkzeug.exceptions import BadRequest as WerkzeugBadRequest
 from werkzeug.wrappers import Request as WerkzeugRequest
 from werkzeug.wrappers import Response
@@ -10,7 +9,22 @@ from werkzeug.wrappers.json import JSONMixin
 from ..services.auth.adapter import AUTHENTICATION_HEADER
 from ..shared.exceptions import ViewException
 from ..shared.interfaces import StartResponse, WSGIEnvironment
-from .http_exceptions import BadRequest, Forbidden, HTTPException, MethodNotAllowed
+from ..shared.logging import PayloadSummary
+from .compression import CompressionMiddleware
+from .http_exceptions import (
+    BadRequest,
+    Forbidden,
+    HTTPException,
+    MethodNotAllowed,
+    RequestEntityTooLarge,
+)
+from .request_parsing import (
+    JSONStreamReader,
+    get_max_body_size,
+    get_max_elements,
+    iter_action_payload,
+)
+from .serialization import encode, get_response_body
 
 health_route = re.compile("^/health$")
 
@@ -36,6 +50,8 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug("Initialize OpenSlides Backend WSGI application.")
         self.view = view
         self.services = services
+        self.health_info_body: Optional[bytes] = None
+        self.compression = CompressionMiddleware(logging)
 
     def dispatch_request(self, request: Request) -> Union[Response, HTTPException]:
         """
@@ -44,8 +60,10 @@ class OpenSlidesBackendWSGIApplication:
         applications themselves.
         """
         if health_route.match(request.environ["RAW_URI"]):
-            return self.health_info(request)
-        return self.default_route(request)
+            return self.compression(
+                request, self.health_info(request), cache_key="health"
+            )
+        return self.compression(request, self.default_route(request))
 
     def default_route(self, request: Request) -> Union[Response, HTTPException]:
         """
@@ -54,18 +72,38 @@ class OpenSlidesBackendWSGIApplication:
         # Check request method
         if request.method != self.view.method:
             return MethodNotAllowed(valid_methods=[self.view.method])
-        self.logger.debug(f"Request method is {request.method}.")
+        self.logger.debug("Request method is %s.", request.method)
 
-        # Check mimetype and arse JSON body. The result is cached in request.json.
+        # Check mimetype and body size.
         if not request.is_json:
             return BadRequest(
                 "Wrong media type. Use 'Content-Type: application/json' instead."
             )
-        try:
-            request_body = request.get_json()
-        except WerkzeugBadRequest as exception:
-            return BadRequest(exception.description)
-        self.logger.debug(f"Request contains JSON: {request_body}.")
+        max_body_size = get_max_body_size()
+        if (
+            request.content_length is not None
+            and request.content_length > max_body_size
+        ):
+            return RequestEntityTooLarge(
+                f"Request body must not be larger than {max_body_size} bytes."
+            )
+
+        # Parse JSON body. Views which support it get an iterator which parses
+        # the body incrementally while it is consumed. Otherwise the result is
+        # cached in request.json.
+        request_body: Any
+        if self.view.stream_request_body:
+            reader = JSONStreamReader(request.stream, max_body_size)
+            request_body = iter_action_payload(reader, get_max_elements())
+            self.logger.debug("Request body is parsed incrementally.")
+        else:
+            try:
+                request_body = request.get_json()
+            except WerkzeugBadRequest as exception:
+                return BadRequest(exception.description)
+            self.logger.debug(
+                "Request contains JSON: %s.", PayloadSummary(request_body)
+            )
 
         # Dispatch view and return response.
         view_instance = self.view(self.logging, self.services)
@@ -78,6 +116,8 @@ class OpenSlidesBackendWSGIApplication:
                 return BadRequest(exception.message)
             elif exception.status_code == 403:
                 return Forbidden(exception.message)
+            elif exception.status_code == 413:
+                return RequestEntityTooLarge(exception.message)
             else:
                 text = (
                     f"Unknown ViewException with status_code {exception.status_code} "
@@ -86,9 +126,13 @@ class OpenSlidesBackendWSGIApplication:
                 self.logger.error(text)
                 raise
         self.logger.debug(
-            f"All done. Application sends HTTP 200 with body {response_body}."
+            "All done. Application sends HTTP 200 with body %s.",
+            PayloadSummary(response_body),
+        )
+        response = Response(
+            get_response_body(response_body, self.logger),
+            content_type="application/json",
         )
-        response = Response(json.dumps(response_body), content_type="application/json")
         if access_token is not None:
             response.headers[AUTHENTICATION_HEADER] = access_token
         return response
@@ -96,12 +140,13 @@ class OpenSlidesBackendWSGIApplication:
     def health_info(self, request: Request) -> Union[Response, HTTPException]:
         """
         Route to provide health data of this service. Retrieves status information
-        from respective view.
+        from respective view. The information does not change while the service
+        is running, so it is encoded only once per worker.
         """
-        health_info = self.view(self.logging, self.services).get_health_info()
-        return Response(
-            json.dumps({"healthinfo": health_info}), content_type="application/json",
-        )
+        if self.health_info_body is None:
+            health_info = self.view(self.logging, self.services).get_health_info()
+            self.health_info_body = encode({"healthinfo": health_info})
+        return Response(self.health_info_body, content_type="application/json")
 
     def wsgi_application(
         self, environ: WSGIEnvironment, start_response: StartResponse
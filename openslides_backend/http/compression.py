@@ -0,0 +1,169 @@
+import os
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from werkzeug.wrappers import Request, Response
+
+from ..shared.interfaces import LoggingModule
+from .http_exceptions import HTTPException
+
+COMPRESSION_VARIABLE = "OPENSLIDES_BACKEND_COMPRESSION"
+
+DEFAULT_COMPRESSION = "gzip,deflate"
+
+COMPRESSION_THRESHOLD_VARIABLE = "OPENSLIDES_BACKEND_COMPRESSION_THRESHOLD"
+
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+COMPRESSION_LEVEL_VARIABLE = "OPENSLIDES_BACKEND_COMPRESSION_LEVEL"
+
+DEFAULT_COMPRESSION_LEVEL = 6
+
+WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+"""
+Window bits for zlib per supported content coding. Adding 16 makes zlib write
+a gzip header and trailer instead of the zlib ones.
+"""
+
+
+def get_encodings() -> List[str]:
+    """
+    Returns the content codings from OPENSLIDES_BACKEND_COMPRESSION in order of
+    preference. An empty value or "none" disables compression.
+    """
+    value = os.environ.get(COMPRESSION_VARIABLE, DEFAULT_COMPRESSION)
+    encodings = [encoding.strip() for encoding in value.split(",")]
+    encodings = [encoding for encoding in encodings if encoding not in ("", "none")]
+    for encoding in encodings:
+        if encoding not in WBITS:
+            raise ValueError(f"Compression {encoding} is not supported.")
+    return encodings
+
+
+def get_threshold() -> int:
+    return int(
+        os.environ.get(COMPRESSION_THRESHOLD_VARIABLE, DEFAULT_COMPRESSION_THRESHOLD)
+    )
+
+
+def get_level() -> int:
+    return int(os.environ.get(COMPRESSION_LEVEL_VARIABLE, DEFAULT_COMPRESSION_LEVEL))
+
+
+class CompressionMiddleware:
+    """
+    Compresses successful responses with a content coding accepted by the
+    client. If the client accepts several codings with the same quality, the
+    configured order of preference is used. Bodies smaller than threshold bytes
+    are sent as they are. Streamed bodies are compressed chunk by chunk and each
+    chunk is flushed, so that streaming is kept.
+
+    Compressed variants of constant responses are cached if a cache key is
+    given. The compressed size and the CPU time are logged for each response.
+    """
+
+    def __init__(
+        self,
+        logging: LoggingModule,
+        encodings: Optional[List[str]] = None,
+        threshold: Optional[int] = None,
+        level: Optional[int] = None,
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.encodings = get_encodings() if encodings is None else encodings
+        self.threshold = get_threshold() if threshold is None else threshold
+        self.level = get_level() if level is None else level
+        self.cache: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {}
+
+    def __call__(
+        self,
+        request: Request,
+        response: Union[Response, HTTPException],
+        cache_key: Optional[str] = None,
+    ) -> Union[Response, HTTPException]:
+        if (
+            not self.encodings
+            or not isinstance(response, Response)
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        if response.is_streamed:
+            response.vary.add("Accept-Encoding")
+            encoding = self.negotiate(request)
+            if encoding is not None:
+                response.response = self.iter_compress(response.response, encoding)
+                response.headers["Content-Encoding"] = encoding
+            return response
+        body = response.get_data()
+        if len(body) < self.threshold:
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate(request)
+        if encoding is None:
+            return response
+        response.set_data(self.compress(body, encoding, cache_key))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def negotiate(self, request: Request) -> Optional[str]:
+        """
+        Returns the best content coding for the request or None if the client
+        does not accept any of the configured ones.
+        """
+        return request.accept_encodings.best_match(self.encodings)
+
+    def compress(
+        self, body: bytes, encoding: str, cache_key: Optional[str] = None
+    ) -> bytes:
+        """
+        Compresses the body. If a cache key is given and the body did not change
+        since the last call with this key, the cached result is returned.
+        """
+        if cache_key is not None:
+            cached_body, compressed = self.cache.get((cache_key, encoding), (b"", b""))
+            if cached_body == body:
+                return compressed
+        start = time.thread_time()
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[encoding])
+        compressed = compressor.compress(body) + compressor.flush()
+        self.log(encoding, len(body), len(compressed), time.thread_time() - start)
+        if cache_key is not None:
+            self.cache[(cache_key, encoding)] = (body, compressed)
+        return compressed
+
+    def iter_compress(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        """
+        Compresses a streamed body. The sizes and the CPU time are logged after
+        the last chunk.
+        """
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[encoding])
+        size = compressed_size = 0
+        cpu_time = 0.0
+        for chunk in chunks:
+            start = time.thread_time()
+            compressed = compressor.compress(chunk) + compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+            cpu_time += time.thread_time() - start
+            size += len(chunk)
+            compressed_size += len(compressed)
+            yield compressed
+        start = time.thread_time()
+        compressed = compressor.flush()
+        cpu_time += time.thread_time() - start
+        compressed_size += len(compressed)
+        yield compressed
+        self.log(encoding, size, compressed_size, cpu_time)
+
+    def log(
+        self, encoding: str, size: int, compressed_size: int, cpu_time: float
+    ) -> None:
+        self.logger.debug(
+            "Compressed response body with %s from %d to %d bytes in %.2f ms CPU time.",
+            encoding,
+            size,
+            compressed_size,
+            cpu_time * 1000,
+        )
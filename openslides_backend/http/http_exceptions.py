@@ -5,6 +5,7 @@ from werkzeug.exceptions import BadRequest as BaseBadRequest
 from werkzeug.exceptions import Forbidden as BaseForbidden
 from werkzeug.exceptions import HTTPException as BaseHTTPException
 from werkzeug.exceptions import MethodNotAllowed as BaseMethodNotAllowed
+from werkzeug.exceptions import RequestEntityTooLarge as BaseRequestEntityTooLarge
 
 
 class HTTPException(BaseHTTPException):
@@ -38,3 +39,7 @@ class Forbidden(BaseForbidden, HTTPException):
 
 class MethodNotAllowed(BaseMethodNotAllowed, HTTPException):
     pass
+
+
+class RequestEntityTooLarge(BaseRequestEntityTooLarge, HTTPException):
+    pass
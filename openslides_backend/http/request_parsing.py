@@ -0,0 +1,276 @@
+import codecs
+import hashlib
+import os
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set
+
+import simplejson as json
+
+from ..shared.exceptions import ViewException
+from ..shared.schema_validator import get_unique_items_digest
+
+MAX_BODY_SIZE_VARIABLE = "OPENSLIDES_BACKEND_MAX_BODY_SIZE"
+
+DEFAULT_MAX_BODY_SIZE = 100 * 1024 * 1024
+
+MAX_ELEMENTS_VARIABLE = "OPENSLIDES_BACKEND_MAX_PAYLOAD_ELEMENTS"
+
+DEFAULT_MAX_ELEMENTS = 100000
+
+READ_SIZE = 64 * 1024
+
+NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+INCOMPLETE_END = re.compile(r"[0-9.eE+-]*\Z")
+"""
+Matches the rest of the buffer after a decoded value if the value might
+continue in the next chunk, e. g. a number.
+"""
+
+decoder = json.JSONDecoder()
+
+
+def get_max_body_size() -> int:
+    return int(os.environ.get(MAX_BODY_SIZE_VARIABLE, DEFAULT_MAX_BODY_SIZE))
+
+
+def get_max_elements() -> int:
+    return int(os.environ.get(MAX_ELEMENTS_VARIABLE, DEFAULT_MAX_ELEMENTS))
+
+
+class JSONStreamReader:
+    """
+    Incremental JSON reader for a binary stream. The stream is read in chunks
+    and only the unread part of the current chunk is kept in memory. Values are
+    decoded one by one with simplejson, arrays and objects can be walked with
+    read_items and read_members so that their elements are decoded when they
+    are needed.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, max_size: int, read_size: int = READ_SIZE
+    ) -> None:
+        self.stream = stream
+        self.max_size = max_size
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.size = 0
+        self.eof = False
+
+    def fill(self, read_size: Optional[int] = None) -> bool:
+        """
+        Reads the next chunk from the stream into the buffer and drops the part
+        of the buffer which was already read. Returns False at the end of the
+        stream.
+        """
+        if self.eof:
+            return False
+        data = self.stream.read(read_size or self.read_size)
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise ViewException(
+                f"Request body must not be larger than {self.max_size} bytes.",
+                status_code=413,
+            )
+        self.eof = not data
+        try:
+            text = self.decoder.decode(data, final=self.eof)
+        except UnicodeDecodeError as exception:
+            raise self.error(str(exception))
+        self.buffer = self.buffer[self.position :] + text
+        self.position = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+        Returns an empty string at the end of the stream.
+        """
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.position)
+            if match is not None:
+                self.position = match.start()
+                return self.buffer[self.position]
+            self.position = len(self.buffer)
+            if not self.fill():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """
+        Consumes and returns the next character which has to be one of the
+        given characters.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            expected = " or ".join(repr(c) for c in characters)
+            raise self.error(f"Expecting {expected}")
+        self.position += 1
+        return character
+
+    def expect_end(self) -> None:
+        if self.peek():
+            raise self.error("Extra data")
+
+    def read_value(self) -> Any:
+        """
+        Decodes and returns the next value. If the value is not complete in the
+        buffer, more data is read. The amount of read data is doubled on each
+        retry so that large values are not decoded too often.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as exception:
+                if self.fill(len(self.buffer)):
+                    continue
+                raise self.error(exception.msg)
+            if not self.eof and INCOMPLETE_END.match(self.buffer, end):
+                self.fill(len(self.buffer))
+                continue
+            self.position = end
+            return value
+
+    def read_items(self) -> Iterator[None]:
+        """
+        Walks an array and yields once per item. The caller has to read the
+        item before the iteration is continued.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield
+            if self.expect(",]") == "]":
+                return
+
+    def read_members(self) -> Iterator[str]:
+        """
+        Walks an object and yields the name of each member. The caller has to
+        read the value before the iteration is continued.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self.error("Expecting property name enclosed in double quotes")
+            name = self.read_value()
+            self.expect(":")
+            yield name
+            if self.expect(",}") == "}":
+                return
+
+    def error(self, message: str) -> ViewException:
+        return ViewException(
+            f"Failed to decode JSON object: {message}", status_code=400
+        )
+
+
+def iter_action_payload(
+    reader: JSONStreamReader, max_elements: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parses the body of an action request incrementally and yields each action
+    as dictionary with its name and its data. If the name precedes the data,
+    the data is an iterator which decodes the elements when they are consumed.
+    Otherwise it is a list. The data of an action has to be consumed before
+    the next action is requested. The structure of the payload is validated
+    while it is parsed with the same rules and messages as the payload schema
+    of the ActionHandler, the elements themselves are validated by the actions.
+    For uniqueItems only digests of the actions and elements are kept. A
+    duplicate action is detected after its data was consumed, which is still
+    before anything is written.
+
+    Raises ViewException if the body is invalid or contains more than
+    max_elements data elements altogether.
+    """
+    element_count = 0
+
+    def invalid(message: str) -> ViewException:
+        return ViewException(message, status_code=400)
+
+    def read_array(path: str) -> Iterator[None]:
+        if reader.peek() != "[":
+            # Decode the value first, so that invalid JSON is reported as such.
+            reader.read_value()
+            raise invalid(f"{path} must be array")
+        return reader.read_items()
+
+    def iter_data(path: str, action_hash: hashlib.blake2b) -> Iterator[Dict[str, Any]]:
+        nonlocal element_count
+        digests: Set[bytes] = set()
+        index = -1
+        for index, _ in enumerate(read_array(path)):
+            element = reader.read_value()
+            if not isinstance(element, dict):
+                raise invalid(f"{path}[{index}] must be object")
+            digest = get_unique_items_digest(element)
+            if digest in digests:
+                raise invalid(f"{path} must contain unique items")
+            digests.add(digest)
+            action_hash.update(digest)
+            element_count += 1
+            if element_count > max_elements:
+                raise ViewException(
+                    f"Request must not contain more than {max_elements} data elements.",
+                    status_code=413,
+                )
+            yield element
+        if index < 0:
+            raise invalid(f"{path} must contain at least 1 items")
+
+    action_digests: Set[bytes] = set()
+    index = -1
+    for index, _ in enumerate(read_array("data")):
+        path = f"data[{index}]"
+        if reader.peek() != "{":
+            reader.read_value()
+            raise invalid(f"{path} must be object")
+        action: Dict[str, Any] = {}
+        # The member names are hashed, too, since their order is part of the
+        # compared representation.
+        action_hash = hashlib.blake2b(digest_size=16)
+        additional_names: List[str] = []
+        for name in reader.read_members():
+            if name not in ("action", "data"):
+                reader.read_value()
+                additional_names.append(name)
+                continue
+            if name in action:
+                raise invalid(f"{path} must not contain {name} twice")
+            action_hash.update(name.encode())
+            if name == "action":
+                action_name = action["action"] = reader.read_value()
+                if not isinstance(action_name, str):
+                    raise invalid(f"{path}.action must be string")
+                if not action_name:
+                    raise invalid(
+                        f"{path}.action must be longer than or equal to 1 characters"
+                    )
+                action_hash.update(get_unique_items_digest(action_name))
+            elif "action" in action:
+                data = action["data"] = iter_data(f"{path}.data", action_hash)
+                yield action
+                # Skip the elements which were not consumed by the action.
+                for _ in data:
+                    pass
+            else:
+                action["data"] = list(iter_data(f"{path}.data", action_hash))
+        if "action" not in action or "data" not in action:
+            raise invalid(f"{path} must contain ['action', 'data'] properties")
+        if additional_names:
+            raise invalid(f"{path} must not contain {set(additional_names)} properties")
+        digest = action_hash.digest()
+        if digest in action_digests:
+            raise invalid("data must contain unique items")
+        action_digests.add(digest)
+        if isinstance(action["data"], list):
+            yield action
+    if index < 0:
+        raise invalid("data must contain at least 1 items")
+    reader.expect_end()
@@ -0,0 +1,96 @@
+from itertools import chain
+from typing import Any, Iterator, List, Union
+
+import simplejson as json
+
+from ..shared.interfaces import Logger
+
+CHUNK_SIZE = 64 * 1024
+
+BATCH_SIZE = 256
+
+encoder = json.JSONEncoder(separators=(",", ":"))
+
+LIST_START = b"["
+LIST_END = b"]"
+SEPARATOR = b","
+
+
+def encode(body: Any) -> bytes:
+    """
+    Encodes the body as compact JSON.
+    """
+    return encoder.encode(body).encode("utf-8")
+
+
+def iter_encode(
+    body: Any, chunk_size: int = CHUNK_SIZE, batch_size: int = BATCH_SIZE
+) -> Iterator[bytes]:
+    """
+    Encodes the body as JSON in chunks of at least chunk_size bytes (except for
+    the last one). Elements of a top level list are encoded in batches of
+    batch_size elements, so a chunk can be sent before the rest of the list is
+    encoded. A batch which consists of one element repeated several times (e. g.
+    equal action results) is encoded by encoding this element only once.
+    """
+    if not isinstance(body, list):
+        yield encode(body)
+        return
+    buffer: List[bytes] = [LIST_START]
+    size = len(LIST_START)
+    for start in range(0, len(body), batch_size):
+        batch = body[start : start + batch_size]
+        if all(element is batch[0] for element in batch):
+            fragment = SEPARATOR.join([encode(batch[0])] * len(batch))
+        else:
+            fragment = encode(batch)[1:-1]
+        if start:
+            buffer.append(SEPARATOR)
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    buffer.append(LIST_END)
+    yield b"".join(buffer)
+
+
+def get_response_body(
+    body: Any, logger: Logger, chunk_size: int = CHUNK_SIZE
+) -> Union[bytes, Iterator[bytes]]:
+    """
+    Returns the encoded body as bytes if it fits into one chunk. Otherwise an
+    iterator over all chunks is returned, so that the response is streamed.
+
+    The first two chunks are encoded here, so errors in them are raised before
+    the response is sent. An error in a later chunk occurs after the status
+    200 was sent and the client receives an incomplete body. Checking the
+    whole body up front would cost as much as encoding it and undo the gain of
+    streaming, so such errors are only logged with the number of sent bytes
+    and raised again.
+    """
+    chunks = iter_encode(body, chunk_size)
+    first_chunk = next(chunks)
+    second_chunk = next(chunks, None)
+    if second_chunk is None:
+        return first_chunk
+    return iter_log_errors(chain((first_chunk, second_chunk), chunks), logger)
+
+
+def iter_log_errors(chunks: Iterator[bytes], logger: Logger) -> Iterator[bytes]:
+    """
+    Yields the chunks and logs an error if encoding a chunk fails.
+    """
+    size = 0
+    try:
+        for chunk in chunks:
+            yield chunk
+            size += len(chunk)
+    except Exception as exception:
+        logger.error(
+            "Encoding of the streamed response body failed after %d bytes: %s",
+            size,
+            exception,
+        )
+        raise
@@ -31,6 +31,8 @@ class BaseView(View):
     During initialization we bind the dependencies to the instance.
     """
 
+    stream_request_body = False
+
     def __init__(self, logging: LoggingModule, services: Services) -> None:
         self.services = services
         self.logging = logging
@@ -48,7 +50,7 @@ class BaseView(View):
             )
         except AuthenticationException as exception:
             raise ViewException(exception.message, status_code=400)
-        self.logger.debug(f"User id is {user_id}.")
+        self.logger.debug("User id is %s.", user_id)
         return user_id, access_token
 
     def dispatch(
@@ -60,10 +62,12 @@ class BaseView(View):
 class ActionView(BaseView):
     """
     The ActionView receives a bundle of actions via HTTP and handles it to the
-    ActionHandler after retrieving request user id.
+    ActionHandler after retrieving request user id. The request body is parsed
+    incrementally while the actions are performed.
     """
 
     method = "POST"
+    stream_request_body = True
 
     def dispatch(
         self, body: RequestBody, headers: Headers, cookies: Dict
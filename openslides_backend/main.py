@@ -36,7 +36,7 @@ class OpenSlidesBackendGunicornApplication(BaseApplication):  # pragma: no cover
             raise ValueError(
                 f"View name has to be ActionView or PresenterView, not {self.view_name}."
             )
-        logger.debug(f"Create gunicorn application for {self.view_name}.")
+        logger.debug("Create gunicorn application for %s.", self.view_name)
         super().__init__(*args, **kwargs)
 
     def load_config(self) -> None:
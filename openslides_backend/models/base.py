@@ -1,7 +1,8 @@
-from typing import Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Tuple
 
 from ..shared.patterns import Collection
 from . import fields
+from .helpers import PROPERTIES, SET_DEFAULTS, VALIDATE_FIELDS
 
 model_registry = {}
 
@@ -80,10 +81,40 @@ class Model(metaclass=ModelMetaClass):
         Returns a dictionary of field schemas used for the properties keyword in
         an action schema.
         """
+        static_properties = PROPERTIES.get(self.collection.collection, {})
         properties = {}
         for field in fields:
+            if field in static_properties:
+                properties[field] = dict(static_properties[field])
+                continue
             try:
                 properties[field] = self.get_schema(field)
             except AttributeError:
                 raise ValueError(f"{field} is not a field of {self}")
         return properties
+
+    def set_defaults(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sets the default values of all fields which are missing in the instance.
+        Uses the generated function of the model if available.
+        """
+        set_defaults = SET_DEFAULTS.get(self.collection.collection)
+        if set_defaults is not None:
+            return set_defaults(instance)
+        for field_name, field in self.get_fields():
+            if field_name not in instance.keys() and field.default is not None:
+                instance[field_name] = field.default
+        return instance
+
+    def validate_fields(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates all fields of the instance according to the model definition.
+        Uses the generated function of the model if available.
+        """
+        validate_fields = VALIDATE_FIELDS.get(self.collection.collection)
+        if validate_fields is not None:
+            return validate_fields(instance)
+        for field_name, field in self.get_fields():
+            if field_name in instance:
+                instance[field_name] = field.validate(instance[field_name])
+        return instance
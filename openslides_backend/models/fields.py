@@ -1,8 +1,6 @@
 from enum import Enum
 from typing import Any, Dict, List, Union
 
-import bleach
-
 from ..shared.patterns import Collection, string_to_fqid
 from ..shared.schema import (
     fqid_list_schema,
@@ -13,6 +11,7 @@ from ..shared.schema import (
     required_id_schema,
 )
 from ..shared.typing import Schema
+from .html_sanitizer import get_sanitizer
 
 
 class OnDelete(Enum):
@@ -151,16 +150,11 @@ class HTMLStrictField(TextField):
     ]
 
     def validate(self, html: str) -> str:
-        def allow_all(tag: str, name: str, value: str) -> bool:
-            return True
-
         html = html.replace("\t", "")
-        return bleach.clean(
-            html,
-            tags=self.get_allowed_tags(),
-            attributes=allow_all,
-            styles=self.ALLOWED_STYLES,
+        sanitizer = get_sanitizer(
+            tuple(self.get_allowed_tags()), tuple(self.ALLOWED_STYLES)
         )
+        return sanitizer.sanitize(html)
 
     def get_allowed_tags(self) -> List[str]:
         return self.ALLOWED_HTML_TAGS_STRICT
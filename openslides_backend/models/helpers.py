@@ -0,0 +1,1851 @@
+# Code generated. DO NOT EDIT.
+
+from typing import Any, Callable, Dict
+
+from openslides_backend.models import fields
+from openslides_backend.shared.patterns import string_to_fqid
+from openslides_backend.shared.typing import Schema
+
+InstanceFunction = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def keep_instance(instance: Dict[str, Any]) -> Dict[str, Any]:
+    return instance
+
+
+MODELS_YML_CHECKSUM = "0dac254918292749e16477d156eab57c"
+
+html_permissive_field = fields.HTMLPermissiveField()
+
+html_strict_field = fields.HTMLStrictField()
+
+
+def validate_fields_organisation(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "description" in instance:
+        instance["description"] = html_strict_field.validate(instance["description"])
+    return instance
+
+
+ORGANISATION_PROPERTIES: Dict[str, Schema] = {
+    "committee_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "custom_translations": {"type": "string"},
+    "description": {"type": "string"},
+    "enable_electronic_voting": {"type": ["boolean", "null"]},
+    "id": {"type": ["integer", "null"]},
+    "legal_notice": {"type": "string", "maxLength": 256},
+    "login_text": {"type": "string", "maxLength": 256},
+    "name": {"type": "string", "maxLength": 256},
+    "privacy_policy": {"type": "string", "maxLength": 256},
+    "reset_password_verbose_errors": {"type": ["boolean", "null"]},
+    "resource_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "role_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "superadmin_role_id": {"type": ["integer", "null"], "mininum": 1},
+    "theme": {"type": "string", "maxLength": 256},
+}
+
+
+def validate_fields_user(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "about_me" in instance:
+        instance["about_me"] = html_strict_field.validate(instance["about_me"])
+    if "comment" in instance:
+        instance["comment"] = html_strict_field.validate(instance["comment"])
+    return instance
+
+
+USER_PROPERTIES: Dict[str, Schema] = {
+    "about_me": {"type": "string"},
+    "assignment_candidate__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_delegated_vote__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_option__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_poll_voted__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_vote__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "comment": {"type": "string"},
+    "committee_as_manager_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "committee_as_member_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "default_password": {"type": "string", "maxLength": 256},
+    "email": {"type": "string", "maxLength": 256},
+    "first_name": {"type": "string", "maxLength": 256},
+    "gender": {"type": "string", "maxLength": 256},
+    "group__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "guest_meeting_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "is_active": {"type": ["boolean", "null"]},
+    "is_committee": {"type": ["boolean", "null"]},
+    "is_demo_user": {"type": ["boolean", "null"]},
+    "is_present_in_meeting_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "last_email_send": {"type": "string", "maxLength": 256},
+    "last_name": {"type": "string", "maxLength": 256},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "motion_delegated_vote__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_poll_voted__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_vote__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "number": {"type": "string", "maxLength": 256},
+    "password": {"type": "string", "maxLength": 256},
+    "personal_note__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "role_id": {"type": ["integer", "null"], "mininum": 1},
+    "speaker__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "structure_level": {"type": "string", "maxLength": 256},
+    "submitted_motion__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "supported_motion__ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "title": {"type": "string", "maxLength": 256},
+    "username": {"type": "string", "maxLength": 256},
+    "vote_delegated__to_id": {"type": ["integer", "null"], "mininum": 1},
+    "vote_delegations__from_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "vote_weight": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+def set_defaults_role(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "permissions" not in instance:
+        instance["permissions"] = []
+    return instance
+
+
+ROLE_PROPERTIES: Dict[str, Schema] = {
+    "id": {"type": ["integer", "null"]},
+    "name": {"type": "string", "maxLength": 256},
+    "organisation_id": {"type": ["integer", "null"], "mininum": 1, "enum": [1]},
+    "permissions": {
+        "type": "array",
+        "default": [],
+        "items": {"type": "string", "maxLength": 256},
+    },
+    "superadmin_role_for_organisation_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+RESOURCE_PROPERTIES: Dict[str, Schema] = {
+    "filesize": {"type": ["integer", "null"]},
+    "id": {"type": ["integer", "null"]},
+    "mimetype": {"type": "string", "maxLength": 256},
+    "organisation_id": {"type": ["integer", "null"], "mininum": 1, "enum": [1]},
+    "token": {"type": "string", "maxLength": 256},
+}
+
+
+def validate_fields_committee(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "description" in instance:
+        instance["description"] = html_strict_field.validate(instance["description"])
+    return instance
+
+
+COMMITTEE_PROPERTIES: Dict[str, Schema] = {
+    "default_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "description": {"type": "string"},
+    "forward_to_committee_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "manager_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "meeting_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "member_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "organisation_id": {"type": "integer", "mininum": 1, "enum": [1]},
+    "receive_forwardings_from_committee_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "template_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+}
+
+
+def set_defaults_meeting(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "user_ids" not in instance:
+        instance["user_ids"] = []
+    return instance
+
+
+def validate_fields_meeting(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "welcome_text" in instance:
+        instance["welcome_text"] = html_permissive_field.validate(
+            instance["welcome_text"]
+        )
+    return instance
+
+
+MEETING_PROPERTIES: Dict[str, Schema] = {
+    "agenda_enable_numbering": {"type": ["boolean", "null"]},
+    "agenda_item_creation": {
+        "enum": ["always", "never", "default_yes", "default_no"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "agenda_item_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "agenda_new_items_default_visibility": {
+        "enum": [1, 2, 3],
+        "type": ["integer", "null"],
+    },
+    "agenda_number_prefix": {"maxLength": 256, "type": "string"},
+    "agenda_numeral_system": {
+        "enum": ["arabic", "roman"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "agenda_show_internal_items_on_projector": {"type": ["boolean", "null"]},
+    "agenda_show_subtitles": {"type": ["boolean", "null"]},
+    "assignemnts_export_title": {"type": "string", "maxLength": 256},
+    "assignment_candidate_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_option_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_poll_add_candidates_to_list_of_speakers": {"type": ["boolean", "null"]},
+    "assignment_poll_ballot_paper_number": {"type": ["integer", "null"]},
+    "assignment_poll_ballot_paper_selection": {
+        "enum": ["NUMBER_OF_DELEGATES", "NUMBER_OF_ALL_PARTICIPANTS", "CUSTOM_NUMBER"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "assignment_poll_default_100_percent_base": {"type": "string", "maxLength": 256},
+    "assignment_poll_default_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_poll_default_majority_method": {"type": "string", "maxLength": 256},
+    "assignment_poll_default_method": {"type": "string", "maxLength": 256},
+    "assignment_poll_default_type": {"type": "string", "maxLength": 256},
+    "assignment_poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignment_poll_sort_poll_result_by_votes": {"type": ["boolean", "null"]},
+    "assignment_vote_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "assignments_export_preamble": {"type": "string", "maxLength": 256},
+    "committee_id": {"type": "integer", "mininum": 1},
+    "conference_auto_connect": {"type": ["boolean", "null"]},
+    "conference_los_restriction": {"type": ["boolean", "null"]},
+    "conference_show": {"type": ["boolean", "null"]},
+    "conference_stream_poster_url": {"type": "string", "maxLength": 256},
+    "conference_stream_url": {"type": "string", "maxLength": 256},
+    "default_group_id": {"type": "integer", "mininum": 1},
+    "default_meeting_for_committee_id": {"type": ["integer", "null"], "mininum": 1},
+    "description": {"maxLength": 256, "type": "string"},
+    "enable_anonymous": {"type": ["boolean", "null"]},
+    "end_time": {"type": ["integer", "null"]},
+    "export_csv_encoding": {
+        "enum": ["utf-8", "iso-8859-15"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "export_csv_separator": {"type": "string", "maxLength": 256},
+    "export_pdf_fontsize": {"enum": [10, 11, 12], "type": ["integer", "null"]},
+    "export_pdf_pagenumber_alignment": {
+        "enum": ["left", "right", "center"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "export_pdf_pagesize": {"enum": ["A4", "A5"], "type": "string", "maxLength": 256},
+    "font__id": {"type": ["integer", "null"], "mininum": 1},
+    "group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "guest_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "jitsi_domain": {"type": "string", "maxLength": 256},
+    "jitsi_room_name": {"type": "string", "maxLength": 256},
+    "jitsi_room_password": {"type": "string", "maxLength": 256},
+    "list_of_speakers_amount_last_on_projector": {
+        "minimum": 0,
+        "type": ["integer", "null"],
+    },
+    "list_of_speakers_amount_next_on_projector": {"type": ["boolean", "null"]},
+    "list_of_speakers_couple_countdown": {"type": ["boolean", "null"]},
+    "list_of_speakers_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "list_of_speakers_present_users_only": {"type": ["boolean", "null"]},
+    "list_of_speakers_show_amount_of_speakers_on_slide": {"type": ["boolean", "null"]},
+    "list_of_speakers_show_first_contribution": {"type": ["boolean", "null"]},
+    "location": {"type": "string", "maxLength": 256},
+    "logo__id": {"type": ["integer", "null"], "mininum": 1},
+    "mediafile_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_block_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_category_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_change_recommendation_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_comment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_comment_section_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_option_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_poll_ballot_paper_number": {"type": ["integer", "null"]},
+    "motion_poll_ballot_paper_selection": {
+        "enum": ["NUMBER_OF_DELEGATES", "NUMBER_OF_ALL_PARTICIPANTS", "CUSTOM_NUMBER"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "motion_poll_default_100_percent_base": {"type": "string", "maxLength": 256},
+    "motion_poll_default_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_poll_default_majority_method": {"type": "string", "maxLength": 256},
+    "motion_poll_default_type": {"type": "string", "maxLength": 256},
+    "motion_poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_state_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_statute_paragraph_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_submitter_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_vote_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_workflow_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motions_amendments_enabled": {"type": ["boolean", "null"]},
+    "motions_amendments_in_main_list": {"type": ["boolean", "null"]},
+    "motions_amendments_multiple_paragraphs": {"type": ["boolean", "null"]},
+    "motions_amendments_of_amendments": {"type": ["boolean", "null"]},
+    "motions_amendments_prefix": {"type": "string", "maxLength": 256},
+    "motions_amendments_text_mode": {
+        "enum": ["freestyle", "fulltext", "paragraph"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "motions_default_amendment_workflow_id": {"type": "integer", "mininum": 1},
+    "motions_default_line_numbering": {
+        "enum": ["outside", "inline", "none"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "motions_default_sorting": {"type": "string", "maxLength": 256},
+    "motions_default_statute_amendment_workflow_id": {"type": "integer", "mininum": 1},
+    "motions_default_workflow_id": {"type": "integer", "mininum": 1},
+    "motions_enable_reason_on_projector": {"type": ["boolean", "null"]},
+    "motions_enable_recommendation_on_projector": {"type": ["boolean", "null"]},
+    "motions_enable_sidebox_on_projector": {"type": ["boolean", "null"]},
+    "motions_enable_text_on_projector": {"type": ["boolean", "null"]},
+    "motions_export_follow_recommendation": {"type": ["boolean", "null"]},
+    "motions_export_preamble": {"type": "string", "maxLength": 256},
+    "motions_export_submitter_recommendation": {"type": ["boolean", "null"]},
+    "motions_export_title": {"type": "string", "maxLength": 256},
+    "motions_line_length": {"minimium": 40, "type": ["integer", "null"]},
+    "motions_number_min_digits": {"type": ["integer", "null"]},
+    "motions_number_type": {
+        "enum": ["per_category", "serially_numbered", "manually"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "motions_number_with_blank": {"type": ["boolean", "null"]},
+    "motions_preamble": {"type": "string", "maxLength": 256},
+    "motions_reason_required": {"type": ["boolean", "null"]},
+    "motions_recommendation_text_mode": {
+        "enum": ["original", "changed", "diff", "agreed"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "motions_recommendations_by": {"type": "string", "maxLength": 256},
+    "motions_show_referring_motions": {"type": ["boolean", "null"]},
+    "motions_show_sequential_number": {"type": ["boolean", "null"]},
+    "motions_statute_recommendations_by": {"type": "string", "maxLength": 256},
+    "motions_statutes_enabled": {"type": ["boolean", "null"]},
+    "motions_supporters_enable_autoremove": {"type": ["boolean", "null"]},
+    "motions_supporters_min_amount": {"minimum": 0, "type": ["integer", "null"]},
+    "name": {"maxLength": 256, "type": "string"},
+    "personal_note_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "present_user_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projectiondefault_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projector_countdown_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projector_countdown_warning_time": {"minimum": 0, "type": ["integer", "null"]},
+    "projector_default_countdown_time": {"type": ["integer", "null"]},
+    "projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projector_message_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "reference_projector_id": {"type": ["integer", "null"], "mininum": 1},
+    "speaker_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "start_time": {"type": ["integer", "null"]},
+    "superadmin_group_id": {"type": ["integer", "null"], "mininum": 1},
+    "tag_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "template_for_committee_id": {"type": ["integer", "null"], "mininum": 1},
+    "temporary_user_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "topic_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "url_name": {"description": "For unique urls.", "type": "string", "maxLength": 256},
+    "user_ids": {
+        "decription": "Calculated. All ids from temporary_user_ids, guest_ids and all users assigned to groups.",
+        "type": "array",
+        "default": [],
+        "items": {"type": "integer"},
+    },
+    "users_allow_self_set_present": {"type": ["boolean", "null"]},
+    "users_email_body": {"type": "string", "maxLength": 256},
+    "users_email_replyto": {"type": "string", "maxLength": 256},
+    "users_email_sender": {"type": "string", "maxLength": 256},
+    "users_email_subject": {"type": "string", "maxLength": 256},
+    "users_enable_presence_view": {"type": ["boolean", "null"]},
+    "users_enable_vote_weight": {"type": ["boolean", "null"]},
+    "users_pdf_url": {"type": "string", "maxLength": 256},
+    "users_pdf_welcometext": {"type": "string", "maxLength": 256},
+    "users_pdf_welcometitle": {"type": "string", "maxLength": 256},
+    "users_pdf_wlan_encryption": {
+        "enum": ["", "WEP", "WPA", "nopass"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "users_pdf_wlan_password": {"type": "string", "maxLength": 256},
+    "users_pdf_wlan_ssid": {"type": "string", "maxLength": 256},
+    "users_sort_by": {
+        "enum": ["first_name", "last_name", "number"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "welcome_text": {"type": "string"},
+    "welcome_title": {"type": "string", "maxLength": 256},
+}
+
+
+def set_defaults_group(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "permissions" not in instance:
+        instance["permissions"] = []
+    return instance
+
+
+GROUP_PROPERTIES: Dict[str, Schema] = {
+    "assignment_poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "default_group_for_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "mediafile_access_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "mediafile_inherited_access_group_ids": {
+        "description": "Calculated field.",
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "permissions": {
+        "type": "array",
+        "default": [],
+        "items": {"type": "string", "maxLength": 256},
+    },
+    "read_comment_section_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "superadmin_group_for_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "used_as_assignment_poll_default_id": {"type": ["integer", "null"], "mininum": 1},
+    "used_as_motion_poll_default_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "write_comment_section_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+def validate_fields_personal_note(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "content_object_id" in instance:
+        instance["content_object_id"] = string_to_fqid(instance["content_object_id"])
+    if "note" in instance:
+        instance["note"] = html_strict_field.validate(instance["note"])
+    return instance
+
+
+PERSONAL_NOTE_PROPERTIES: Dict[str, Schema] = {
+    "content_object_id": {
+        "type": ["string", "null"],
+        "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+        "minLength": 1,
+    },
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "note": {"type": "string"},
+    "star": {"type": ["boolean", "null"]},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+}
+
+
+def validate_fields_tag(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "tagged_ids" in instance:
+        instance["tagged_ids"] = [
+            string_to_fqid(fqid) for fqid in instance["tagged_ids"]
+        ]
+    return instance
+
+
+TAG_PROPERTIES: Dict[str, Schema] = {
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "tagged_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {
+            "type": "string",
+            "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+            "minLength": 1,
+        },
+    },
+}
+
+
+def set_defaults_agenda_item(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "type" not in instance:
+        instance["type"] = 1
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+def validate_fields_agenda_item(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "content_object_id" in instance:
+        instance["content_object_id"] = string_to_fqid(instance["content_object_id"])
+    return instance
+
+
+AGENDA_ITEM_PROPERTIES: Dict[str, Schema] = {
+    "child_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "closed": {"type": ["boolean", "null"]},
+    "comment": {"type": "string", "maxLength": 256},
+    "content_object_id": {
+        "type": "string",
+        "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+        "minLength": 1,
+    },
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "duration": {
+        "description": "Given in seconds",
+        "minimum": 0,
+        "type": ["integer", "null"],
+    },
+    "id": {"type": ["integer", "null"]},
+    "is_hidden": {
+        "description": "Calculated by the server",
+        "type": ["boolean", "null"],
+    },
+    "is_internal": {
+        "description": "Calculated by the server",
+        "type": ["boolean", "null"],
+    },
+    "item_number": {"type": "string", "maxLength": 256},
+    "level": {"description": "Calculated by the server", "type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "parent_id": {"type": ["integer", "null"], "mininum": 1},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "tag_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "type": {"enum": [1, 2, 3], "type": ["integer", "null"]},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+def validate_fields_list_of_speakers(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "content_object_id" in instance:
+        instance["content_object_id"] = string_to_fqid(instance["content_object_id"])
+    return instance
+
+
+LIST_OF_SPEAKERS_PROPERTIES: Dict[str, Schema] = {
+    "closed": {"type": ["boolean", "null"]},
+    "content_object_id": {
+        "type": "string",
+        "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+        "minLength": 1,
+    },
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "speaker_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+def set_defaults_speaker(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+SPEAKER_PROPERTIES: Dict[str, Schema] = {
+    "begin_time": {"type": ["integer", "null"]},
+    "end_time": {"type": ["integer", "null"]},
+    "id": {"type": ["integer", "null"]},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "marked": {"type": ["boolean", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "user_id": {"type": "integer", "mininum": 1},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+def validate_fields_topic(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "text" in instance:
+        instance["text"] = html_permissive_field.validate(instance["text"])
+    return instance
+
+
+TOPIC_PROPERTIES: Dict[str, Schema] = {
+    "agenda_item_id": {"type": "integer", "mininum": 1},
+    "attachment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "tag_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "text": {"type": "string"},
+    "title": {"type": "string", "minLength": 1, "maxLength": 256},
+}
+
+
+def set_defaults_motion(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "category_weight" not in instance:
+        instance["category_weight"] = 10000
+    if "forwarding_tree_motion_ids" not in instance:
+        instance["forwarding_tree_motion_ids"] = []
+    if "sort_weight" not in instance:
+        instance["sort_weight"] = 10000
+    return instance
+
+
+def validate_fields_motion(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "amendment_paragraph_" in instance:
+        instance["amendment_paragraph_"] = html_strict_field.validate(
+            instance["amendment_paragraph_"]
+        )
+    if "modified_final_version" in instance:
+        instance["modified_final_version"] = html_strict_field.validate(
+            instance["modified_final_version"]
+        )
+    if "reason" in instance:
+        instance["reason"] = html_strict_field.validate(instance["reason"])
+    if "recommendation_extension_reference_ids" in instance:
+        instance["recommendation_extension_reference_ids"] = [
+            string_to_fqid(fqid)
+            for fqid in instance["recommendation_extension_reference_ids"]
+        ]
+    if "text" in instance:
+        instance["text"] = html_strict_field.validate(instance["text"])
+    return instance
+
+
+MOTION_PROPERTIES: Dict[str, Schema] = {
+    "agenda_item_id": {"type": ["integer", "null"], "mininum": 1},
+    "amendment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "amendment_paragraph_": {"type": "string"},
+    "attachment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "block_id": {"type": ["integer", "null"], "mininum": 1},
+    "category_id": {"type": ["integer", "null"], "mininum": 1},
+    "category_weight": {"type": ["integer", "null"]},
+    "change_recommendation_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "comment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "created": {"type": ["integer", "null"]},
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "derived_motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "forwarding_tree_motion_ids": {
+        "type": "array",
+        "default": [],
+        "items": {"type": "integer"},
+    },
+    "id": {"type": ["integer", "null"]},
+    "last_modified": {"type": ["integer", "null"]},
+    "lead_motion_id": {"type": ["integer", "null"], "mininum": 1},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "modified_final_version": {"type": "string"},
+    "number": {"type": "string", "maxLength": 256},
+    "origin_id": {"type": ["integer", "null"], "mininum": 1},
+    "personal_note_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "reason": {"type": "string"},
+    "recommendation_extension": {"type": "string", "maxLength": 256},
+    "recommendation_extension_reference_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {
+            "type": "string",
+            "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+            "minLength": 1,
+        },
+    },
+    "recommendation_id": {"type": ["integer", "null"], "mininum": 1},
+    "referenced_in_motion_recommendation_extension_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "sequential_number": {
+        "description": "The (positive) serial number of this motion. This number is auto-generated and read-only.",
+        "type": ["integer", "null"],
+    },
+    "sort_child_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "sort_parent_id": {"type": ["integer", "null"], "mininum": 1},
+    "sort_weight": {"type": ["integer", "null"]},
+    "state_extension": {"type": "string", "maxLength": 256},
+    "state_id": {"type": "integer", "mininum": 1},
+    "statute_paragraph_id": {"type": ["integer", "null"], "mininum": 1},
+    "submitter_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "supporter_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "tag_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "text": {"type": "string"},
+    "title": {"type": "string", "minLength": 1, "maxLength": 256},
+}
+
+
+def set_defaults_motion_submitter(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+MOTION_SUBMITTER_PROPERTIES: Dict[str, Schema] = {
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+def validate_fields_motion_comment(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "comment" in instance:
+        instance["comment"] = html_strict_field.validate(instance["comment"])
+    return instance
+
+
+MOTION_COMMENT_PROPERTIES: Dict[str, Schema] = {
+    "comment": {"type": "string"},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_id": {"type": "integer", "mininum": 1},
+    "section_id": {"type": "integer", "mininum": 1},
+}
+
+
+def set_defaults_motion_comment_section(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+MOTION_COMMENT_SECTION_PROPERTIES: Dict[str, Schema] = {
+    "comment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "read_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "weight": {"type": ["integer", "null"]},
+    "write_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+def set_defaults_motion_category(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+MOTION_CATEGORY_PROPERTIES: Dict[str, Schema] = {
+    "child_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "level": {"description": "Calculated field.", "type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "parent_id": {"type": ["integer", "null"], "mininum": 1},
+    "prefix": {"type": "string", "minLength": 1, "maxLength": 256},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+MOTION_BLOCK_PROPERTIES: Dict[str, Schema] = {
+    "agenda_item_id": {"type": ["integer", "null"], "mininum": 1},
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "internal": {"type": ["boolean", "null"]},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "title": {"type": "string", "minLength": 1, "maxLength": 256},
+}
+
+
+def set_defaults_motion_change_recommendation(
+    instance: Dict[str, Any]
+) -> Dict[str, Any]:
+    if "type" not in instance:
+        instance["type"] = 0
+    return instance
+
+
+def validate_fields_motion_change_recommendation(
+    instance: Dict[str, Any]
+) -> Dict[str, Any]:
+    if "text" in instance:
+        instance["text"] = html_strict_field.validate(instance["text"])
+    return instance
+
+
+MOTION_CHANGE_RECOMMENDATION_PROPERTIES: Dict[str, Schema] = {
+    "creation_time": {"type": ["integer", "null"]},
+    "id": {"type": ["integer", "null"]},
+    "internal": {"type": ["boolean", "null"]},
+    "line_from": {"minimum": 0, "type": ["integer", "null"]},
+    "line_to": {"minimum": 0, "type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_id": {"type": "integer", "mininum": 1},
+    "other_description": {"type": "string", "maxLength": 256},
+    "rejected": {"type": ["boolean", "null"]},
+    "text": {"type": "string"},
+    "type": {"enum": [0, 1, 2, 3], "type": ["integer", "null"]},
+}
+
+
+def set_defaults_motion_state(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "merge_amendment_into_final" not in instance:
+        instance["merge_amendment_into_final"] = 0
+    if "restrictions" not in instance:
+        instance["restrictions"] = []
+    return instance
+
+
+MOTION_STATE_PROPERTIES: Dict[str, Schema] = {
+    "allow_create_poll": {"type": ["boolean", "null"]},
+    "allow_submitter_edit": {"type": ["boolean", "null"]},
+    "allow_support": {"type": ["boolean", "null"]},
+    "css_class": {
+        "enum": ["grey", "red", "green", "lightblue", "yellow"],
+        "type": "string",
+        "maxLength": 256,
+    },
+    "first_state_of_workflow_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "merge_amendment_into_final": {"enum": [-1, 0, 1], "type": ["integer", "null"]},
+    "motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "motion_recommendation_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "next_state_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "previous_state_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "recommendation_label": {"type": "string", "maxLength": 256},
+    "restrictions": {
+        "type": "array",
+        "default": [],
+        "items": {
+            "type": "string",
+            "maxLength": 256,
+            "enum": [
+                "motions.can_see_internal",
+                "motions.can_manage_metadata",
+                "motions.can_manage",
+                "is_submitter",
+            ],
+        },
+    },
+    "set_number": {"type": ["boolean", "null"]},
+    "show_recommendation_extension_field": {"type": ["boolean", "null"]},
+    "show_state_extension_field": {"type": ["boolean", "null"]},
+    "workflow_id": {"type": "integer", "mininum": 1},
+}
+
+
+MOTION_WORKFLOW_PROPERTIES: Dict[str, Schema] = {
+    "default_amendment_workflow_meeting_id": {
+        "type": ["integer", "null"],
+        "mininum": 1,
+    },
+    "default_statute_amendment_workflow_meeting_id": {
+        "type": ["integer", "null"],
+        "mininum": 1,
+    },
+    "default_workflow_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "first_state_id": {"type": "integer", "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "name": {"type": "string", "minLength": 1, "maxLength": 256},
+    "state_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+def set_defaults_motion_statute_paragraph(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+def validate_fields_motion_statute_paragraph(
+    instance: Dict[str, Any]
+) -> Dict[str, Any]:
+    if "text" in instance:
+        instance["text"] = html_strict_field.validate(instance["text"])
+    return instance
+
+
+MOTION_STATUTE_PARAGRAPH_PROPERTIES: Dict[str, Schema] = {
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "motion_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "text": {"type": "string"},
+    "title": {"type": "string", "minLength": 1, "maxLength": 256},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+MOTION_POLL_PROPERTIES: Dict[str, Schema] = {
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "entitled_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "majority_method": {"type": "string", "maxLength": 256},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "motion_id": {"type": ["integer", "null"], "mininum": 1},
+    "onehundred_percent_base": {"type": "string", "maxLength": 256},
+    "option_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "pollmethod": {"type": "string", "maxLength": 256},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "state": {"type": ["integer", "null"]},
+    "title": {"type": "string", "maxLength": 256},
+    "type": {"type": "string", "maxLength": 256},
+    "user_has_voted": {"type": ["boolean", "null"]},
+    "voted_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "votescast": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "votesinvalid": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "votesvalid": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+MOTION_OPTION_PROPERTIES: Dict[str, Schema] = {
+    "abstain": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "no": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "poll_id": {"type": ["integer", "null"], "mininum": 1},
+    "vote_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "yes": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+MOTION_VOTE_PROPERTIES: Dict[str, Schema] = {
+    "delegated_user_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "option_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+    "value": {"type": "string", "maxLength": 256},
+    "weight": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+def set_defaults_assignment(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "open_posts" not in instance:
+        instance["open_posts"] = 0
+    if "phase" not in instance:
+        instance["phase"] = 0
+    return instance
+
+
+def validate_fields_assignment(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "description" in instance:
+        instance["description"] = html_strict_field.validate(instance["description"])
+    return instance
+
+
+ASSIGNMENT_PROPERTIES: Dict[str, Schema] = {
+    "agenda_item_id": {"type": ["integer", "null"], "mininum": 1},
+    "attachment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "candidate_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "default_poll_description": {"type": "string", "maxLength": 256},
+    "description": {"type": "string"},
+    "id": {"type": ["integer", "null"]},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "number_poll_candidates": {"type": ["boolean", "null"]},
+    "open_posts": {"minimum": 0, "type": ["integer", "null"]},
+    "phase": {"enum": [0, 1, 2], "type": ["integer", "null"]},
+    "poll_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "tag_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "title": {"type": "string", "minLength": 1, "maxLength": 256},
+}
+
+
+def set_defaults_assignment_candidate(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+ASSIGNMENT_CANDIDATE_PROPERTIES: Dict[str, Schema] = {
+    "assignment_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+    "weight": {"type": ["integer", "null"]},
+}
+
+
+ASSIGNMENT_POLL_PROPERTIES: Dict[str, Schema] = {
+    "allow_multiple_votes_per_candidate": {"type": ["boolean", "null"]},
+    "amount_global_abstain": {
+        "type": "string",
+        "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$",
+    },
+    "amount_global_no": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "assignment_id": {"type": ["integer", "null"], "mininum": 1},
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "description": {"type": "string", "maxLength": 256},
+    "entitled_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "global_abstain": {"type": ["boolean", "null"]},
+    "global_no": {"type": ["boolean", "null"]},
+    "id": {"type": ["integer", "null"]},
+    "majority_method": {"type": "string", "maxLength": 256},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "onehundred_percent_base": {"type": "string", "maxLength": 256},
+    "option_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "pollmethod": {"type": "string", "maxLength": 256},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "state": {"type": ["integer", "null"]},
+    "title": {"type": "string", "maxLength": 256},
+    "type": {"type": "string", "maxLength": 256},
+    "user_has_voted": {"type": ["boolean", "null"]},
+    "voted_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "votes_amount": {"type": ["integer", "null"]},
+    "votescast": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "votesinvalid": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "votesvalid": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+def set_defaults_assignment_option(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "weight" not in instance:
+        instance["weight"] = 10000
+    return instance
+
+
+ASSIGNMENT_OPTION_PROPERTIES: Dict[str, Schema] = {
+    "abstain": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "no": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+    "poll_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+    "vote_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "weight": {"type": ["integer", "null"]},
+    "yes": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+ASSIGNMENT_VOTE_PROPERTIES: Dict[str, Schema] = {
+    "delegated_user_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "option_id": {"type": ["integer", "null"], "mininum": 1},
+    "user_id": {"type": ["integer", "null"], "mininum": 1},
+    "value": {"type": "string", "maxLength": 256},
+    "weight": {"type": "string", "pattern": "^-?(\\d|[1-9]\\d+)\\.\\d{6}$"},
+}
+
+
+def validate_fields_mediafile(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "attachment_ids" in instance:
+        instance["attachment_ids"] = [
+            string_to_fqid(fqid) for fqid in instance["attachment_ids"]
+        ]
+    return instance
+
+
+MEDIAFILE_PROPERTIES: Dict[str, Schema] = {
+    "access_group_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "attachment_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {
+            "type": "string",
+            "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+            "minLength": 1,
+        },
+    },
+    "child_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "create_timestamp": {"type": ["integer", "null"]},
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "filename": {
+        "descriptin": "The uploaded filename. Will be used for downloading. Only writeable on create.",
+        "type": "string",
+        "minLength": 1,
+        "maxLength": 256,
+    },
+    "filesize": {
+        "description": "In bytes, not the human readable format anymore.",
+        "type": ["integer", "null"],
+    },
+    "has_inherited_access_groups": {
+        "description": "Calculated field.",
+        "type": ["boolean", "null"],
+    },
+    "id": {"type": ["integer", "null"]},
+    "inherited_access_group_ids": {
+        "description": "Calculated field.",
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "is_directory": {"type": ["boolean", "null"]},
+    "list_of_speakers_id": {"type": "integer", "mininum": 1},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "mimetype": {"type": "string", "maxLength": 256},
+    "parent_id": {"type": ["integer", "null"], "mininum": 1},
+    "pdf_information": {"type": "string"},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "title": {
+        "description": "Title and parent_id must be unique.",
+        "type": "string",
+        "maxLength": 256,
+    },
+    "used_as_font__in_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "used_as_logo__in_meeting_id": {"type": ["integer", "null"], "mininum": 1},
+}
+
+
+def validate_fields_projector(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "current_element_ids" in instance:
+        instance["current_element_ids"] = [
+            string_to_fqid(fqid) for fqid in instance["current_element_ids"]
+        ]
+    return instance
+
+
+PROJECTOR_PROPERTIES: Dict[str, Schema] = {
+    "aspect_ratio_denominator": {"type": ["integer", "null"]},
+    "aspect_ratio_numerator": {"type": ["integer", "null"]},
+    "background_color": {"type": "string", "maxLength": 256},
+    "chyron_background_color": {"type": "string", "maxLength": 256},
+    "chyron_font_color": {"type": "string", "maxLength": 256},
+    "color": {"type": "string", "maxLength": 256},
+    "current_element_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {
+            "type": "string",
+            "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+            "minLength": 1,
+        },
+    },
+    "current_projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "header_background_color": {"type": "string", "maxLength": 256},
+    "header_font_color": {"type": "string", "maxLength": 256},
+    "header_h1_color": {"type": "string", "maxLength": 256},
+    "history_projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "name": {"type": "string", "maxLength": 256},
+    "preview_projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "projectiondefault_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "scale": {"type": ["integer", "null"]},
+    "scroll": {"type": ["integer", "null"]},
+    "show_header_footer": {"type": ["boolean", "null"]},
+    "show_logo": {"type": ["boolean", "null"]},
+    "show_title": {"type": ["boolean", "null"]},
+    "used_as_reference_projector_meeting_id": {
+        "type": ["integer", "null"],
+        "mininum": 1,
+    },
+    "width": {"type": ["integer", "null"]},
+}
+
+
+def validate_fields_projection(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "element_id" in instance:
+        instance["element_id"] = string_to_fqid(instance["element_id"])
+    return instance
+
+
+PROJECTION_PROPERTIES: Dict[str, Schema] = {
+    "current_projector_id": {"type": ["integer", "null"], "mininum": 1},
+    "element_id": {
+        "type": ["string", "null"],
+        "pattern": "^[a-z]([a-z_]*[a-z])?/[1-9][0-9]*$",
+        "minLength": 1,
+    },
+    "history_projector_id": {"type": ["integer", "null"], "mininum": 1},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": "integer", "mininum": 1},
+    "options": {"type": "string"},
+    "preview_projector_id": {"type": ["integer", "null"], "mininum": 1},
+}
+
+
+PROJECTIONDEFAULT_PROPERTIES: Dict[str, Schema] = {
+    "display_name": {"type": "string", "maxLength": 256},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "name": {"type": "string", "maxLength": 256},
+    "projector_id": {"type": ["integer", "null"], "mininum": 1},
+}
+
+
+def validate_fields_projector_message(instance: Dict[str, Any]) -> Dict[str, Any]:
+    if "message" in instance:
+        instance["message"] = html_strict_field.validate(instance["message"])
+    return instance
+
+
+PROJECTOR_MESSAGE_PROPERTIES: Dict[str, Schema] = {
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "message": {"type": "string"},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+}
+
+
+PROJECTOR_COUNTDOWN_PROPERTIES: Dict[str, Schema] = {
+    "countdown_time": {"type": ["integer", "null"]},
+    "current_projector_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "default_time": {"type": ["integer", "null"]},
+    "description": {"type": "string", "maxLength": 256},
+    "id": {"type": ["integer", "null"]},
+    "meeting_id": {"type": ["integer", "null"], "mininum": 1},
+    "projection_ids": {
+        "type": "array",
+        "uniqueItems": True,
+        "items": {"type": "integer", "mininum": 1},
+    },
+    "running": {"type": ["boolean", "null"]},
+    "title": {"type": "string", "maxLength": 256},
+}
+
+
+SET_DEFAULTS: Dict[str, InstanceFunction] = {
+    "organisation": keep_instance,
+    "user": keep_instance,
+    "role": set_defaults_role,
+    "resource": keep_instance,
+    "committee": keep_instance,
+    "meeting": set_defaults_meeting,
+    "group": set_defaults_group,
+    "personal_note": keep_instance,
+    "tag": keep_instance,
+    "agenda_item": set_defaults_agenda_item,
+    "list_of_speakers": keep_instance,
+    "speaker": set_defaults_speaker,
+    "topic": keep_instance,
+    "motion": set_defaults_motion,
+    "motion_submitter": set_defaults_motion_submitter,
+    "motion_comment": keep_instance,
+    "motion_comment_section": set_defaults_motion_comment_section,
+    "motion_category": set_defaults_motion_category,
+    "motion_block": keep_instance,
+    "motion_change_recommendation": set_defaults_motion_change_recommendation,
+    "motion_state": set_defaults_motion_state,
+    "motion_workflow": keep_instance,
+    "motion_statute_paragraph": set_defaults_motion_statute_paragraph,
+    "motion_poll": keep_instance,
+    "motion_option": keep_instance,
+    "motion_vote": keep_instance,
+    "assignment": set_defaults_assignment,
+    "assignment_candidate": set_defaults_assignment_candidate,
+    "assignment_poll": keep_instance,
+    "assignment_option": set_defaults_assignment_option,
+    "assignment_vote": keep_instance,
+    "mediafile": keep_instance,
+    "projector": keep_instance,
+    "projection": keep_instance,
+    "projectiondefault": keep_instance,
+    "projector_message": keep_instance,
+    "projector_countdown": keep_instance,
+}
+
+
+VALIDATE_FIELDS: Dict[str, InstanceFunction] = {
+    "organisation": validate_fields_organisation,
+    "user": validate_fields_user,
+    "role": keep_instance,
+    "resource": keep_instance,
+    "committee": validate_fields_committee,
+    "meeting": validate_fields_meeting,
+    "group": keep_instance,
+    "personal_note": validate_fields_personal_note,
+    "tag": validate_fields_tag,
+    "agenda_item": validate_fields_agenda_item,
+    "list_of_speakers": validate_fields_list_of_speakers,
+    "speaker": keep_instance,
+    "topic": validate_fields_topic,
+    "motion": validate_fields_motion,
+    "motion_submitter": keep_instance,
+    "motion_comment": validate_fields_motion_comment,
+    "motion_comment_section": keep_instance,
+    "motion_category": keep_instance,
+    "motion_block": keep_instance,
+    "motion_change_recommendation": validate_fields_motion_change_recommendation,
+    "motion_state": keep_instance,
+    "motion_workflow": keep_instance,
+    "motion_statute_paragraph": validate_fields_motion_statute_paragraph,
+    "motion_poll": keep_instance,
+    "motion_option": keep_instance,
+    "motion_vote": keep_instance,
+    "assignment": validate_fields_assignment,
+    "assignment_candidate": keep_instance,
+    "assignment_poll": keep_instance,
+    "assignment_option": keep_instance,
+    "assignment_vote": keep_instance,
+    "mediafile": validate_fields_mediafile,
+    "projector": validate_fields_projector,
+    "projection": validate_fields_projection,
+    "projectiondefault": keep_instance,
+    "projector_message": validate_fields_projector_message,
+    "projector_countdown": keep_instance,
+}
+
+
+PROPERTIES: Dict[str, Dict[str, Schema]] = {
+    "organisation": ORGANISATION_PROPERTIES,
+    "user": USER_PROPERTIES,
+    "role": ROLE_PROPERTIES,
+    "resource": RESOURCE_PROPERTIES,
+    "committee": COMMITTEE_PROPERTIES,
+    "meeting": MEETING_PROPERTIES,
+    "group": GROUP_PROPERTIES,
+    "personal_note": PERSONAL_NOTE_PROPERTIES,
+    "tag": TAG_PROPERTIES,
+    "agenda_item": AGENDA_ITEM_PROPERTIES,
+    "list_of_speakers": LIST_OF_SPEAKERS_PROPERTIES,
+    "speaker": SPEAKER_PROPERTIES,
+    "topic": TOPIC_PROPERTIES,
+    "motion": MOTION_PROPERTIES,
+    "motion_submitter": MOTION_SUBMITTER_PROPERTIES,
+    "motion_comment": MOTION_COMMENT_PROPERTIES,
+    "motion_comment_section": MOTION_COMMENT_SECTION_PROPERTIES,
+    "motion_category": MOTION_CATEGORY_PROPERTIES,
+    "motion_block": MOTION_BLOCK_PROPERTIES,
+    "motion_change_recommendation": MOTION_CHANGE_RECOMMENDATION_PROPERTIES,
+    "motion_state": MOTION_STATE_PROPERTIES,
+    "motion_workflow": MOTION_WORKFLOW_PROPERTIES,
+    "motion_statute_paragraph": MOTION_STATUTE_PARAGRAPH_PROPERTIES,
+    "motion_poll": MOTION_POLL_PROPERTIES,
+    "motion_option": MOTION_OPTION_PROPERTIES,
+    "motion_vote": MOTION_VOTE_PROPERTIES,
+    "assignment": ASSIGNMENT_PROPERTIES,
+    "assignment_candidate": ASSIGNMENT_CANDIDATE_PROPERTIES,
+    "assignment_poll": ASSIGNMENT_POLL_PROPERTIES,
+    "assignment_option": ASSIGNMENT_OPTION_PROPERTIES,
+    "assignment_vote": ASSIGNMENT_VOTE_PROPERTIES,
+    "mediafile": MEDIAFILE_PROPERTIES,
+    "projector": PROJECTOR_PROPERTIES,
+    "projection": PROJECTION_PROPERTIES,
+    "projectiondefault": PROJECTIONDEFAULT_PROPERTIES,
+    "projector_message": PROJECTOR_MESSAGE_PROPERTIES,
+    "projector_countdown": PROJECTOR_COUNTDOWN_PROPERTIES,
+}
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import bleach
+
+CACHE_SIZE_VARIABLE = "OPENSLIDES_BACKEND_HTML_CACHE_SIZE"
+WORKERS_VARIABLE = "OPENSLIDES_BACKEND_HTML_SANITIZE_WORKERS"
+WORKER_THRESHOLD_VARIABLE = "OPENSLIDES_BACKEND_HTML_SANITIZE_WORKER_THRESHOLD"
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_WORKER_THRESHOLD = 100000
+
+# Characters which bleach changes in text without markup. If a value contains
+# none of them, bleach returns it unchanged.
+UNSAFE_CHARACTERS = re.compile("[\x00-\x08\x0b-\x1f&<>\ud800-\udfff]")
+
+
+def allow_all(tag: str, name: str, value: str) -> bool:
+    return True
+
+
+def clean(html: str, tags: Tuple[str, ...], styles: Tuple[str, ...]) -> str:
+    return bleach.clean(
+        html, tags=list(tags), attributes=allow_all, styles=list(styles)
+    )
+
+
+class SanitizerStatistics:
+    """
+    Counters of the HTML sanitization of this process.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.plain_text = 0
+        self.cache_hits = 0
+        self.cleaned = 0
+        self.offloaded = 0
+        self.time = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(vars(self))
+
+
+statistics = SanitizerStatistics()
+
+
+class SanitizerCache:
+    """
+    Bounded LRU cache mapping the content hash of HTML values to their
+    sanitized output. Outputs are also stored under their own hash, so that
+    already sanitized values which are sent again are recognized as canonical.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: str) -> None:
+        if self.size <= 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+cache = SanitizerCache(int(os.environ.get(CACHE_SIZE_VARIABLE, DEFAULT_CACHE_SIZE)))
+
+
+@lru_cache(maxsize=None)
+def get_pool() -> Optional[Executor]:
+    """
+    Returns the process pool for large documents if it is configured.
+    """
+    workers = int(os.environ.get(WORKERS_VARIABLE, 0))
+    if workers <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+class HTMLSanitizer:
+    """
+    Sanitizes HTML with bleach using the given allowed tags and styles.
+
+    Values without markup are returned directly and results are cached by
+    content hash. If the environment variable
+    OPENSLIDES_BACKEND_HTML_SANITIZE_WORKERS is set, documents larger than
+    OPENSLIDES_BACKEND_HTML_SANITIZE_WORKER_THRESHOLD characters are cleaned
+    in a process pool with this number of workers so that concurrent requests
+    are not serialized by the GIL.
+    """
+
+    def __init__(self, tags: Tuple[str, ...], styles: Tuple[str, ...]) -> None:
+        self.tags = tags
+        self.styles = styles
+        self.prefix = hashlib.sha256(repr((tags, styles)).encode()).digest()
+        self.worker_threshold = int(
+            os.environ.get(WORKER_THRESHOLD_VARIABLE, DEFAULT_WORKER_THRESHOLD)
+        )
+
+    def sanitize(self, html: str) -> str:
+        start = time.perf_counter()
+        statistics.calls += 1
+        try:
+            if not UNSAFE_CHARACTERS.search(html):
+                statistics.plain_text += 1
+                return html
+            key = self.get_key(html)
+            result = cache.get(key)
+            if result is not None:
+                statistics.cache_hits += 1
+                return result
+            result = self.clean(html)
+            cache.set(key, result)
+            if result != html:
+                cache.set(self.get_key(result), result)
+            return result
+        finally:
+            statistics.time += time.perf_counter() - start
+
+    def get_key(self, html: str) -> bytes:
+        return hashlib.blake2b(
+            html.encode("utf-8", "surrogatepass"), digest_size=16, key=self.prefix
+        ).digest()
+
+    def clean(self, html: str) -> str:
+        statistics.cleaned += 1
+        pool = get_pool()
+        if pool is not None and len(html) > self.worker_threshold:
+            statistics.offloaded += 1
+            return pool.submit(clean, html, self.tags, self.styles).result()
+        return clean(html, self.tags, self.styles)
+
+
+@lru_cache(maxsize=None)
+def get_sanitizer(tags: Tuple[str, ...], styles: Tuple[str, ...]) -> HTMLSanitizer:
+    return HTMLSanitizer(tags, styles)
@@ -1,14 +1,13 @@
 from typing import Any
 
-import fastjsonschema
-
 from ..models.models import Mediafile
 from ..shared.patterns import FullQualifiedId
 from ..shared.schema import required_id_schema, schema_version
+from ..shared.schema_validator import LazySchemaValidator
 from .base import BasePresenter
 from .presenter import register_presenter
 
-check_mediafile_id_schema = fastjsonschema.compile(
+check_mediafile_id_schema = LazySchemaValidator(
     {
         "$schema": schema_version,
         "type": "object",
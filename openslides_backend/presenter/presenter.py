@@ -1,11 +1,12 @@
 from typing import Callable, Dict, Type
 
-import fastjsonschema
 from fastjsonschema import JsonSchemaException
 
 from ..shared.exceptions import PresenterException
 from ..shared.handlers import Base as HandlerBase
+from ..shared.logging import PayloadSummary
 from ..shared.schema import schema_version
+from ..shared.schema_validator import LazySchemaValidator
 from .base import BasePresenter
 from .presenter_interface import Payload, PresenterResponse
 
@@ -27,7 +28,7 @@ def register_presenter(
     return wrapper
 
 
-payload_schema = fastjsonschema.compile(
+payload_schema = LazySchemaValidator(
     {
         "$schema": schema_version,
         "title": "Schema for presenter API",
@@ -89,7 +90,8 @@ class PresenterHandler(HandlerBase):
         """
         # permissions = self.permission().get_all(self.user_id)
         self.logger.debug(
-            f"Presenter map contains the following presenters: {presenters_map}."
+            "Presenter map contains the following presenters: %s.",
+            PayloadSummary(presenters_map),
         )
         response = []
         for presenter_blob in payload:
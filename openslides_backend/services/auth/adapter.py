@@ -6,6 +6,7 @@ from authlib.exceptions import AuthenticateException, InvalidCredentialsExceptio
 
 from ...shared.exceptions import AuthenticationException as BackendAuthException
 from ...shared.interfaces import Headers, LoggingModule
+from ...shared.logging import PayloadSummary
 from .interface import AuthenticationService
 
 
@@ -28,12 +29,13 @@ class AuthenticationHTTPAdapter(AuthenticationService):
         """
 
         self.logger.debug(
-            f"Start request to authentication service with the following data: {headers}"
+            "Start request to authentication service with the following data: %s",
+            PayloadSummary(headers),
         )
         try:
             return self.auth_handler.authenticate(headers, cookies)
         except (AuthenticateException, InvalidCredentialsException) as e:
-            self.logger.debug(f"Error in auth service: {e.message}")
+            self.logger.debug("Error in auth service: %s", e.message)
             raise BackendAuthException(e.message)
 
     def hash(self, toHash: str) -> str:
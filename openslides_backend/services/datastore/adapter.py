@@ -6,6 +6,7 @@ from simplejson.errors import JSONDecodeError
 from ...shared.exceptions import DatabaseException
 from ...shared.filters import And, Filter, FilterOperator
 from ...shared.interfaces import LoggingModule, WriteRequestElement
+from ...shared.logging import PayloadSummary
 from ...shared.patterns import Collection, FullQualifiedField, FullQualifiedId
 from . import commands
 from .deleted_models_behaviour import DeletedModelsBehaviour
@@ -35,7 +36,13 @@ class Adapter:
 
         This method also checks the payload and decodes JSON body.
         """
-        content, status_code = self.engine.retrieve(command.name, command.data)
+        data = command.data
+        self.logger.debug(
+            "Start %s request to datastore with the following data: %s",
+            command.name.upper(),
+            PayloadSummary(data),
+        )
+        content, status_code = self.engine.retrieve(command.name, data)
         if len(content):
             try:
                 payload = json.loads(content)
@@ -44,7 +51,9 @@ class Adapter:
                 raise DatabaseException(error_message)
         else:
             payload = None
-        self.logger.debug(f"Get repsonse with status code {status_code}: {payload}")
+        self.logger.debug(
+            "Get response with status code %s: %s", status_code, PayloadSummary(payload)
+        )
         if status_code >= 400:
             error_message = f"Datastore service sends HTTP {status_code}."
             additional_error_message = (
@@ -74,9 +83,6 @@ class Adapter:
             position=position,
             get_deleted_models=get_deleted_models,
         )
-        self.logger.debug(
-            f"Start GET request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         if lock_result:
             instance_position = response.get("meta_position")
@@ -109,9 +115,6 @@ class Adapter:
             position=position,
             get_deleted_models=get_deleted_models,
         )
-        self.logger.debug(
-            f"Start GET_MANY request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         result = {}
         for collection_str in response.keys():
@@ -148,9 +151,6 @@ class Adapter:
             mapped_fields=mapped_fields_set,
             get_deleted_models=get_deleted_models,
         )
-        self.logger.debug(
-            f"Start GET_ALL request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         if lock_result:
             for item in response:
@@ -188,9 +188,6 @@ class Adapter:
         command = commands.Filter(
             collection=collection, filter=filter, mapped_fields=mapped_fields_set
         )
-        self.logger.debug(
-            f"Start FILTER request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         if lock_result:
             for instance_id, item in response.items():
@@ -210,9 +207,6 @@ class Adapter:
         self, collection: Collection, filter: Filter, lock_result: bool = False,
     ) -> Found:
         command = commands.Exists(collection=collection, filter=filter)
-        self.logger.debug(
-            f"Start EXISTS request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         if lock_result:
             position = response.get("position")
@@ -225,9 +219,6 @@ class Adapter:
         self, collection: Collection, filter: Filter, lock_result: bool = False,
     ) -> Count:
         command = commands.Count(collection=collection, filter=filter)
-        self.logger.debug(
-            f"Start COUNT request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         if lock_result:
             raise NotImplementedError("Locking is not implemented")
@@ -240,9 +231,6 @@ class Adapter:
         command = commands.Min(
             collection=collection, filter=filter, field=field, type=type
         )
-        self.logger.debug(
-            f"Start MIN request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         return response
 
@@ -253,9 +241,6 @@ class Adapter:
         command = commands.Max(
             collection=collection, filter=filter, field=field, type=type
         )
-        self.logger.debug(
-            f"Start MAX request to datastore with the following data: {command.data}"
-        )
         response = self.retrieve(command)
         return response
 
@@ -275,10 +260,6 @@ class Adapter:
 
     def reserve_ids(self, collection: Collection, amount: int) -> Sequence[int]:
         command = commands.ReserveIds(collection=collection, amount=amount)
-        self.logger.debug(
-            f"Start RESERVE_IDS request to datastore with the following data: "
-            f"Collection: {collection}, Amount: {amount}"
-        )
         response = self.retrieve(command)
         return response.get("ids")
 
@@ -289,13 +270,8 @@ class Adapter:
         command = commands.Write(
             write_request=write_request, locked_fields=self.locked_fields
         )
-        self.logger.debug(
-            f"Start WRITE request to datastore with the following data: "
-            f"Write request: {write_request}"
-        )
         self.retrieve(command)
 
     def truncate_db(self) -> None:
         command = commands.TruncateDb()
-        self.logger.debug("Start TRUNCATE_DB request to datastore")
         self.retrieve(command)
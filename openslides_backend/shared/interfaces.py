@@ -16,19 +16,19 @@ class Logger(Protocol):  # pragma: no cover
     Interface for logger object provided by LoggingModule.
     """
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         ...
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         ...
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         ...
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         ...
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         ...
 
 
@@ -64,6 +64,7 @@ class View(Protocol):  # pragma: no cover
     """
 
     method: str
+    stream_request_body: bool
 
     def __init__(self, logging: LoggingModule, services: Services) -> None:
         ...
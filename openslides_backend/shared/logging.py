@@ -0,0 +1,41 @@
+import os
+from typing import Any, Optional
+
+PAYLOAD_LENGTH_VARIABLE = "OPENSLIDES_BACKEND_LOG_PAYLOAD_LENGTH"
+
+DEFAULT_PAYLOAD_LENGTH = 1000
+
+
+def get_max_payload_length() -> int:
+    return int(os.environ.get(PAYLOAD_LENGTH_VARIABLE, DEFAULT_PAYLOAD_LENGTH))
+
+
+class PayloadSummary:
+    """
+    Wraps a payload which is passed as argument to a log call, e. g.
+
+        logger.debug("Request contains JSON: %s", PayloadSummary(body))
+
+    The payload is only converted to a string if the record is actually
+    emitted, so disabled log levels cost nothing. A callable is called at that
+    time, too, to defer expensive computations like JSON serialization. The
+    result is cut off after OPENSLIDES_BACKEND_LOG_PAYLOAD_LENGTH characters.
+    """
+
+    def __init__(self, payload: Any, max_length: Optional[int] = None) -> None:
+        self.payload = payload
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        payload = self.payload
+        if callable(payload):
+            payload = payload()
+        text = payload if isinstance(payload, str) else str(payload)
+        max_length = (
+            self.max_length if self.max_length is not None else get_max_payload_length()
+        )
+        if max_length < 0 or len(text) <= max_length:
+            return text
+        return f"{text[:max_length]}... ({len(text)} characters)"
+
+    __repr__ = __str__
@@ -1,3 +1,5 @@
+from typing import Any
+
 from .patterns import FullQualifiedId
 from .typing import Schema
 
@@ -25,3 +27,29 @@ base_list_schema: Schema = {
 }
 id_list_schema: Schema = {**base_list_schema, "items": required_id_schema}
 fqid_list_schema: Schema = {**base_list_schema, "items": required_fqid_schema}
+
+# keywords whose values map arbitrary names to subschemas
+SCHEMA_MAPPING_KEYWORDS = ("properties", "patternProperties", "definitions")
+
+
+def without_defaults(schema: Any) -> Any:
+    """
+    Returns a copy of the given schema without any default keywords. Validators
+    compiled by fastjsonschema write defaults into the validated data, so this
+    is used for validators which must not change the payload.
+    """
+    if isinstance(schema, list):
+        return [without_defaults(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    result = {}
+    for key, value in schema.items():
+        if key == "default":
+            continue
+        if key in SCHEMA_MAPPING_KEYWORDS and isinstance(value, dict):
+            result[key] = {
+                name: without_defaults(subschema) for name, subschema in value.items()
+            }
+        else:
+            result[key] = without_defaults(value)
+    return result
@@ -0,0 +1,116 @@
+import hashlib
+import importlib.util
+import os
+import py_compile
+from typing import Any, Callable, List, Optional
+
+import fastjsonschema
+import simplejson as json
+from fastjsonschema.ref_resolver import RefResolver
+
+from .schema import without_defaults
+from .typing import Schema
+
+SCHEMA_CACHE_VARIABLE = "OPENSLIDES_BACKEND_SCHEMA_CACHE"
+
+Validator = Callable[[Any], Any]
+
+
+class LazySchemaValidator:
+    """
+    Callable JSON schema validator that compiles the schema on first use.
+
+    If the environment variable OPENSLIDES_BACKEND_SCHEMA_CACHE points to a
+    directory containing precompiled validator code (see
+    cli/build_schema_cache.py), the code is loaded from there instead of being
+    generated.
+
+    If use_default is False, default keywords are removed from the schema so
+    that validation does not change the validated data.
+    """
+
+    def __init__(self, schema: Schema, use_default: bool = True) -> None:
+        self.schema = schema
+        self.use_default = use_default
+        self.validator: Optional[Validator] = None
+        schema_validators.append(self)
+
+    def __call__(self, data: Any) -> Any:
+        if self.validator is None:
+            self.validator = compile_schema(self.get_definition())
+        return self.validator(data)
+
+    def get_definition(self) -> Schema:
+        """
+        Returns the schema which is actually compiled.
+        """
+        if self.use_default:
+            return self.schema
+        return without_defaults(self.schema)
+
+    def is_compiled(self) -> bool:
+        return self.validator is not None
+
+
+schema_validators: List[LazySchemaValidator] = []
+"""
+All created lazy validators. Used to build the schema cache.
+"""
+
+
+def get_unique_items_digest(item: Any) -> bytes:
+    """
+    Returns a digest of the representation of the item which fastjsonschema
+    compares for uniqueItems. Keeping digests instead of the items allows to
+    check uniqueness incrementally.
+    """
+    return hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+
+
+def get_schema_hash(schema: Schema) -> str:
+    """
+    Returns a hash of the given schema and the fastjsonschema version which is
+    used as key in the schema cache.
+    """
+    content = json.dumps(schema, sort_keys=True) + fastjsonschema.VERSION
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_cache_path(directory: str, schema: Schema) -> str:
+    return os.path.join(directory, get_schema_hash(schema) + ".py")
+
+
+def compile_schema(schema: Schema) -> Validator:
+    """
+    Loads the validator for the given schema from the schema cache or compiles
+    it if the cache is not configured or does not contain the schema.
+    """
+    directory = os.environ.get(SCHEMA_CACHE_VARIABLE)
+    if directory:
+        path = get_cache_path(directory, schema)
+        if os.path.isfile(path):
+            # Use the import system so that the bytecode is cached, too.
+            name = "schema_cache_" + os.path.basename(path)[:-3]
+            spec = importlib.util.spec_from_file_location(name, path)
+            assert spec is not None and spec.loader is not None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return getattr(module, module.ENTRY_POINT)
+    return fastjsonschema.compile(schema)
+
+
+def write_cached_validator(directory: str, schema: Schema) -> str:
+    """
+    Writes the generated validator code for the given schema into the cache
+    directory and returns the path of the file.
+    """
+    path = get_cache_path(directory, schema)
+    entry_point = RefResolver.from_schema(schema).get_scope_name()
+    code = fastjsonschema.compile_to_code(schema)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as cache_file:
+        cache_file.write(code)
+        cache_file.write(f"\n\nENTRY_POINT = {entry_point!r}\n")
+    os.replace(tmp_path, path)
+    py_compile.compile(path)
+    return path
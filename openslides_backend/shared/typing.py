@@ -1,11 +1,80 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Mapping, Optional, Set
 
 from .patterns import FullQualifiedId
 
-ModelMap = Dict[FullQualifiedId, Dict[str, Any]]
+ModelMap = Mapping[FullQualifiedId, Dict[str, Any]]
 
 Schema = Dict[str, Any]
 
 
 class DeletedModel(Dict):
     """ Used to mark deleted models which return None for each field """
+
+
+class ModelOverlay(Mapping[FullQualifiedId, Dict[str, Any]]):
+    """
+    Persistent model map consisting of a chain of immutable layers. Creating a
+    child only stores the new models and a reference to the parent, so nested
+    actions can get their own scoped view without copying the models of all
+    outer actions. Models in a child layer shadow models of the same fqid in
+    the parent layers.
+    """
+
+    __slots__ = ("models", "parent", "depth")
+
+    def __init__(
+        self, models: ModelMap = {}, parent: Optional["ModelOverlay"] = None
+    ) -> None:
+        self.models: ModelMap = dict(models)
+        self.parent = parent
+        self.depth: int = parent.depth + 1 if parent is not None else 0
+
+    @classmethod
+    def from_model_map(cls, models: ModelMap) -> "ModelOverlay":
+        """
+        Returns the given map if it already is an overlay, else wraps it into a
+        root layer.
+        """
+        if isinstance(models, cls):
+            return models
+        return cls(models)
+
+    def child(self, models: ModelMap) -> "ModelOverlay":
+        """
+        Returns a new overlay with the given models on top of this one.
+        """
+        if not models:
+            return self
+        return ModelOverlay(models, self)
+
+    def __getitem__(self, fqid: FullQualifiedId) -> Dict[str, Any]:
+        layer: Optional[ModelOverlay] = self
+        while layer is not None:
+            if fqid in layer.models:
+                return layer.models[fqid]
+            layer = layer.parent
+        raise KeyError(fqid)
+
+    def __contains__(self, fqid: object) -> bool:
+        layer: Optional[ModelOverlay] = self
+        while layer is not None:
+            if fqid in layer.models:
+                return True
+            layer = layer.parent
+        return False
+
+    def __iter__(self) -> Iterator[FullQualifiedId]:
+        seen: Set[FullQualifiedId] = set()
+        layer: Optional[ModelOverlay] = self
+        while layer is not None:
+            for fqid in layer.models:
+                if fqid not in seen:
+                    seen.add(fqid)
+                    yield fqid
+            layer = layer.parent
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ModelOverlay(depth={self.depth}, models={dict(self)!r})"
@@ -55,7 +55,7 @@ def create_wsgi_application(logging: LoggingModule, view_name: str) -> WSGIAppli
     """
     # Get environment
     environment = get_environment()
-    logging.getLogger(__name__).debug(f"Using environment: {environment}.")
+    logging.getLogger(__name__).debug("Using environment: %s.", environment)
 
     # Get view class
     view: Type[View]
@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from openslides_backend.models.models import AgendaItem
+from openslides_backend.services.datastore.adapter import Adapter
 from tests.system.action.base import BaseActionTestCase
 
 
@@ -71,4 +74,69 @@ class AgendaItemNumberingTester(BaseActionTestCase):
         agenda_item_1 = self.get_model("agenda_item/1")
         assert agenda_item_1.get("item_number") == "1"
         agenda_item_2 = self.get_model("agenda_item/2")
-        assert agenda_item_2.get("item_number") == ""
+        assert agenda_item_2.get("item_number") is None
+
+    def test_numbering_non_public_items_unchanged(self) -> None:
+        self.create_model(
+            "meeting/1", {"agenda_item_ids": [1, 2]},
+        )
+        self.create_model(
+            "agenda_item/1",
+            {"meeting_id": 1, "weight": 10, "type": 1, "item_number": "1"},
+        )
+        self.create_model(
+            "agenda_item/2",
+            {"meeting_id": 1, "weight": 10, "type": AgendaItem.HIDDEN_ITEM},
+        )
+        with patch.object(
+            Adapter, "write", autospec=True, side_effect=Adapter.write
+        ) as write_mock:
+            response = self.client.post(
+                "/",
+                json=[{"action": "agenda_item.numbering", "data": [{"meeting_id": 1}]}],
+            )
+        self.assert_status_code(response, 200)
+        write_mock.assert_not_called()
+
+    def test_numbering_meeting_settings(self) -> None:
+        self.create_model(
+            "meeting/1",
+            {
+                "agenda_item_ids": [1, 2],
+                "agenda_numeral_system": "roman",
+                "agenda_number_prefix": "TOP",
+            },
+        )
+        self.create_model(
+            "agenda_item/1", {"meeting_id": 1, "weight": 10, "type": 1},
+        )
+        self.create_model(
+            "agenda_item/2", {"meeting_id": 1, "weight": 10, "parent_id": 1, "type": 1},
+        )
+        response = self.client.post(
+            "/",
+            json=[{"action": "agenda_item.numbering", "data": [{"meeting_id": 1}]}],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("agenda_item/1", {"item_number": "TOP I"})
+        self.assert_model_exists("agenda_item/2", {"item_number": "TOP I.1"})
+
+    def test_numbering_unchanged(self) -> None:
+        self.create_model(
+            "meeting/1", {"agenda_item_ids": [1, 2]},
+        )
+        self.create_model(
+            "agenda_item/1",
+            {"meeting_id": 1, "weight": 10, "type": 1, "item_number": "1"},
+        )
+        self.create_model(
+            "agenda_item/2",
+            {"meeting_id": 1, "weight": 11, "type": 1, "item_number": "3"},
+        )
+        response = self.client.post(
+            "/",
+            json=[{"action": "agenda_item.numbering", "data": [{"meeting_id": 1}]}],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("agenda_item/1", {"item_number": "1"})
+        self.assert_model_exists("agenda_item/2", {"item_number": "2"})
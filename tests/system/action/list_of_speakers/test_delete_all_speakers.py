@@ -24,6 +24,53 @@ class ListOfSpeakersDeleteAllSpeakersActionTester(BaseActionTestCase):
         for i in range(1, 11):
             self.assert_model_deleted(f"speaker/{i}")
 
+    def test_delete_all_reverse_fields(self) -> None:
+        self.create_model(
+            "meeting/222", {"name": "name_xQyvfmsS", "speaker_ids": [1, 2, 3]}
+        )
+        self.create_model(
+            "user/42",
+            {
+                "username": "test_username42",
+                "speaker_$_ids": ["222"],
+                "speaker_222_ids": [1, 2, 3],
+            },
+        )
+        self.create_model(
+            "list_of_speakers/111",
+            {"closed": False, "meeting_id": 222, "speaker_ids": [1, 2]},
+        )
+        self.create_model(
+            "list_of_speakers/112",
+            {"closed": False, "meeting_id": 222, "speaker_ids": [3]},
+        )
+        for i in range(1, 4):
+            self.create_model(
+                f"speaker/{i}",
+                {
+                    "list_of_speakers_id": 111 if i < 3 else 112,
+                    "user_id": 42,
+                    "meeting_id": 222,
+                },
+            )
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "list_of_speakers.delete_all_speakers",
+                    "data": [{"id": 111}],
+                }
+            ],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_deleted("speaker/1")
+        self.assert_model_deleted("speaker/2")
+        self.assert_model_exists("speaker/3")
+        self.assertEqual(self.get_model("list_of_speakers/111")["speaker_ids"], [])
+        self.assertEqual(self.get_model("list_of_speakers/112")["speaker_ids"], [3])
+        self.assertEqual(self.get_model("meeting/222")["speaker_ids"], [3])
+        self.assertEqual(self.get_model("user/42")["speaker_222_ids"], [3])
+
     def test_wrong_id(self) -> None:
         response = self.client.post(
             "/",
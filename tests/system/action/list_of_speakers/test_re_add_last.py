@@ -87,3 +87,47 @@ class ListOfSpeakersReAddLastActionTest(BaseActionTestCase):
         self.assertTrue(
             "There is no last speaker that can be re-added." in str(response.data)
         )
+
+    def test_other_list_of_speakers(self) -> None:
+        self.create_model("meeting/222", {"name": "name_xQyvfmsS"})
+        self.create_model(
+            "user/42", {"username": "test_username42", "speaker_222_ids": [222]}
+        )
+        self.create_model(
+            "user/43", {"username": "test_username43", "speaker_222_ids": [223]}
+        )
+        self.create_model(
+            "list_of_speakers/111",
+            {"closed": False, "meeting_id": 222, "speaker_ids": [222]},
+        )
+        self.create_model(
+            "list_of_speakers/112",
+            {"closed": False, "meeting_id": 222, "speaker_ids": [223]},
+        )
+        self.create_model(
+            "speaker/222",
+            {
+                "list_of_speakers_id": 111,
+                "user_id": 42,
+                "begin_time": 1000,
+                "end_time": 2000,
+            },
+        )
+        self.create_model(
+            "speaker/223",
+            {
+                "list_of_speakers_id": 112,
+                "user_id": 43,
+                "begin_time": 3000,
+                "end_time": 4000,
+            },
+        )
+        response = self.client.post(
+            "/",
+            json=[{"action": "list_of_speakers.re_add_last", "data": [{"id": 111}]}],
+        )
+        self.assert_status_code(response, 200)
+        model = self.get_model("list_of_speakers/111")
+        self.assertEqual(model.get("speaker_ids"), [222, 224])
+        model = self.get_model("speaker/224")
+        self.assertEqual(model.get("user_id"), 42)
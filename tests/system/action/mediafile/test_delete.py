@@ -76,3 +76,32 @@ class MediafileDeleteActionTest(BaseActionTestCase):
         self.assert_model_deleted("mediafile/110")
         self.assert_model_deleted("mediafile/112")
         self.assert_model_deleted("mediafile/113")
+
+    def test_delete_subtree_in_meeting(self) -> None:
+        self.create_model("meeting/1", {"mediafile_ids": [110, 111, 112, 113, 114]})
+        self.create_model(
+            "mediafile/110",
+            {"meeting_id": 1, "is_directory": True, "child_ids": [111, 114]},
+        )
+        self.create_model(
+            "mediafile/111",
+            {
+                "meeting_id": 1,
+                "is_directory": True,
+                "parent_id": 110,
+                "child_ids": [112, 113],
+            },
+        )
+        self.create_model("mediafile/112", {"meeting_id": 1, "parent_id": 111})
+        self.create_model("mediafile/113", {"meeting_id": 1, "parent_id": 111})
+        self.create_model("mediafile/114", {"meeting_id": 1, "parent_id": 110})
+        response = self.client.post(
+            "/", json=[{"action": "mediafile.delete", "data": [{"id": 111}]}],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_deleted("mediafile/111")
+        self.assert_model_deleted("mediafile/112")
+        self.assert_model_deleted("mediafile/113")
+        self.assert_model_exists("mediafile/110", {"child_ids": [114]})
+        self.assert_model_exists("mediafile/114", {"parent_id": 110})
+        self.assert_model_exists("meeting/1", {"mediafile_ids": [110, 114]})
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from openslides_backend.action.meeting.create_update_delete import MeetingDelete
+from openslides_backend.services.datastore.adapter import Adapter
+from tests.system.action.base import BaseActionTestCase
+
+
+class MeetingDeleteSystemTest(BaseActionTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.create_model("committee/1", {"meeting_ids": [1, 2]})
+        self.create_model(
+            "meeting/1",
+            {
+                "committee_id": 1,
+                "topic_ids": [21],
+                "list_of_speakers_ids": [31],
+                "speaker_ids": [41],
+                "motion_ids": [51],
+            },
+        )
+        self.create_model("meeting/2", {"committee_id": 1, "motion_ids": [52]})
+        self.create_model("user/1", {"speaker_$_ids": ["1"], "speaker_1_ids": [41]})
+        self.create_model(
+            "topic/21", {"meeting_id": 1, "title": "t", "list_of_speakers_id": 31}
+        )
+        self.create_model(
+            "list_of_speakers/31",
+            {"meeting_id": 1, "content_object_id": "topic/21", "speaker_ids": [41]},
+        )
+        self.create_model(
+            "speaker/41", {"meeting_id": 1, "list_of_speakers_id": 31, "user_id": 1}
+        )
+        self.create_model("motion/51", {"meeting_id": 1, "derived_motion_ids": [52]})
+        self.create_model("motion/52", {"meeting_id": 2, "origin_id": 51})
+
+    def test_delete(self) -> None:
+        response = self.client.post(
+            "/", json=[{"action": "meeting.delete", "data": [{"id": 1}]}],
+        )
+        self.assert_status_code(response, 200)
+        for fqid in (
+            "meeting/1",
+            "topic/21",
+            "list_of_speakers/31",
+            "speaker/41",
+            "motion/51",
+        ):
+            self.assert_model_deleted(fqid)
+        self.assert_model_exists("committee/1", {"meeting_ids": [2]})
+        self.assert_model_exists("user/1", {"speaker_1_ids": []})
+        self.assert_model_exists("motion/52", {"origin_id": None})
+        self.assert_model_exists("meeting/2", {"motion_ids": [52]})
+
+    def test_delete_model_without_list_entry(self) -> None:
+        self.create_model("tag/61", {"meeting_id": 1})
+        response = self.client.post(
+            "/", json=[{"action": "meeting.delete", "data": [{"id": 1}]}],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_deleted("tag/61")
+
+    def test_delete_in_chunks(self) -> None:
+        write = Adapter.write
+        with patch.object(MeetingDelete, "chunk_size", 2), patch.object(
+            Adapter, "write", autospec=True, side_effect=write
+        ) as write_mock:
+            response = self.client.post(
+                "/", json=[{"action": "meeting.delete", "data": [{"id": 1}]}],
+            )
+        self.assert_status_code(response, 200)
+        # One write for the meeting and the updates, two chunks for the four
+        # other models.
+        self.assertEqual(write_mock.call_count, 3)
+        first_events = write_mock.call_args_list[0][0][1]["events"]
+        self.assertEqual(
+            [str(event["fqid"]) for event in first_events if event["type"] == "delete"],
+            ["meeting/1"],
+        )
+        for fqid in (
+            "meeting/1",
+            "topic/21",
+            "list_of_speakers/31",
+            "speaker/41",
+            "motion/51",
+        ):
+            self.assert_model_deleted(fqid)
+        self.assert_model_exists("user/1", {"speaker_1_ids": []})
+        self.assert_model_exists("motion/52", {"origin_id": None})
@@ -25,6 +25,49 @@ class SpeakerCreateActionTest(BaseActionTestCase):
         list_of_speakers = self.get_model("list_of_speakers/23")
         assert list_of_speakers.get("speaker_ids") == [1]
 
+    def test_create_multiple(self) -> None:
+        self.create_model("meeting/7844", {"name": "name_asdewqasd"})
+        self.create_model("user/7", {"username": "test_username1"})
+        self.create_model("user/8", {"username": "test_username2"})
+        self.create_model(
+            "list_of_speakers/23", {"speaker_ids": [], "meeting_id": 7844}
+        )
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "speaker.create",
+                    "data": [
+                        {"user_id": 7, "list_of_speakers_id": 23},
+                        {"user_id": 8, "list_of_speakers_id": 23},
+                    ],
+                }
+            ],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("speaker/1", {"user_id": 7, "meeting_id": 7844})
+        self.assert_model_exists("speaker/2", {"user_id": 8, "meeting_id": 7844})
+        list_of_speakers = self.get_model("list_of_speakers/23")
+        assert list_of_speakers.get("speaker_ids") == [1, 2]
+
+    def test_create_list_of_speakers_without_meeting(self) -> None:
+        self.create_model("user/7", {"username": "test_username1"})
+        self.create_model("list_of_speakers/23", {"speaker_ids": []})
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "speaker.create",
+                    "data": [{"user_id": 7, "list_of_speakers_id": 23}],
+                }
+            ],
+        )
+        self.assert_status_code(response, 400)
+        self.assertIn(
+            "Referenced model list_of_speakers/23 in field list_of_speakers_id has no meeting id.",
+            str(response.data),
+        )
+
     def test_create_empty_data(self) -> None:
         response = self.client.post(
             "/", json=[{"action": "speaker.create", "data": [{}]}],
@@ -56,6 +56,22 @@ class SpeakerSpeakTester(BaseActionTestCase):
         model1 = self.get_model("speaker/890")
         self.assertEqual(model1.get("end_time"), model2["begin_time"])
 
+    def test_speak_multiple_speakers(self) -> None:
+        self.create_model("user/7", {"username": "test_username1"})
+        self.create_model("list_of_speakers/23", {"speaker_ids": [890, 891]})
+        self.create_model("speaker/890", {"user_id": 7, "list_of_speakers_id": 23})
+        self.create_model("speaker/891", {"user_id": 7, "list_of_speakers_id": 23})
+
+        response = self.client.post(
+            "/", json=[{"action": "speaker.speak", "data": [{"id": 890}, {"id": 891}]}],
+        )
+        self.assert_status_code(response, 200)
+        model1 = self.get_model("speaker/890")
+        model2 = self.get_model("speaker/891")
+        self.assertEqual(model1.get("end_time"), model1["begin_time"])
+        self.assertEqual(model2.get("begin_time"), model1["end_time"])
+        self.assertTrue(model2.get("end_time") is None)
+
     def test_closed(self) -> None:
         self.create_model("user/7", {"username": "test_username1"})
         self.create_model("list_of_speakers/23", {"speaker_ids": [890], "closed": True})
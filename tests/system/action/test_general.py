@@ -1,3 +1,10 @@
+from unittest.mock import patch
+
+from openslides_backend.http.request_parsing import (
+    MAX_BODY_SIZE_VARIABLE,
+    MAX_ELEMENTS_VARIABLE,
+)
+
 from .base import BaseActionTestCase
 
 
@@ -20,6 +27,43 @@ class GeneralActionWSGITester(BaseActionTestCase):
         self.assert_status_code(response, 400)
         self.assertIn("Failed to decode JSON object", str(response.data))
 
+    def test_request_body_too_large(self) -> None:
+        with patch.dict("os.environ", {MAX_BODY_SIZE_VARIABLE: "10"}):
+            response = self.client.post(
+                "/", json=[{"action": "user.create", "data": [{"username": "u"}]}],
+            )
+        self.assert_status_code(response, 413)
+        self.assertIn("must not be larger than 10 bytes", str(response.data))
+
+    def test_request_too_many_elements(self) -> None:
+        with patch.dict("os.environ", {MAX_ELEMENTS_VARIABLE: "1"}):
+            response = self.client.post(
+                "/",
+                json=[
+                    {
+                        "action": "user.create",
+                        "data": [{"username": "u1"}, {"username": "u2"}],
+                    }
+                ],
+            )
+        self.assert_status_code(response, 413)
+        self.assertIn("more than 1 data elements", str(response.data))
+
+    def test_request_duplicate_actions(self) -> None:
+        self.create_model("meeting/1", {"name": "meeting"})
+        action = {"action": "tag.create", "data": [{"name": "tag", "meeting_id": 1}]}
+        response = self.client.post("/", json=[action, action])
+        self.assert_status_code(response, 400)
+        self.assertIn("data must contain unique items", str(response.data))
+        self.assert_model_not_exists("tag/1")
+
+    def test_request_duplicate_data(self) -> None:
+        data = [{"username": f"u{i}"} for i in range(150)] + [{"username": "u1"}]
+        response = self.client.post("/", json=[{"action": "user.create", "data": data}])
+        self.assert_status_code(response, 400)
+        self.assertIn("data[0].data must contain unique items", str(response.data))
+        self.assert_model_not_exists("user/1")
+
     def test_request_fuzzy_body(self) -> None:
         response = self.client.post(
             "/", json={"fuzzy_key_Eeng7pha3a": "fuzzy_value_eez3Ko6quu"},
@@ -24,6 +24,62 @@ class TopicSystemTest(BaseActionTestCase):
         self.assertEqual(agenda_item.get("content_object_id"), "topic/1")
         self.assert_model_exists("list_of_speakers/1", {"content_object_id": "topic/1"})
 
+    def test_create_multiple(self) -> None:
+        self.create_model("meeting/1", {"name": "test"})
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "topic.create",
+                    "data": [
+                        {"meeting_id": 1, "title": "test1"},
+                        {"meeting_id": 1, "title": "test2", "agenda_type": 2},
+                        {"meeting_id": 1, "title": "test3"},
+                    ],
+                }
+            ],
+        )
+        self.assert_status_code(response, 200)
+        for id in range(1, 4):
+            self.assert_model_exists(
+                f"topic/{id}",
+                {"agenda_item_id": id, "list_of_speakers_id": id, "meeting_id": 1},
+            )
+            self.assert_model_exists(
+                f"agenda_item/{id}", {"content_object_id": f"topic/{id}"}
+            )
+            self.assert_model_exists(
+                f"list_of_speakers/{id}", {"content_object_id": f"topic/{id}"}
+            )
+        self.assertEqual(self.get_model("agenda_item/2")["type"], 2)
+        meeting = self.get_model("meeting/1")
+        self.assertEqual(meeting.get("topic_ids"), [1, 2, 3])
+        self.assertEqual(meeting.get("agenda_item_ids"), [1, 2, 3])
+        self.assertEqual(meeting.get("list_of_speakers_ids"), [1, 2, 3])
+
+    def test_create_many_in_batches(self) -> None:
+        self.create_model("meeting/1", {"name": "test"})
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "topic.create",
+                    "data": [
+                        {"meeting_id": 1, "title": f"test{i}"} for i in range(250)
+                    ],
+                }
+            ],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists(
+            "topic/250",
+            {"agenda_item_id": 250, "list_of_speakers_id": 250, "meeting_id": 1},
+        )
+        meeting = self.get_model("meeting/1")
+        self.assertEqual(meeting.get("topic_ids"), list(range(1, 251)))
+        self.assertEqual(meeting.get("agenda_item_ids"), list(range(1, 251)))
+        self.assertEqual(meeting.get("list_of_speakers_ids"), list(range(1, 251)))
+
     def test_create_more_fields(self) -> None:
         self.create_model("meeting/1", {"name": "test"})
         response = self.client.post(
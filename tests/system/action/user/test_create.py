@@ -65,3 +65,30 @@ class UserCreateActionTest(BaseActionTestCase):
             "data[0] must not contain {\\'wrong_field\\'} properties",
             str(response.data),
         )
+
+    def test_create_many_in_batches(self) -> None:
+        self.create_model("committee/78", {"name": "name_TSXpBGdt"})
+        response = self.client.post(
+            "/",
+            json=[
+                {
+                    "action": "user.create",
+                    "data": [
+                        {"username": f"test_{i}", "committee_as_member_ids": [78]}
+                        for i in range(250)
+                    ],
+                }
+            ],
+        )
+        self.assert_status_code(response, 200)
+        assert self.get_model("user/250").get("username") == "test_249"
+        committee = self.get_model("committee/78")
+        assert committee.get("member_ids") == list(range(1, 251))
+
+    def test_create_many_invalid_index(self) -> None:
+        data = [{"username": f"test_{i}"} for i in range(150)]
+        data.append({"username": "test_150", "wrong_field": "text"})
+        response = self.client.post("/", json=[{"action": "user.create", "data": data}])
+        self.assert_status_code(response, 400)
+        self.assertIn("data[150] must not contain", str(response.data))
+        self.assert_model_not_exists("user/1")
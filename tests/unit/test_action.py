@@ -1,11 +1,48 @@
+from typing import Any, Dict, Iterable, List
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
-from openslides_backend.action.base import merge_write_request_elements
+from openslides_backend.action.base import (
+    Action,
+    ActionPayload,
+    DataSet,
+    WriteRequestBuilder,
+    merge_write_request_elements,
+)
+from openslides_backend.models.models import Motion
+from openslides_backend.shared.exceptions import ActionException
 from openslides_backend.shared.interfaces import WriteRequestElement
+from openslides_backend.shared.patterns import Collection
 
 from ..util import get_fqid
 
 
+class DummyActionOhngoo7oax(Action):
+    name = "dummy_action_ohngoo7oax"
+    schema = {"type": "array", "items": {"type": "object"}, "minItems": 1}
+
+    def prepare_dataset(self, payload: ActionPayload) -> DataSet:
+        return {"data": payload}
+
+    def create_write_request_elements(self, dataset: DataSet) -> Iterable[Any]:
+        yield from dataset["data"]
+
+
+class BatchedDummyAction(DummyActionOhngoo7oax):
+    name = "batched_dummy_action"
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {"x": {"type": "integer"}},
+            "required": ["x"],
+        },
+        "minItems": 1,
+        "uniqueItems": True,
+    }
+    batch_size = 2
+
+
 class ActionBaseTester(TestCase):
     """
     Tests methods of base Action class and also some helper functions.
@@ -88,3 +125,99 @@ class ActionBaseTester(TestCase):
             context_manager.exception.args,
             ("At least one of the given user ids must not be None.",),
         )
+
+    def test_write_request_builder(self) -> None:
+        builder = WriteRequestBuilder(1)
+        builder.add(self.write_request_element_1)
+        builder.add_event(
+            {"type": "delete", "fqid": get_fqid("collection_Chebie1jie/43")},
+            ["Information text Eequ3ohxoo"],
+        )
+        result = builder.build()
+        self.assertEqual(result["user_id"], 1)
+        self.assertEqual(len(result["events"]), 2)
+        self.assertEqual(
+            result["information"],
+            {
+                get_fqid("collection_Chebie1jie/42"): ["Information text laPu7iepei"],
+                get_fqid("collection_Chebie1jie/43"): ["Information text Eequ3ohxoo"],
+            },
+        )
+        # The given write request element must not be changed.
+        builder.add(self.write_request_element_2)
+        self.assertEqual(
+            self.write_request_element_1["information"],
+            {get_fqid("collection_Chebie1jie/42"): ["Information text laPu7iepei"]},
+        )
+
+    def test_write_request_builder_different_users(self) -> None:
+        builder = WriteRequestBuilder(1)
+        self.write_request_element_1["user_id"] = 5955333405
+        with self.assertRaises(ValueError):
+            builder.add(self.write_request_element_1)
+        self.assertTrue(builder.is_empty())
+
+    def test_perform_internal(self) -> None:
+        permission = MagicMock()
+        permission.check_action.return_value = False
+        action = DummyActionOhngoo7oax(permission, MagicMock())
+        # The payload would be invalid and the permission denied in perform.
+        result = list(action.perform_internal([], 1))
+        self.assertEqual(result, [])
+        permission.check_action.assert_not_called()
+
+    def test_validate_relation_fields_batched(self) -> None:
+        database = MagicMock()
+        database.get_many.return_value = {
+            Collection("tag"): {1: {"meeting_id": 1}, 2: {"meeting_id": 1}},
+            Collection("user"): {3: {"meeting_id": 1}},
+        }
+        action = DummyActionOhngoo7oax(MagicMock(), database)
+        action.model = Motion()
+        action.validate_relation_fields(
+            {"meeting_id": 1, "tag_ids": [1, 2], "supporter_ids": [3]}
+        )
+        database.get_many.assert_called_once()
+        database.get.assert_not_called()
+        requests = database.get_many.call_args[0][0]
+        self.assertEqual(
+            sorted((str(request.collection), request.ids) for request in requests),
+            [("tag", [1, 2]), ("user", [3])],
+        )
+
+    def test_validate_relation_fields_batched_error(self) -> None:
+        database = MagicMock()
+        database.get_many.return_value = {
+            Collection("tag"): {1: {"meeting_id": 1}, 2: {"meeting_id": 2}},
+        }
+        action = DummyActionOhngoo7oax(MagicMock(), database)
+        action.model = Motion()
+        with self.assertRaises(ActionException) as context:
+            action.validate_relation_fields({"meeting_id": 1, "tag_ids": [1, 2]})
+        self.assertEqual(
+            context.exception.message,
+            "The field meeting_id must be equal but differs on tag/2: 1 != 2",
+        )
+
+    def test_perform_batches(self) -> None:
+        action = BatchedDummyAction(MagicMock(), MagicMock())
+        with patch.object(
+            action, "prepare_dataset", wraps=action.prepare_dataset
+        ) as prepare_dataset:
+            result = list(action.perform(iter([{"x": i} for i in range(5)]), 1))
+        self.assertEqual(result, [{"x": i} for i in range(5)])
+        self.assertEqual(prepare_dataset.call_count, 3)
+
+    def test_perform_batches_invalid_index(self) -> None:
+        action = BatchedDummyAction(MagicMock(), MagicMock())
+        payload: List[Dict[str, Any]] = [{"x": 0}, {"x": 1}, {"x": 2}, {"x": "3"}]
+        with self.assertRaises(ActionException) as context:
+            list(action.perform(iter(payload), 1))
+        self.assertEqual(context.exception.message, "data[3].x must be integer")
+
+    def test_perform_batches_duplicate(self) -> None:
+        action = BatchedDummyAction(MagicMock(), MagicMock())
+        payload = iter([{"x": 0}, {"x": 1}, {"x": 2}, {"x": 0}])
+        with self.assertRaises(ActionException) as context:
+            list(action.perform(payload, 1))
+        self.assertEqual(context.exception.message, "data must contain unique items")
@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from openslides_backend.action.actions_manifest import ACTIONS_MANIFEST
+from openslides_backend.action.actions_map import actions_map
+
+
+class ActionsMapTest(TestCase):
+    def test_lookup(self) -> None:
+        action = actions_map.get("topic.create")
+        assert action is not None
+        assert action.name == "topic.create"
+        assert "topic.update" in actions_map
+        assert actions_map.get("unknown_action_Ioquoh3ahc") is None
+
+    def test_manifest_is_up_to_date(self) -> None:
+        names = set(actions_map.keys())
+        assert actions_map.all_loaded
+        for name, module in ACTIONS_MANIFEST.items():
+            assert name in names
+            assert actions_map.modules[name] == module
+        # Actions registered by tests are not part of the manifest.
+        missing = [
+            name
+            for name, module in actions_map.modules.items()
+            if name not in ACTIONS_MANIFEST
+            and not module.startswith(("tests.", "unittest."))
+        ]
+        assert missing == [], "Run make generate-actions-manifest"
@@ -1,7 +1,9 @@
 from typing import Any
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from openslides_backend.action.agenda_item.agenda_tree import AgendaTree, to_roman
+from openslides_backend.action.agenda_item.numbering import AgendaItemNumbering
 from openslides_backend.models.models import AgendaItem
 
 
@@ -27,3 +29,37 @@ class AgendaTreeTest(TestCase):
         data = [{"id": 1}]
         result = AgendaTree(data).number_all(agenda_number_prefix="PRE")
         assert result == {1: "PRE 1"}
+
+    def test_deep_tree(self) -> None:
+        data = [{"id": 1}] + [{"id": id, "parent_id": id - 1} for id in range(2, 5001)]
+        result = AgendaTree(data).number_all()
+        assert len(result) == 5000
+        assert result[5000] == ".".join(["1"] * 5000)
+
+    def test_children_of_non_public_items(self) -> None:
+        data = [
+            {"id": 1, "weight": 1},
+            {"id": 2, "weight": 2, "type": AgendaItem.HIDDEN_ITEM},
+            {"id": 3, "weight": 3, "parent_id": 2},
+            {"id": 4, "weight": 4, "parent_id": 1},
+            {"id": 5, "weight": 5},
+        ]
+        result = AgendaTree(data).number_all(numeral_system="roman")
+        assert result == {1: "I", 2: "", 3: "", 4: "I.1", 5: "II"}
+
+
+class AgendaItemNumberingTest(TestCase):
+    def test_only_changed_numbers(self) -> None:
+        database = MagicMock()
+        database.filter.return_value = {
+            1: {"id": 1, "weight": 1, "item_number": "A I"},
+            2: {"id": 2, "weight": 2, "item_number": "A I"},
+            3: {"id": 3, "weight": 3, "type": AgendaItem.INTERNAL_ITEM},
+        }
+        database.get.return_value = {
+            "agenda_numeral_system": "roman",
+            "agenda_number_prefix": "A",
+        }
+        action = AgendaItemNumbering(MagicMock(), database)
+        dataset = action.prepare_dataset([{"meeting_id": 1}])
+        assert dataset["data"] == {2: "A II"}
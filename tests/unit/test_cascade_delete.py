@@ -0,0 +1,224 @@
+from typing import Any, Dict
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions_map import actions_map
+from openslides_backend.action.cascade_delete import (
+    CascadeDeletePlanner,
+    MeetingDeletePlanner,
+)
+from openslides_backend.action.generics import DeleteAction
+from openslides_backend.models.base import model_registry
+from openslides_backend.models.fields import OnDelete
+from openslides_backend.models.models import (
+    Meeting,
+    Motion,
+    MotionCommentSection,
+    Speaker,
+    Tag,
+    Topic,
+    User,
+)
+from openslides_backend.shared.exceptions import ActionException
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+
+class CascadeDeletePlannerTester(TestCase):
+    def setUp(self) -> None:
+        self.database = MagicMock()
+        self.planner = CascadeDeletePlanner(self.database)
+
+    def set_instances(self, instances: Dict[Collection, Dict[int, Any]]) -> None:
+        self.database.get_many.side_effect = lambda get_many_requests, **kwargs: {
+            request.collection: instances[request.collection]
+            for request in get_many_requests
+        }
+
+    def test_is_leaf(self) -> None:
+        self.assertTrue(self.planner.is_leaf(Collection("speaker")))
+        self.assertFalse(self.planner.is_leaf(Collection("topic")))
+
+    def test_leaf(self) -> None:
+        instances: Dict[Collection, Dict[int, Any]] = {
+            Collection("speaker"): {
+                id: {"list_of_speakers_id": 1, "user_id": 2, "meeting_id": 3}
+                for id in range(1, 101)
+            },
+            Collection("list_of_speakers"): {1: {"speaker_ids": [*range(1, 102)]}},
+            Collection("user"): {2: {"speaker_3_ids": [*range(1, 101)]}},
+            Collection("meeting"): {3: {"speaker_ids": [*range(1, 102)]}},
+        }
+        self.set_instances(instances)
+        plan = self.planner.plan(Speaker(), range(1, 101))
+        self.assertEqual(self.database.get_many.call_count, 4)
+        self.assertEqual(len(plan.deleted), 100)
+        self.assertEqual(
+            plan.updates,
+            {
+                FullQualifiedId(Collection("list_of_speakers"), 1): {
+                    "speaker_ids": [101]
+                },
+                FullQualifiedId(Collection("user"), 2): {"speaker_3_ids": []},
+                FullQualifiedId(Collection("meeting"), 3): {"speaker_ids": [101]},
+            },
+        )
+
+    def test_no_leaf(self) -> None:
+        self.database.get_many.return_value = {Collection("topic"): {1: {}}}
+        plan = self.planner.plan(Topic(), [1])
+        self.assertEqual(list(plan.deleted), [FullQualifiedId(Collection("topic"), 1)])
+        self.assertEqual(plan.updates, {})
+
+    def test_protect(self) -> None:
+        self.set_instances(
+            {
+                Collection("motion_comment_section"): {
+                    1: {"comment_ids": [2], "meeting_id": 3}
+                },
+            }
+        )
+        with self.assertRaises(ActionException) as context:
+            self.planner.plan(MotionCommentSection(), [1])
+        self.assertIn(
+            "you have to delete the related motion_comment first",
+            context.exception.message,
+        )
+
+    def test_set_null_generic(self) -> None:
+        self.set_instances(
+            {
+                Collection("tag"): {1: {"tagged_ids": ["topic/2"], "meeting_id": 3}},
+                Collection("topic"): {2: {"tag_ids": [1, 4]}},
+                Collection("meeting"): {3: {"tag_ids": [1, 4]}},
+            }
+        )
+        plan = self.planner.plan(Tag(), [1])
+        self.assertEqual(
+            plan.updates,
+            {
+                FullQualifiedId(Collection("topic"), 2): {"tag_ids": [4]},
+                FullQualifiedId(Collection("meeting"), 3): {"tag_ids": [4]},
+            },
+        )
+
+    def test_set_null_generic_reverse(self) -> None:
+        self.set_instances(
+            {
+                Collection("user"): {1: {"current_projector_ids": [2]}},
+                Collection("projector"): {
+                    2: {"current_element_ids": ["user/1", "topic/3"]}
+                },
+            }
+        )
+        plan = self.planner.plan(User(), [1])
+        self.assertEqual(
+            plan.updates,
+            {
+                FullQualifiedId(Collection("projector"), 2): {
+                    "current_element_ids": [FullQualifiedId(Collection("topic"), 3)]
+                },
+            },
+        )
+
+    def test_set_null_template(self) -> None:
+        self.set_instances(
+            {
+                Collection("user"): {
+                    1: {
+                        "group_$_ids": ["3"],
+                        "group_3_ids": [4],
+                        "speaker_$_ids": ["3"],
+                        "speaker_3_ids": [5],
+                    }
+                },
+                Collection("group"): {4: {"user_ids": [1, 6]}},
+                Collection("speaker"): {5: {"user_id": 1}},
+            }
+        )
+        plan = self.planner.plan(User(), [1])
+        self.assertEqual(
+            plan.updates,
+            {
+                FullQualifiedId(Collection("group"), 4): {"user_ids": [6]},
+                FullQualifiedId(Collection("speaker"), 5): {"user_id": None},
+            },
+        )
+
+
+class DeleteActionTester(TestCase):
+    def setUp(self) -> None:
+        self.action = DeleteAction(MagicMock(), MagicMock())
+
+    def test_cascade_hooks(self) -> None:
+        for model_class in list(model_registry.values()):
+            for _, field in model_class().get_relation_fields():
+                if field.on_delete != OnDelete.CASCADE:
+                    continue
+                targets = field.to if isinstance(field.to, list) else [field.to]
+                for collection in targets:
+                    action_class = actions_map.get(f"{collection}.delete")
+                    if action_class is not None:
+                        self.action.check_cascade_hooks(action_class)
+
+    def test_cascade_hooks_overridden(self) -> None:
+        class DummyDelete(DeleteAction):
+            model = Topic()
+
+            def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+                return instance
+
+        with self.assertRaises(ActionException) as context:
+            self.action.check_cascade_hooks(DummyDelete)
+        self.assertEqual(
+            context.exception.message,
+            "Can't cascade the delete action to topic since "
+            "DummyDelete.update_instance would be skipped.",
+        )
+        DummyDelete.cascade_skipped_hooks = ("update_instance",)
+        self.action.check_cascade_hooks(DummyDelete)
+
+
+class MeetingDeletePlannerTester(TestCase):
+    def setUp(self) -> None:
+        self.database = MagicMock()
+        self.planner = MeetingDeletePlanner(self.database)
+
+    def test_scoped_instances(self) -> None:
+        self.database.get_many.return_value = {
+            Collection("meeting"): {1: {"speaker_ids": [2], "committee_id": 3}},
+            Collection("committee"): {3: {"meeting_ids": [1, 4]}},
+        }
+        self.database.filter.side_effect = lambda collection, **kwargs: (
+            {2: {"id": 2, "user_id": None, "meeting_id": 1}}
+            if collection == Collection("speaker")
+            else {}
+        )
+        plan = self.planner.plan(Meeting(), [1])
+        self.assertEqual(
+            list(plan.deleted),
+            [
+                FullQualifiedId(Collection("meeting"), 1),
+                FullQualifiedId(Collection("speaker"), 2),
+            ],
+        )
+        self.assertEqual(
+            plan.updates,
+            {FullQualifiedId(Collection("committee"), 3): {"meeting_ids": [4]}},
+        )
+        speaker_call = next(
+            call
+            for call in self.database.filter.call_args_list
+            if call[1]["collection"] == Collection("speaker")
+        )
+        self.assertEqual(
+            speaker_call[1]["mapped_fields"], ["id", "user_id", "meeting_id"]
+        )
+
+    def test_is_internal(self) -> None:
+        self.database.get_many.return_value = {Collection("meeting"): {1: {}}}
+        self.database.filter.return_value = {}
+        self.planner.plan(Meeting(), [1])
+        self.assertTrue(self.planner.is_internal(Motion.meeting_id))
+        self.assertTrue(self.planner.is_internal(Motion.state_id))
+        self.assertFalse(self.planner.is_internal(Motion.origin_id))
+        self.assertFalse(self.planner.is_internal(Motion.supporter_ids))
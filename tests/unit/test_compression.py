@@ -0,0 +1,102 @@
+import gzip
+import zlib
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import simplejson as json
+from werkzeug.test import Client
+from werkzeug.wrappers import BaseResponse
+
+from openslides_backend.http.application import OpenSlidesBackendWSGIApplication
+from openslides_backend.http.compression import (
+    COMPRESSION_VARIABLE,
+    CompressionMiddleware,
+    get_encodings,
+)
+
+
+class GetEncodingsTester(TestCase):
+    def test_default(self) -> None:
+        with patch.dict("os.environ", clear=True):
+            self.assertEqual(get_encodings(), ["gzip", "deflate"])
+
+    def test_disabled(self) -> None:
+        with patch.dict("os.environ", {COMPRESSION_VARIABLE: "none"}):
+            self.assertEqual(get_encodings(), [])
+
+    def test_unknown(self) -> None:
+        with patch.dict("os.environ", {COMPRESSION_VARIABLE: "br"}):
+            with self.assertRaises(ValueError):
+                get_encodings()
+
+
+class CompressionTester(TestCase):
+    def setUp(self) -> None:
+        self.view = MagicMock()
+        self.view.method = "POST"
+        self.application = OpenSlidesBackendWSGIApplication(
+            MagicMock(), self.view, MagicMock()
+        )
+        self.logger = MagicMock()
+        logging = MagicMock()
+        logging.getLogger.return_value = self.logger
+        self.application.compression = CompressionMiddleware(
+            logging, encodings=["gzip", "deflate"], threshold=100, level=6
+        )
+        self.client = Client(self.application, BaseResponse)
+
+    def post(self, body: object, accept_encoding: str = "gzip") -> BaseResponse:
+        self.view.return_value.dispatch.return_value = (body, None)
+        return self.client.post(
+            "/", json=[], headers={"Accept-Encoding": accept_encoding}
+        )
+
+    def test_gzip(self) -> None:
+        body = [{"data": "x" * 1000}]
+        response = self.post(body)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(
+            int(response.headers["Content-Length"]), len(response.get_data())
+        )
+        self.assertEqual(json.loads(gzip.decompress(response.get_data())), body)
+
+    def test_deflate(self) -> None:
+        body = [{"data": "x" * 1000}]
+        response = self.post(body, accept_encoding="gzip;q=0.5, deflate")
+        self.assertEqual(response.headers["Content-Encoding"], "deflate")
+        self.assertEqual(json.loads(zlib.decompress(response.get_data())), body)
+
+    def test_not_accepted(self) -> None:
+        body = [{"data": "x" * 1000}]
+        response = self.post(body, accept_encoding="br")
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(json.loads(response.get_data()), body)
+
+    def test_below_threshold(self) -> None:
+        response = self.post([{"success": True}])
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(json.loads(response.get_data()), [{"success": True}])
+
+    def test_streamed(self) -> None:
+        body = [{"data": "x" * 1000} for _ in range(200)]
+        response = self.post(body)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIsNone(response.headers.get("Content-Length"))
+        self.assertEqual(json.loads(gzip.decompress(response.get_data())), body)
+        self.logger.debug.assert_called_once()
+
+    def test_health_info_cached(self) -> None:
+        self.view.return_value.get_health_info.return_value = {"data": "x" * 1000}
+        for _ in range(2):
+            response = self.client.get(
+                "/health",
+                environ_overrides={"RAW_URI": "/health"},
+                headers={"Accept-Encoding": "gzip"},
+            )
+            self.assertEqual(
+                json.loads(gzip.decompress(response.get_data())),
+                {"healthinfo": {"data": "x" * 1000}},
+            )
+        self.logger.debug.assert_called_once()
@@ -0,0 +1,98 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.hierarchy import Hierarchy
+from openslides_backend.action.mediafile.update import MediafileUpdate
+from openslides_backend.shared.patterns import Collection
+
+
+class HierarchyTester(TestCase):
+    def setUp(self) -> None:
+        self.hierarchy = Hierarchy(
+            {
+                1: {"id": 1, "child_ids": [2, 3]},
+                2: {"id": 2, "parent_id": 1, "child_ids": [4]},
+                3: {"id": 3, "parent_id": 1},
+                4: {"id": 4, "parent_id": 2},
+                5: {"id": 5},
+            },
+            "parent_id",
+            "child_ids",
+        )
+
+    def test_load(self) -> None:
+        database = MagicMock()
+        database.filter.return_value = {1: {"id": 1}}
+        hierarchy = Hierarchy.load(
+            database, Collection("motion"), 1, mapped_fields=["title"]
+        )
+        self.assertIn(1, hierarchy)
+        self.assertEqual(
+            database.filter.call_args[1]["mapped_fields"],
+            ["id", "sort_parent_id", "sort_child_ids", "title"],
+        )
+
+    def test_get_ancestors(self) -> None:
+        self.assertEqual(self.hierarchy.get_ancestors(4), [2, 1])
+        self.assertEqual(self.hierarchy.get_ancestors(1), [])
+        self.assertTrue(self.hierarchy.is_ancestor(1, 4))
+        self.assertFalse(self.hierarchy.is_ancestor(3, 4))
+
+    def test_get_ancestors_cycle(self) -> None:
+        hierarchy = Hierarchy(
+            {1: {"id": 1, "parent_id": 2}, 2: {"id": 2, "parent_id": 1}},
+            "parent_id",
+            "child_ids",
+        )
+        self.assertEqual(hierarchy.get_ancestors(1), [2])
+
+    def test_get_descendants(self) -> None:
+        self.assertEqual(self.hierarchy.get_descendants([1]), [2, 4, 3])
+        self.assertEqual(self.hierarchy.get_descendants([2, 1]), [4, 3])
+        self.assertEqual(self.hierarchy.get_descendants([5]), [])
+
+
+class MediafileAccessGroupsTester(TestCase):
+    def test_calculate_inherited_groups_in_subtrees(self) -> None:
+        hierarchy = Hierarchy(
+            {
+                1: {"id": 1, "child_ids": [2, 3]},
+                2: {
+                    "id": 2,
+                    "parent_id": 1,
+                    "child_ids": [4],
+                    "access_group_ids": [7],
+                    "inherited_access_group_ids": [7],
+                    "has_inherited_access_groups": True,
+                },
+                3: {"id": 3, "parent_id": 1, "child_ids": [5]},
+                4: {
+                    "id": 4,
+                    "parent_id": 2,
+                    "inherited_access_group_ids": [7],
+                    "has_inherited_access_groups": True,
+                },
+                5: {"id": 5, "parent_id": 3},
+            },
+            "parent_id",
+            "child_ids",
+        )
+        action = MediafileUpdate(MagicMock(), MagicMock())
+        result = action.calculate_inherited_groups_in_subtrees(hierarchy, {1: [7, 8]})
+        self.assertEqual(
+            result,
+            {
+                1: {
+                    "has_inherited_access_groups": True,
+                    "inherited_access_group_ids": [7, 8],
+                },
+                3: {
+                    "has_inherited_access_groups": True,
+                    "inherited_access_group_ids": [7, 8],
+                },
+                5: {
+                    "has_inherited_access_groups": True,
+                    "inherited_access_group_ids": [7, 8],
+                },
+            },
+        )
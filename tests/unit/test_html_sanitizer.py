@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from openslides_backend.models import html_sanitizer
+from openslides_backend.models.fields import HTMLPermissiveField, HTMLStrictField
+
+
+class HTMLSanitizerTester(TestCase):
+    def setUp(self) -> None:
+        html_sanitizer.cache.clear()
+        html_sanitizer.statistics.reset()
+        self.field = HTMLStrictField()
+
+    def test_plain_text(self) -> None:
+        self.assertEqual(self.field.validate("Just some text."), "Just some text.")
+        self.assertEqual(html_sanitizer.statistics.plain_text, 1)
+        self.assertEqual(html_sanitizer.statistics.cleaned, 0)
+
+    def test_plain_text_with_special_characters(self) -> None:
+        self.assertEqual(self.field.validate("a & b"), "a &amp; b")
+        self.assertEqual(self.field.validate("a\r\nb"), "a\nb")
+        self.assertEqual(self.field.validate("a\tb"), "ab")
+        self.assertEqual(html_sanitizer.statistics.cleaned, 2)
+
+    def test_cache(self) -> None:
+        html = "<p>test</p><iframe>test</iframe>"
+        expected = "<p>test</p>&lt;iframe&gt;test&lt;/iframe&gt;"
+        self.assertEqual(self.field.validate(html), expected)
+        self.assertEqual(self.field.validate(html), expected)
+        self.assertEqual(html_sanitizer.statistics.calls, 2)
+        self.assertEqual(html_sanitizer.statistics.cache_hits, 1)
+        self.assertEqual(html_sanitizer.statistics.cleaned, 1)
+        self.assertGreater(html_sanitizer.statistics.time, 0)
+
+    def test_canonical_output(self) -> None:
+        output = self.field.validate("<p>test<script>alert(1)</script>")
+        self.assertEqual(self.field.validate(output), output)
+        self.assertEqual(html_sanitizer.statistics.cache_hits, 1)
+        self.assertEqual(html_sanitizer.statistics.cleaned, 1)
+
+    def test_cache_per_allowed_tags(self) -> None:
+        html = "<video>test</video>"
+        self.assertEqual(self.field.validate(html), "&lt;video&gt;test&lt;/video&gt;")
+        self.assertEqual(HTMLPermissiveField().validate(html), html)
+        self.assertEqual(html_sanitizer.statistics.cleaned, 2)
+
+    def test_cache_bounded(self) -> None:
+        cache = html_sanitizer.SanitizerCache(2)
+        cache.set(b"a", "a")
+        cache.set(b"b", "b")
+        cache.get(b"a")
+        cache.set(b"c", "c")
+        self.assertEqual(list(cache.entries), [b"a", b"c"])
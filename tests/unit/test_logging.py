@@ -0,0 +1,81 @@
+import logging
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+from werkzeug.test import Client
+from werkzeug.wrappers import BaseResponse
+
+from openslides_backend.http.application import OpenSlidesBackendWSGIApplication
+from openslides_backend.services.datastore.adapter import Adapter
+from openslides_backend.shared.logging import PAYLOAD_LENGTH_VARIABLE, PayloadSummary
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+
+class PayloadSummaryTester(TestCase):
+    def test_short_payload(self) -> None:
+        self.assertEqual(str(PayloadSummary({"a": 1})), "{'a': 1}")
+
+    def test_long_payload(self) -> None:
+        self.assertEqual(
+            str(PayloadSummary("x" * 20, max_length=5)), "xxxxx... (20 characters)"
+        )
+
+    def test_max_length_from_environment(self) -> None:
+        with patch.dict("os.environ", {PAYLOAD_LENGTH_VARIABLE: "3"}):
+            self.assertEqual(str(PayloadSummary("abcdef")), "abc... (6 characters)")
+
+    def test_callable(self) -> None:
+        payload = Mock(return_value="test")
+        summary = PayloadSummary(payload)
+        payload.assert_not_called()
+        self.assertEqual(str(summary), "test")
+
+
+class LazyLoggingTester(TestCase):
+    def setUp(self) -> None:
+        self.logger = logging.getLogger("openslides_backend")
+        self.level = self.logger.level
+        self.handler = logging.NullHandler()
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self) -> None:
+        self.logger.setLevel(self.level)
+        self.logger.removeHandler(self.handler)
+
+    def get(self) -> None:
+        engine = Mock()
+        engine.retrieve.return_value = ('{"f": 1}', 200)
+        Adapter(engine, logging).get(FullQualifiedId(Collection("fake_model"), 1))
+
+    def post_request(self) -> None:
+        view = MagicMock()
+        view.method = "POST"
+        view.return_value.dispatch.return_value = ({"data": "x" * 1000}, None)
+        application = OpenSlidesBackendWSGIApplication(logging, view, MagicMock())
+        client = Client(application, BaseResponse)
+        response = client.post("/", json=[{"data": "x" * 1000}])
+        self.assertEqual(response.status_code, 200)
+
+    def assert_stringified(self, level: int, stringified: bool) -> None:
+        self.logger.setLevel(level)
+        with patch.object(
+            PayloadSummary, "__str__", autospec=True, return_value=""
+        ) as mock:
+            self.get()
+            self.post_request()
+        self.assertEqual(mock.called, stringified)
+
+    def test_info(self) -> None:
+        self.assert_stringified(logging.INFO, False)
+
+    def test_debug(self) -> None:
+        self.assert_stringified(logging.DEBUG, True)
+
+    def test_command_data_serialized_once(self) -> None:
+        self.logger.setLevel(logging.DEBUG)
+        with patch(
+            "openslides_backend.services.datastore.commands.json.dumps",
+            return_value="{}",
+        ) as dumps:
+            self.get()
+        dumps.assert_called_once()
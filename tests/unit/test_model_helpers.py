@@ -0,0 +1,73 @@
+from typing import Any, Dict
+from unittest import TestCase
+
+from openslides_backend.models import helpers, models
+from openslides_backend.models.base import Model, model_registry
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+
+def get_models() -> Dict[str, Model]:
+    return {
+        str(model_class.collection): model_class()
+        for model_class in model_registry.values()
+        if model_class.__module__ == models.__name__
+    }
+
+
+class ModelHelpersTester(TestCase):
+    def test_checksum(self) -> None:
+        self.assertEqual(helpers.MODELS_YML_CHECKSUM, models.MODELS_YML_CHECKSUM)
+
+    def test_all_collections(self) -> None:
+        collections = set(get_models())
+        self.assertEqual(set(helpers.SET_DEFAULTS), collections)
+        self.assertEqual(set(helpers.VALIDATE_FIELDS), collections)
+        self.assertEqual(set(helpers.PROPERTIES), collections)
+
+    def test_properties(self) -> None:
+        for collection, model in get_models().items():
+            for field_name, field in model.get_fields():
+                try:
+                    schema = field.get_schema()
+                except NotImplementedError:
+                    continue
+                self.assertEqual(
+                    helpers.PROPERTIES[collection][field_name], schema,
+                )
+
+    def test_set_defaults(self) -> None:
+        for collection, model in get_models().items():
+            expected: Dict[str, Any] = {}
+            for field_name, field in model.get_fields():
+                if field.default is not None:
+                    expected[field_name] = field.default
+            self.assertEqual(model.set_defaults({}), expected)
+
+    def test_set_defaults_keeps_values(self) -> None:
+        instance = models.Meeting().set_defaults({"name": "test", "user_ids": [1]})
+        self.assertEqual(instance, {"name": "test", "user_ids": [1]})
+
+    def test_validate_fields(self) -> None:
+        instance = models.Organisation().validate_fields(
+            {"name": "test", "description": "<p>test</p><iframe>test</iframe>"}
+        )
+        self.assertEqual(
+            instance,
+            {
+                "name": "test",
+                "description": "<p>test</p>&lt;iframe&gt;test&lt;/iframe&gt;",
+            },
+        )
+
+    def test_validate_fields_generic_relation(self) -> None:
+        instance = models.AgendaItem().validate_fields({"content_object_id": "topic/1"})
+        self.assertEqual(
+            instance, {"content_object_id": FullQualifiedId(Collection("topic"), 1)}
+        )
+
+    def test_get_properties_copy(self) -> None:
+        properties = models.Topic().get_properties("title")
+        properties["title"]["type"] = "integer"
+        self.assertEqual(
+            models.Topic().get_properties("title")["title"]["type"], "string"
+        )
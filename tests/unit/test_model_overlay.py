@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+from openslides_backend.shared.typing import ModelOverlay
+
+FQID_1 = FullQualifiedId(Collection("topic"), 1)
+FQID_2 = FullQualifiedId(Collection("agenda_item"), 2)
+FQID_3 = FullQualifiedId(Collection("list_of_speakers"), 3)
+
+
+class ModelOverlayTest(TestCase):
+    def test_lookup(self) -> None:
+        overlay = ModelOverlay({FQID_1: {"title": "a"}})
+        child = overlay.child({FQID_2: {"item_number": "1"}})
+        assert child[FQID_1] == {"title": "a"}
+        assert child[FQID_2] == {"item_number": "1"}
+        assert FQID_3 not in child
+        assert child.get(FQID_3) is None
+        with self.assertRaises(KeyError):
+            child[FQID_3]
+
+    def test_parent_is_unchanged(self) -> None:
+        overlay = ModelOverlay({FQID_1: {"title": "a"}})
+        child = overlay.child({FQID_2: {"item_number": "1"}})
+        assert FQID_2 in child
+        assert FQID_2 not in overlay
+        assert len(overlay) == 1
+        assert len(child) == 2
+
+    def test_shadowing(self) -> None:
+        overlay = ModelOverlay({FQID_1: {"title": "a"}})
+        child = overlay.child({FQID_1: {"title": "b"}})
+        assert child[FQID_1] == {"title": "b"}
+        assert overlay[FQID_1] == {"title": "a"}
+        assert list(child) == [FQID_1]
+
+    def test_no_copy_of_models(self) -> None:
+        instance = {"title": "a"}
+        overlay = ModelOverlay({FQID_1: instance})
+        child = overlay.child({FQID_2: {}}).child({FQID_3: {}})
+        assert child[FQID_1] is instance
+        assert child.parent is not None and child.parent.parent is overlay
+        assert child.depth == 2
+
+    def test_empty_child(self) -> None:
+        overlay = ModelOverlay({FQID_1: {}})
+        assert overlay.child({}) is overlay
+
+    def test_from_model_map(self) -> None:
+        overlay = ModelOverlay({FQID_1: {}})
+        assert ModelOverlay.from_model_map(overlay) is overlay
+        wrapped = ModelOverlay.from_model_map({FQID_2: {}})
+        assert isinstance(wrapped, ModelOverlay)
+        assert dict(wrapped) == {FQID_2: {}}
@@ -0,0 +1,159 @@
+from io import BytesIO
+from typing import Any, List
+from unittest import TestCase
+
+import simplejson as json
+
+from openslides_backend.http.request_parsing import (
+    JSONStreamReader,
+    iter_action_payload,
+)
+from openslides_backend.shared.exceptions import ViewException
+
+
+def get_reader(
+    body: Any, read_size: int = 1, max_size: int = 10000
+) -> JSONStreamReader:
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return JSONStreamReader(BytesIO(data), max_size, read_size)
+
+
+def parse(body: Any, max_elements: int = 100, **kwargs: Any) -> List[Any]:
+    return [
+        {"action": action["action"], "data": list(action["data"])}
+        for action in iter_action_payload(get_reader(body, **kwargs), max_elements)
+    ]
+
+
+class JSONStreamReaderTester(TestCase):
+    def test_read_values(self) -> None:
+        values = [1.5e-3, -12, "ä€𝄞", {"a": [True, None]}, 1234567890]
+        reader = get_reader(values)
+        result = []
+        for _ in reader.read_items():
+            result.append(reader.read_value())
+        reader.expect_end()
+        self.assertEqual(result, values)
+
+    def test_read_members(self) -> None:
+        reader = get_reader({"a": 1, "b": [2]}, read_size=3)
+        result = {}
+        for name in reader.read_members():
+            result[name] = reader.read_value()
+        self.assertEqual(result, {"a": 1, "b": [2]})
+
+    def test_buffer_is_dropped(self) -> None:
+        reader = get_reader(list(range(1000)), read_size=16)
+        for _ in reader.read_items():
+            reader.read_value()
+            self.assertLess(len(reader.buffer), 64)
+
+    def test_invalid_json(self) -> None:
+        reader = get_reader(b"[1, 2", read_size=2)
+        with self.assertRaises(ViewException) as context:
+            for _ in reader.read_items():
+                reader.read_value()
+        self.assertIn("Failed to decode JSON object", context.exception.message)
+
+    def test_max_size(self) -> None:
+        reader = get_reader(list(range(100)), max_size=50)
+        with self.assertRaises(ViewException) as context:
+            for _ in reader.read_items():
+                reader.read_value()
+        self.assertEqual(context.exception.status_code, 413)
+
+
+class IterActionPayloadTester(TestCase):
+    def test_payload(self) -> None:
+        payload = [
+            {"action": "a.create", "data": [{"x": 1}, {"x": 2}]},
+            {"data": [{"y": 1}], "action": "b.create"},
+        ]
+        self.assertEqual(parse(payload), payload)
+
+    def test_data_is_iterator(self) -> None:
+        reader = get_reader([{"action": "a", "data": [{"x": 1}, {"x": 2}]}])
+        action = next(iter_action_payload(reader, 100))
+        self.assertNotIsInstance(action["data"], list)
+        self.assertEqual(next(action["data"]), {"x": 1})
+
+    def test_unconsumed_data_is_skipped(self) -> None:
+        payload = [
+            {"action": "a", "data": [{"x": 1}, {"x": 2}]},
+            {"action": "b", "data": [{"y": 1}]},
+        ]
+        actions = iter_action_payload(get_reader(payload), 100)
+        next(actions)
+        self.assertEqual(list(next(actions)["data"]), [{"y": 1}])
+
+    def test_max_elements(self) -> None:
+        payload = [{"action": "a", "data": [{"x": 1}, {"x": 2}, {"x": 3}]}]
+        with self.assertRaises(ViewException) as context:
+            parse(payload, max_elements=2)
+        self.assertEqual(context.exception.status_code, 413)
+
+    def assert_invalid(self, body: Any, message: str) -> None:
+        with self.assertRaises(ViewException) as context:
+            parse(body)
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.message, message)
+
+    def test_duplicate_actions(self) -> None:
+        action = {"action": "a", "data": [{"x": 1}]}
+        self.assert_invalid([action, action], "data must contain unique items")
+
+    def test_duplicate_actions_data_first(self) -> None:
+        action = {"data": [{"x": 1}], "action": "a"}
+        self.assert_invalid([action, action], "data must contain unique items")
+
+    def test_different_actions(self) -> None:
+        payload = [
+            {"action": "a", "data": [{"x": 1}]},
+            {"action": "b", "data": [{"x": 1}]},
+            {"action": "a", "data": [{"x": 1}, {"x": 2}]},
+        ]
+        self.assertEqual(parse(payload), payload)
+
+    def test_duplicate_elements(self) -> None:
+        self.assert_invalid(
+            [{"action": "a", "data": [{"x": 1}, {"x": 2}, {"x": 1}]}],
+            "data[0].data must contain unique items",
+        )
+
+    def test_no_array(self) -> None:
+        self.assert_invalid({"action": "a"}, "data must be array")
+
+    def test_no_actions(self) -> None:
+        self.assert_invalid([], "data must contain at least 1 items")
+
+    def test_missing_properties(self) -> None:
+        self.assert_invalid(
+            [{"action": "a", "x": 1}],
+            "data[0] must contain ['action', 'data'] properties",
+        )
+
+    def test_additional_properties(self) -> None:
+        self.assert_invalid(
+            [{"action": "a", "data": [{}], "x": 1}],
+            "data[0] must not contain {'x'} properties",
+        )
+
+    def test_empty_action_name(self) -> None:
+        self.assert_invalid(
+            [{"action": "", "data": [{}]}],
+            "data[0].action must be longer than or equal to 1 characters",
+        )
+
+    def test_empty_data(self) -> None:
+        self.assert_invalid(
+            [{"action": "a", "data": []}], "data[0].data must contain at least 1 items"
+        )
+
+    def test_data_no_object(self) -> None:
+        self.assert_invalid(
+            [{"action": "a", "data": [{}, 1]}], "data[0].data[1] must be object"
+        )
+
+    def test_extra_data(self) -> None:
+        with self.assertRaises(ViewException):
+            parse(b'[{"action": "a", "data": [{}]}] []')
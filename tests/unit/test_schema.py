@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastjsonschema import JsonSchemaException
+
+from openslides_backend.action.action import ActionHandler  # noqa
+from openslides_backend.action.actions_manifest import ACTIONS_MANIFEST
+from openslides_backend.action.actions_map import actions_map
+from openslides_backend.shared.schema import without_defaults
+from openslides_backend.shared.schema_validator import (
+    SCHEMA_CACHE_VARIABLE,
+    LazySchemaValidator,
+    get_cache_path,
+    write_cached_validator,
+)
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+test_schema = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}},
+    "required": ["id"],
+}
+
+
+class SchemaTester(TestCase):
+    def test_without_defaults(self) -> None:
+        schema = {
+            "type": "object",
+            "properties": {
+                "default": {"type": "string", "default": "x"},
+                "list": {"type": "array", "default": [], "items": {"default": 1}},
+            },
+            "default": {},
+        }
+        self.assertEqual(
+            without_defaults(schema),
+            {
+                "type": "object",
+                "properties": {
+                    "default": {"type": "string"},
+                    "list": {"type": "array", "items": {}},
+                },
+            },
+        )
+        # The given schema must not be changed.
+        self.assertEqual(schema["default"], {})
+
+    def test_action_validation_does_not_change_payload(self) -> None:
+        action = actions_map["motion_state.create"]
+        payload = [{"name": "test_name_Ohsh3Ahm7u", "workflow_id": 42}]
+        action.schema_validator(payload)
+        self.assertEqual(payload, [{"name": "test_name_Ohsh3Ahm7u", "workflow_id": 42}])
+
+    def test_lazy_validator(self) -> None:
+        validator = LazySchemaValidator(test_schema)
+        self.assertFalse(validator.is_compiled())
+        validator({"id": 1})
+        self.assertTrue(validator.is_compiled())
+        with self.assertRaises(JsonSchemaException):
+            validator({"id": "1"})
+
+    def test_schema_cache(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = write_cached_validator(directory, test_schema)
+            self.assertTrue(os.path.isfile(path))
+            with patch.dict(os.environ, {SCHEMA_CACHE_VARIABLE: directory}):
+                validator = LazySchemaValidator(test_schema)
+                validator({"id": 1})
+                with self.assertRaises(JsonSchemaException):
+                    validator({})
+            assert validator.validator is not None
+            self.assertEqual(validator.validator.__code__.co_filename, path)
+
+    def test_build_schema_cache(self) -> None:
+        with TemporaryDirectory() as directory:
+            subprocess.check_call(
+                [
+                    sys.executable,
+                    os.path.join(ROOT, "cli", "build_schema_cache.py"),
+                    directory,
+                ],
+                env={**os.environ, "PYTHONPATH": ROOT},
+                stdout=subprocess.DEVNULL,
+            )
+            files = {
+                os.path.join(directory, name)
+                for name in os.listdir(directory)
+                if name.endswith(".py")
+            }
+            # Only the actions of the package count, tests may register more.
+            # Dummy actions without schema are skipped.
+            action_paths = set()
+            for name in ACTIONS_MANIFEST:
+                validator = getattr(actions_map[name], "schema_validator", None)
+                if validator is not None:
+                    assert isinstance(validator, LazySchemaValidator)
+                    action_paths.add(
+                        get_cache_path(directory, validator.get_definition())
+                    )
+            self.assertGreater(len(action_paths), len(ACTIONS_MANIFEST) // 2)
+            self.assertTrue(action_paths <= files)
@@ -0,0 +1,103 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import simplejson as json
+from werkzeug.test import Client
+from werkzeug.wrappers import BaseResponse
+
+from openslides_backend.http import serialization
+from openslides_backend.http.application import OpenSlidesBackendWSGIApplication
+
+
+class SerializationTester(TestCase):
+    def test_encode(self) -> None:
+        self.assertEqual(serialization.encode({"a": [1, "b"]}), b'{"a":[1,"b"]}')
+
+    def test_iter_encode_chunks(self) -> None:
+        body = [{"id": id} for id in range(100)]
+        chunks = list(serialization.iter_encode(body, chunk_size=100, batch_size=5))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) >= 100 for chunk in chunks[:-1]))
+        self.assertEqual(json.loads(b"".join(chunks)), body)
+
+    def test_iter_encode_no_list(self) -> None:
+        self.assertEqual(list(serialization.iter_encode({"a": 1})), [b'{"a":1}'])
+
+    def test_iter_encode_empty_list(self) -> None:
+        self.assertEqual(list(serialization.iter_encode([])), [b"[]"])
+
+    def test_iter_encode_repeated_elements(self) -> None:
+        result = {"success": True, "message": "Action handled successfully"}
+        with patch.object(
+            serialization, "encode", wraps=serialization.encode
+        ) as encode:
+            chunks = list(serialization.iter_encode([result] * 10))
+        self.assertEqual(encode.call_count, 1)
+        self.assertEqual(json.loads(b"".join(chunks)), [result] * 10)
+
+    def test_iter_encode_batches(self) -> None:
+        body = [{"id": id} for id in range(10)]
+        chunks = list(serialization.iter_encode(body, chunk_size=1, batch_size=4))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(json.loads(b"".join(chunks)), body)
+
+    def test_get_response_body_small(self) -> None:
+        self.assertEqual(serialization.get_response_body([1, 2], MagicMock()), b"[1,2]")
+
+    def test_get_response_body_large(self) -> None:
+        body = [str(i) * 100 for i in range(10)]
+        response_body = serialization.get_response_body(
+            body, MagicMock(), chunk_size=300
+        )
+        assert not isinstance(response_body, bytes)
+        self.assertEqual(json.loads(b"".join(response_body)), body)
+
+    def test_get_response_body_error_first_chunks(self) -> None:
+        body = ["x" * 100, object()]
+        with self.assertRaises(TypeError):
+            serialization.get_response_body(body, MagicMock(), chunk_size=50)
+
+    def test_get_response_body_error_later_chunk(self) -> None:
+        body = [*("x" * 100 for _ in range(600)), object()]
+        logger = MagicMock()
+        response_body = serialization.get_response_body(body, logger, chunk_size=50)
+        assert not isinstance(response_body, bytes)
+        with self.assertRaises(TypeError):
+            list(response_body)
+        logger.error.assert_called_once()
+        self.assertEqual(logger.error.call_args[0][1], 2 * 256 * 103)
+
+
+class ApplicationSerializationTester(TestCase):
+    def setUp(self) -> None:
+        self.view = MagicMock()
+        self.view.method = "POST"
+        application = OpenSlidesBackendWSGIApplication(
+            MagicMock(), self.view, MagicMock()
+        )
+        self.client = Client(application, BaseResponse)
+
+    def test_streamed_response(self) -> None:
+        body = [{"data": "x" * 1000} for _ in range(200)]
+        self.view.return_value.dispatch.return_value = (body, None)
+        response = self.client.post("/", json=[])
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.headers.get("Content-Length"))
+        self.assertEqual(json.loads(response.data), body)
+
+    def test_small_response(self) -> None:
+        self.view.return_value.dispatch.return_value = ([{"success": True}], None)
+        response = self.client.post("/", json=[])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("Content-Length"), "18")
+        self.assertEqual(json.loads(response.data), [{"success": True}])
+
+    def test_health_info_cached(self) -> None:
+        self.view.return_value.get_health_info.return_value = {"status": "ok"}
+        environ = {"RAW_URI": "/health"}
+        for _ in range(2):
+            response = self.client.get("/health", environ_overrides=environ)
+            self.assertEqual(
+                json.loads(response.data), {"healthinfo": {"status": "ok"}}
+            )
+        self.view.return_value.get_health_info.assert_called_once()
@@ -0,0 +1,89 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.agenda_item.sort import AgendaItemSort
+from openslides_backend.action.base import DataSet
+from openslides_backend.action.speaker.sort import SpeakerSort
+
+
+class TreeSortTester(TestCase):
+    def setUp(self) -> None:
+        self.database = MagicMock()
+        self.action = AgendaItemSort(MagicMock(), self.database)
+        self.action.user_id = 1
+
+    def sort_tree(self, tree: list) -> DataSet:
+        return self.action.sort_tree(
+            nodes=tree,
+            meeting_id=1,
+            weight_key="weight",
+            parent_id_key="parent_id",
+            children_ids_key="child_ids",
+        )
+
+    def test_only_changed_fields(self) -> None:
+        self.database.filter.return_value = {
+            1: {"id": 1, "weight": 2, "parent_id": None, "child_ids": [2]},
+            2: {"id": 2, "weight": 4, "parent_id": 1, "child_ids": []},
+            3: {"id": 3, "weight": 6, "parent_id": None, "child_ids": []},
+        }
+        dataset = self.sort_tree([{"id": 1}, {"id": 3, "children": [{"id": 2}]}])
+        self.assertEqual(
+            dataset["data"],
+            {
+                1: {"child_ids": []},
+                3: {"weight": 4, "child_ids": [2]},
+                2: {"weight": 6, "parent_id": 3},
+            },
+        )
+        self.assertEqual(
+            self.database.filter.call_args[1]["mapped_fields"],
+            ["id", "weight", "parent_id", "child_ids"],
+        )
+
+    def test_no_changes(self) -> None:
+        self.database.filter.return_value = {
+            1: {"id": 1, "weight": 2, "parent_id": None, "child_ids": [2]},
+            2: {"id": 2, "weight": 4, "parent_id": 1, "child_ids": []},
+        }
+        dataset = self.sort_tree([{"id": 1, "children": [{"id": 2}]}])
+        self.assertEqual(dataset["data"], {})
+        self.assertEqual(list(self.action.create_write_request_elements(dataset)), [])
+
+    def test_payload_not_changed(self) -> None:
+        self.database.filter.return_value = {
+            1: {"id": 1},
+            2: {"id": 2},
+        }
+        tree = [{"id": 1, "children": [{"id": 2}]}]
+        self.sort_tree(tree)
+        self.assertEqual(tree, [{"id": 1, "children": [{"id": 2}]}])
+
+
+class LinearSortTester(TestCase):
+    def setUp(self) -> None:
+        self.database = MagicMock()
+        self.action = SpeakerSort(MagicMock(), self.database)
+        self.action.user_id = 1
+
+    def test_only_changed_weights(self) -> None:
+        self.database.filter.return_value = {
+            1: {"id": 1, "weight": 1},
+            2: {"id": 2, "weight": 2},
+            3: {"id": 3, "weight": 3},
+            4: {"id": 4, "weight": 4},
+        }
+        dataset = self.action.sort_linear([1, 3, 2, 4], 1, "list_of_speakers_id")
+        self.assertEqual(dataset["data"], {3: {"weight": 2}, 2: {"weight": 3}})
+        self.assertEqual(
+            self.database.filter.call_args[1]["mapped_fields"], ["id", "weight"]
+        )
+
+    def test_no_changes(self) -> None:
+        self.database.filter.return_value = {
+            1: {"id": 1, "weight": 1},
+            2: {"id": 2, "weight": 2},
+        }
+        dataset = self.action.sort_linear([1, 2], 1, "list_of_speakers_id")
+        self.assertEqual(dataset["data"], {})
+        self.assertEqual(list(self.action.create_write_request_elements(dataset)), [])
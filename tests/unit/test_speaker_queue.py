@@ -0,0 +1,97 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.speaker.speak import SpeakerSpeak
+from openslides_backend.action.speaker.speaker_queue import SpeakerQueue
+from openslides_backend.shared.exceptions import ActionException
+from openslides_backend.shared.patterns import Collection
+
+
+class SpeakerQueueTester(TestCase):
+    def setUp(self) -> None:
+        self.queue = SpeakerQueue(
+            {"closed": False},
+            {
+                1: {"begin_time": 100, "end_time": 200, "user_id": 1},
+                2: {"begin_time": 300, "end_time": 400, "user_id": 2},
+                3: {"begin_time": 500, "user_id": 3},
+                4: {"weight": 2, "user_id": 4},
+                5: {"weight": 1, "user_id": 5},
+                6: {"weight": 1, "user_id": 6},
+            },
+        )
+
+    def test_load(self) -> None:
+        self.assertEqual(self.queue.current_id, 3)
+        self.assertEqual(self.queue.next, {"weight": 1, "user_id": 5})
+        self.assertEqual(self.queue.last_finished_id, 2)
+        self.assertEqual(list(self.queue.waiting), [5, 6, 4])
+        self.assertFalse(self.queue.closed)
+
+    def test_start(self) -> None:
+        changes = self.queue.start(5, 600)
+        self.assertEqual(changes, {3: {"end_time": 600}, 5: {"begin_time": 600}})
+        self.assertEqual(self.queue.current_id, 5)
+        self.assertEqual(self.queue.last_finished_id, 3)
+        self.assertEqual(list(self.queue.waiting), [6, 4])
+
+    def test_start_out_of_order(self) -> None:
+        self.queue.start(4, 600)
+        self.assertEqual(list(self.queue.waiting), [5, 6])
+
+    def test_start_started(self) -> None:
+        with self.assertRaises(ActionException):
+            self.queue.start(3, 600)
+
+    def test_start_finished(self) -> None:
+        queue = SpeakerQueue({}, {1: {"end_time": 200}})
+        with self.assertRaises(ActionException):
+            queue.start(1, 600)
+
+    def test_start_unknown(self) -> None:
+        with self.assertRaises(ActionException) as context:
+            self.queue.start(7, 600)
+        self.assertEqual(
+            context.exception.message, "Speaker 7 is not in the list of speakers."
+        )
+        self.assertEqual(self.queue.current_id, 3)
+
+    def test_end(self) -> None:
+        self.assertEqual(self.queue.end(600), {3: {"end_time": 600}})
+        self.assertIsNone(self.queue.current)
+        self.assertEqual(self.queue.last_finished_id, 3)
+        with self.assertRaises(ActionException):
+            self.queue.end(700)
+
+    def test_last_finished_without_begin_time(self) -> None:
+        queue = SpeakerQueue(
+            {},
+            {
+                1: {"end_time": 200, "user_id": 1},
+                2: {"end_time": 400, "user_id": 2},
+                3: {"user_id": 3},
+            },
+        )
+        self.assertEqual(queue.last_finished, {"end_time": 400, "user_id": 2})
+
+    def test_empty(self) -> None:
+        queue = SpeakerQueue({}, {})
+        self.assertIsNone(queue.current)
+        self.assertIsNone(queue.next)
+        self.assertIsNone(queue.last_finished)
+
+
+class SpeakerQueueMixinTester(TestCase):
+    def test_load_speaker_queues(self) -> None:
+        database = MagicMock()
+        database.get_many.side_effect = [
+            {Collection("list_of_speakers"): {1: {"speaker_ids": [2, 3]}}},
+            {Collection("speaker"): {2: {"begin_time": 100}, 3: {}}},
+        ]
+        action = SpeakerSpeak(MagicMock(), database)
+        queues = action.load_speaker_queues([1], ["begin_time", "end_time"])
+        self.assertEqual(database.get_many.call_count, 2)
+        speaker_request = database.get_many.call_args_list[1][0][0][0]
+        self.assertEqual(set(speaker_request.mapped_fields), {"begin_time", "end_time"})
+        self.assertEqual(queues[1].current_id, 2)
+        self.assertEqual(queues[1].next, {})